@@ -0,0 +1,111 @@
+# benchmarks/generate_data.py
+"""
+Erzeugt synthetische Messdaten im Exportformat der Prüfmaschine.
+
+Aufbau wie bei echten Messungen:
+    <root>/<Messreihe>/<Messung>/<Messung>.steps.tracking.csv
+mit Semikolon als Trennzeichen, Dezimalkomma, Weg in Spalte 7 und Kraft in Spalte 8.
+
+Aufruf:
+    python -m benchmarks.generate_data <Zielordner> --series 3 --measurements 10 --rows 20000
+"""
+import argparse
+from pathlib import Path
+import numpy as np
+
+HEADER = "Zeit [s];Schritt;Zyklus;Temperatur [C];Status;Kanal A;Kanal B;Weg [mm];Kraft [kN];Dehnung [%]\n"
+
+
+def synthetic_curve(rows: int, rng: np.random.Generator):
+    """
+    Erzeugt eine realistische Auszugskurve (Weg in mm, Kraft in kN).
+
+    Linearer Anstieg bis zur Maximalkraft, danach abklingende Reibkraft mit
+    Stick-Slip-Anteil, überlagert von Messrauschen und einem Nullpunktversatz.
+    """
+    displacement = np.linspace(0.0, rng.uniform(6.0, 12.0), rows)
+    displacement += rng.normal(0.0, 0.0005, rows) + rng.uniform(0.1, 0.5)
+    relative = displacement - displacement[0]
+
+    peak_force = rng.uniform(0.4, 2.0)
+    peak_position = rng.uniform(0.3, 1.2)
+    rising = peak_force * relative / peak_position
+    friction = peak_force * (0.3 + 0.7 * np.exp(-(relative - peak_position) * rng.uniform(0.5, 2.0)))
+    friction *= 1.0 + 0.05 * np.sin(relative * rng.uniform(20.0, 60.0))
+    force = np.where(relative < peak_position, rising, friction)
+    force += rng.normal(0.0, 0.005, rows) + rng.uniform(0.0, 0.05)
+    return displacement, force
+
+
+def _decimal_comma(values: np.ndarray, digits: int) -> np.ndarray:
+    """Formatiert Zahlen mit fester Nachkommastellenzahl und Dezimalkomma"""
+    return np.char.replace(np.char.mod(f"%.{digits}f", values), ".", ",")
+
+
+def write_tracking_csv(path: Path, displacement: np.ndarray, force: np.ndarray) -> None:
+    """
+    Schreibt eine .steps.tracking.csv mit zehn Spalten.
+
+    Args:
+        path: Zielpfad
+        displacement: Wegwerte in mm (Spalte 7)
+        force: Kraftwerte in kN (Spalte 8)
+    """
+    rows = displacement.shape[0]
+    time = _decimal_comma(np.arange(rows) * 0.01, 2)
+    step = np.arange(rows).astype(str)
+    temperature = _decimal_comma(np.full(rows, 21.5), 1)
+    strain = _decimal_comma(displacement * 0.5, 3)
+    columns = [time, step, np.full(rows, "1"), temperature, np.full(rows, "OK"),
+               np.full(rows, "0"), np.full(rows, "0"),
+               _decimal_comma(displacement, 4), _decimal_comma(force, 4), strain]
+
+    lines = columns[0]
+    for column in columns[1:]:
+        lines = np.char.add(np.char.add(lines, ";"), column)
+    with open(path, "w", encoding="utf-8", newline="\n") as file:
+        file.write(HEADER)
+        file.write("\n".join(lines.tolist()))
+        file.write("\n")
+
+
+def generate_tree(root: Path, series: int, measurements: int, rows: int, seed: int = 0) -> Path:
+    """
+    Erzeugt einen Zusammenfassungsordner mit mehreren Messreihen.
+
+    Args:
+        root: Zielordner (wird angelegt)
+        series: Anzahl der Messreihen
+        measurements: Anzahl der Messungen je Messreihe
+        rows: Anzahl der Datenzeilen je Messung
+        seed: Startwert des Zufallsgenerators
+
+    Returns:
+        Pfad des Zusammenfassungsordners
+    """
+    rng = np.random.default_rng(seed)
+    root = Path(root)
+    for series_index in range(series):
+        series_name = f"Reihe_{series_index + 1:02d}"
+        for measurement_index in range(measurements):
+            name = f"{series_name}_{measurement_index + 1:02d}"
+            folder = root / series_name / name
+            folder.mkdir(parents=True, exist_ok=True)
+            write_tracking_csv(folder / f"{name}.steps.tracking.csv", *synthetic_curve(rows, rng))
+    return root
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetische Yarn Pull-Out Messdaten erzeugen")
+    parser.add_argument("root", type=Path, help="Zielordner (Zusammenfassungsordner)")
+    parser.add_argument("--series", type=int, default=3, help="Anzahl Messreihen")
+    parser.add_argument("--measurements", type=int, default=10, help="Messungen je Messreihe")
+    parser.add_argument("--rows", type=int, default=20000, help="Datenzeilen je Messung")
+    parser.add_argument("--seed", type=int, default=0, help="Startwert des Zufallsgenerators")
+    args = parser.parse_args()
+    generate_tree(args.root, args.series, args.measurements, args.rows, args.seed)
+    print(f"Messdaten erzeugt in: {args.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# benchmarks/run_benchmarks.py
+"""
+Laufzeitmessung der Analysepipeline auf synthetischen Messdaten.
+
+Gemessen werden die einzelnen Schritte (load_data, calculate_force_modulus,
+calculate_work, calculate_statistics, create_plot, save_to_excel) sowie die
+komplette Mehrfachanalyse in mehreren Größenordnungen. Das Ergebnis wird als
+JSON ausgegeben, damit Läufe verschiedener Versionen verglichen werden können.
+
+Aufruf aus dem Projektordner:
+    python -m benchmarks.run_benchmarks --scales small medium --repeat 3 --output bench.json
+"""
+import argparse
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from benchmarks.generate_data import generate_tree
+from main import process_multiple_analysis
+from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
+from src.core.data_plotter import YarnPulloutPlotter
+from src.core.debug_printer import DebugPrinter
+from src.core.excel_exporter import ExcelExporter
+from src.core.series_processor import find_measurement_files
+
+# Größenordnungen: (Messreihen, Messungen je Messreihe, Zeilen je Messung)
+SCALES = {
+    "small": (2, 5, 5_000),
+    "medium": (3, 10, 20_000),
+    "large": (5, 20, 100_000),
+}
+
+STAGES = ("load_data", "calculate_force_modulus", "calculate_work",
+          "calculate_statistics", "create_plot", "save_to_excel")
+
+
+def _summary(samples: List[float]) -> Dict:
+    """Kennzahlen einer Messreihe von Laufzeiten in Sekunden"""
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+        "runs": samples,
+    }
+
+
+def _timed(timings: Dict[str, float], stage: str, function: Callable, *args):
+    """Führt function aus und addiert die Laufzeit zum Schritt stage"""
+    start = time.perf_counter()
+    result = function(*args)
+    timings[stage] += time.perf_counter() - start
+    return result
+
+
+def run_stages(root: Path, output_dir: Path, config: YarnPulloutConfig,
+               plotter: YarnPulloutPlotter) -> Dict[str, float]:
+    """
+    Misst alle Schritte einzeln für alle Messreihen eines Zusammenfassungsordners.
+
+    Returns:
+        Summierte Laufzeit je Schritt in Sekunden
+    """
+    timings = {stage: 0.0 for stage in STAGES}
+    exporter = ExcelExporter()
+    series_folders = [f for f in root.iterdir() if f.is_dir() and f.name not in ("plots", "plots_gesamt")]
+    for folder in sorted(series_folders):
+        analyzer = YarnPulloutAnalyzer(config)
+        for csv_path in find_measurement_files(folder, config.data_ending):
+            if not csv_path.exists():  # z.B. Plot-Ordner der Mehrfachanalyse
+                continue
+            _timed(timings, "load_data", analyzer.load_data, csv_path)
+        _timed(timings, "calculate_force_modulus", analyzer.calculate_force_modulus)
+        _timed(timings, "calculate_work", analyzer.calculate_work)
+        _timed(timings, "calculate_statistics", analyzer.calculate_statistics)
+        exporter.add_measurement_series(folder.name, analyzer.get_statistics())
+
+        start = time.perf_counter()
+        figure = plotter.create_plot(analyzer, folder.name)
+        figure.savefig(output_dir / f"{folder.name}_analysis.png", dpi=300, bbox_inches='tight')
+        plt.close(figure)
+        timings["create_plot"] += time.perf_counter() - start
+
+    _timed(timings, "save_to_excel", exporter.save_to_excel, output_dir / "stages.xlsx")
+    return timings
+
+
+def run_end_to_end(root: Path, output_dir: Path, config: YarnPulloutConfig,
+                   plotter: YarnPulloutPlotter) -> float:
+    """Misst die komplette Mehrfachanalyse (wie im Batch-Betrieb) in Sekunden"""
+    start = time.perf_counter()
+    process_multiple_analysis(root, config, plotter, ExcelExporter(), DebugPrinter(),
+                              output_path=output_dir / "end_to_end.xlsx")
+    return time.perf_counter() - start
+
+
+def benchmark_scale(name: str, series: int, measurements: int, rows: int,
+                    repeat: int, work_dir: Path) -> Dict:
+    """Erzeugt die Daten einer Größenordnung und misst alle Schritte repeat-mal"""
+    root = work_dir / name
+    start = time.perf_counter()
+    generate_tree(root, series, measurements, rows)
+    generation_time = time.perf_counter() - start
+
+    config = YarnPulloutConfig()
+    plotter = YarnPulloutPlotter()
+    output_dir = work_dir / f"{name}_output"
+    output_dir.mkdir(exist_ok=True)
+
+    stage_samples = {stage: [] for stage in STAGES}
+    end_to_end_samples = []
+    for _ in range(repeat):
+        for stage, seconds in run_stages(root, output_dir, config, plotter).items():
+            stage_samples[stage].append(seconds)
+        end_to_end_samples.append(run_end_to_end(root, output_dir, config, plotter))
+
+    data_bytes = sum(path.stat().st_size for path in root.rglob(f"*{config.data_ending}"))
+    return {
+        "series": series,
+        "measurements_per_series": measurements,
+        "rows_per_measurement": rows,
+        "total_rows": series * measurements * rows,
+        "data_bytes": data_bytes,
+        "generation_seconds": generation_time,
+        "stages": {stage: _summary(samples) for stage, samples in stage_samples.items()},
+        "end_to_end": _summary(end_to_end_samples),
+    }
+
+
+def _git_revision() -> str:
+    """Aktueller Commit des Projekts (leer, falls nicht ermittelbar)"""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Yarn Pull-Out Analyse")
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small", "medium"],
+                        help="Zu messende Größenordnungen")
+    parser.add_argument("--repeat", type=int, default=3, help="Wiederholungen je Größenordnung")
+    parser.add_argument("--output", "-o", type=Path, help="JSON-Ausgabedatei (Standard: stdout)")
+    parser.add_argument("--work-dir", type=Path, help="Arbeitsordner für Messdaten (Standard: temporär)")
+    parser.add_argument("--verbose", action="store_true", help="Fortschrittsmeldungen der Analyse anzeigen")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "scales": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="yarn_bench_") as temp_dir:
+        work_dir = args.work_dir or Path(temp_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        for name in args.scales:
+            print(f"Benchmark '{name}' {SCALES[name]} ...", file=sys.stderr)
+            report["scales"][name] = benchmark_scale(name, *SCALES[name], args.repeat, work_dir)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+        print(f"Ergebnis gespeichert: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
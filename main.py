@@ -1,72 +1,148 @@
 # src/main.py
+# tkinter, matplotlib und pandas werden erst importiert, wenn ein Programmpfad sie braucht
+from __future__ import annotations
+import argparse
+from dataclasses import asdict
+import os
+import sys
+import time
 from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
-from src.core.data_plotter import YarnPulloutPlotter
 from src.core.excel_exporter import ExcelExporter
-from src.core.file_handler import FileHandler
 from src.core.debug_printer import DebugPrinter
+from src.core.instrumentation import get_instrumentation, enable_instrumentation
+from src.core.measurement_cache import MeasurementCache
+from src.core.series_processor import (process_measurement_series, analyse_series, analyse_series_parallel,
+                                       SeriesResult, IGNORED_FOLDERS)
+from src.core.plot_renderer import render_plot_jobs
+from src.core.run_manifest import RunManifest
+from src.core.detail_table import DetailTableWriter, load_detail_table, select_series
+from src.core.folder_watcher import FolderWatcher
+from src.core.streaming_analyzer import TrackingFileTail
+from src.core.tracking_reader import TrackingFormatError
+from src.core.measurement_archive import build_archive, DEFAULT_ARCHIVE_NAME
+from src.core.bootstrap import BootstrapSettings
+from src.core.async_pipeline import PipelineSettings, run_pipeline
+from src.core.parameter_sweep import SweepGrid, run_sweep, write_sweep_table, default_sweep_filename
 from pathlib import Path
-import matplotlib.pyplot as plt
-from typing import Optional
-import shutil # Hinzugefügt für das Kopieren von Dateien
+from typing import List, Optional, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from src.core.data_plotter import YarnPulloutPlotter
 
-def process_measurement_series(folder_path: Path, analyzer: YarnPulloutAnalyzer, debug_printer: DebugPrinter) -> None:
-    """Verarbeitet eine einzelne Messreihe."""
-    measurement_folders = [f for f in folder_path.iterdir() if f.is_dir()]
-    debug_printer.print_progress(f"Gefundene Messordner: {[f.name for f in measurement_folders]}")
 
-    for meas_folder in measurement_folders:
-        base_name = meas_folder.name
-        csv_files = list(meas_folder.glob(f"{base_name}.steps.tracking.csv"))
-        debug_printer.print_progress(f"Suche in {meas_folder.name} nach {base_name}.steps.tracking.csv")
-        debug_printer.print_progress(f"Gefundene CSVs: {[f.name for f in csv_files]}")
+def write_run_report(report_path: Optional[Path], default_folder: Path, output_path: Optional[Path],
+                     debug_printer: DebugPrinter, **info) -> Optional[Path]:
+    """
+    Schreibt den JSON-Laufbericht, sofern die Instrumentierung aktiv ist.
+
+    Ohne report_path landet der Bericht neben der Excel-Datei bzw. im Eingabeordner.
+    """
+    instrumentation = get_instrumentation()
+    if not instrumentation.enabled:
+        return None
+    if report_path is None:
+        report_path = (output_path.with_name(f"{output_path.stem}_report.json") if output_path
+                       else default_folder / "yarn_pullout_report.json")
+    try:
+        instrumentation.write_report(report_path, **info)
+        debug_printer.print_progress(f"Laufbericht gespeichert: {report_path}")
+        return report_path
+    except OSError as e:
+        debug_printer.print_progress(f"Laufbericht konnte nicht gespeichert werden: {str(e)}")
+        return None
 
-        if csv_files:
-            try:
-                debug_printer.print_progress(f"Verarbeite: {csv_files[0].name}")
-                analyzer.load_data(csv_files[0])
-            except Exception as e:
-                debug_printer.print_progress(f"Fehler beim Laden von {csv_files[0]}: {str(e)}")
+
+def print_campaign_statistics(exporter: ExcelExporter, debug_printer: DebugPrinter) -> None:
+    """Gibt die über alle Messreihen zusammengeführten Kennwerte aus"""
+    campaign = exporter.campaign
+    if campaign.max_force.count == 0:
+        return
+    summary = campaign.summary()
+    debug_printer.print_progress(
+        f"Gesamt über {campaign.max_force.count} Messungen: "
+        f"F_max {summary['max_force']['mean']} ± {summary['max_force']['std']} kN, "
+        f"Arbeit {summary['work']['mean']} ± {summary['work']['std']} Nm, "
+        f"Modul {summary['modulus']['mean']} ± {summary['modulus']['std']}")
 
 
 def process_single_analysis(folder_path: Path, config: YarnPulloutConfig,
-                            plotter: YarnPulloutPlotter, exporter: ExcelExporter,
-                            debug_printer: DebugPrinter) -> Optional[bool]:
-    """Führt die Analyse einer einzelnen Messreihe durch."""
+                            plotter: Optional[YarnPulloutPlotter], exporter: ExcelExporter,
+                            debug_printer: DebugPrinter,
+                            cache: Optional[MeasurementCache] = None,
+                            load_workers: int = 1,
+                            output_path: Optional[Path] = None,
+                            report_path: Optional[Path] = None,
+                            details_path: Optional[Path] = None) -> Optional[bool]:
+    """
+    Führt die Analyse einer einzelnen Messreihe durch.
+
+    Ohne plotter wird kein Plot erzeugt, ohne output_path wird nach dem Speicherort gefragt.
+    Mit details_path werden die Kennwerte jeder Einzelmessung als Tabelle gespeichert.
+    Bei aktiver Instrumentierung wird am Ende ein JSON-Laufbericht geschrieben.
+    """
+    result = _run_single_analysis(folder_path, config, plotter, exporter, debug_printer, cache,
+                                  load_workers, output_path, details_path)
+    write_run_report(report_path, folder_path, output_path, debug_printer,
+                     mode="single", input=folder_path, result=result)
+    return result
+
+
+def _run_single_analysis(folder_path: Path, config: YarnPulloutConfig,
+                         plotter: Optional[YarnPulloutPlotter], exporter: ExcelExporter,
+                         debug_printer: DebugPrinter, cache: Optional[MeasurementCache],
+                         load_workers: int, output_path: Optional[Path],
+                         details_path: Optional[Path]) -> Optional[bool]:
+    """Implementierung von process_single_analysis"""
     debug_printer.print_progress(f"Verarbeite Einzelanalyse für: {folder_path}")
 
     analyzer = YarnPulloutAnalyzer(config)
-    process_measurement_series(folder_path, analyzer, debug_printer)
+    with get_instrumentation().series(folder_path.name):
+        process_measurement_series(folder_path, analyzer, debug_printer, cache, load_workers)
 
-    if not analyzer.measurements:
+    if not analyzer.max_forces:
         debug_printer.print_progress("Keine Messungen gefunden")
         return None
 
-    debug_printer.print_progress(f"Anzahl geladener Messungen: {len(analyzer.measurements)}")
+    debug_printer.print_progress(f"Anzahl geladener Messungen: {len(analyzer.max_forces)}")
 
     try:
-        analyzer.calculate_force_modulus()
-        analyzer.calculate_work()
-        analyzer.calculate_statistics()
+        with get_instrumentation().series(folder_path.name):
+            analyzer.calculate_force_modulus()
+            analyzer.calculate_work()
+            analyzer.calculate_statistics()
         stats = analyzer.get_statistics()
         debug_printer.print_progress(f"Berechnete Statistiken: {stats}")
-        exporter.add_measurement_series(folder_path.name, stats)
+        exporter.add_measurement_series(folder_path.name, stats, analyzer.series_statistics,
+                                        analyzer.measurement_samples())
+
+        if details_path is not None:
+            detail_writer = DetailTableWriter(details_path)
+            detail_writer.add_series(folder_path.name, analyzer.get_measurement_details())
+            debug_printer.print_progress(f"Detailtabelle gespeichert: {detail_writer.close()}")
 
         debug_printer.print_progress("Wähle Speicherort für Excel-Datei...")
-        excel_path = exporter.save_to_excel() # Speicherpfad ermitteln, *bevor* Plot-Ordner erstellt wird
+        with get_instrumentation().stage("excel_write"):
+            excel_path = exporter.save_to_excel(output_path) # Speicherpfad ermitteln, *bevor* Plot-Ordner erstellt wird
         excel_saved = False # Flag, um zu merken, ob Excel gespeichert wurde
         if excel_path:
             debug_printer.print_progress(f"Excel-Datei gespeichert: {excel_path}")
             excel_saved = True # Excel wurde erfolgreich gespeichert
 
+            if plotter is None or config.streaming:
+                return excel_saved
 
             try: # Plot-Ordner und Plot erst jetzt erstellen, wenn excel_path bekannt ist
+                import matplotlib.pyplot as plt
+
                 plot_folder_parent = excel_path.parent # Übergeordneter Ordner der Excel-Datei
                 plot_folder = plot_folder_parent / "plots" # Plot-Ordner im selben Ordner wie Excel
                 plot_folder.mkdir(exist_ok=True)
                 plot_path = plot_folder / f"{folder_path.name}_analysis.png"
-                figure = plotter.create_plot(analyzer, folder_path.name)
-                figure.savefig(plot_path, dpi=300, bbox_inches='tight')
+                with get_instrumentation().series(folder_path.name):
+                    with get_instrumentation().stage("plot_render"):
+                        figure = plotter.create_plot(analyzer, folder_path.name)
+                    with get_instrumentation().stage("png_write"):
+                        figure.savefig(plot_path, dpi=300, bbox_inches='tight')
                 plt.close(figure)
                 debug_printer.print_progress(f"Plot gespeichert: {plot_path}")
             except Exception as e:
@@ -84,56 +160,179 @@ def process_single_analysis(folder_path: Path, config: YarnPulloutConfig,
 
 
 def process_multiple_analysis(parent_folder: Path, config: YarnPulloutConfig,
-                              plotter: YarnPulloutPlotter, exporter: ExcelExporter,
-                              debug_printer: DebugPrinter) -> Optional[bool]:
-    """Führt die Analyse mehrerer Messreihen durch."""
+                              plotter: Optional[YarnPulloutPlotter], exporter: ExcelExporter,
+                              debug_printer: DebugPrinter,
+                              cache: Optional[MeasurementCache] = None,
+                              workers: int = 1, load_workers: int = 1,
+                              output_path: Optional[Path] = None,
+                              render_workers: int = 0,
+                              incremental: bool = False,
+                              plot_decimation: Optional[str] = "minmax",
+                              report_path: Optional[Path] = None,
+                              details_path: Optional[Path] = None,
+                              pipeline: Optional[PipelineSettings] = None) -> Optional[bool]:
+    """
+    Führt die Analyse mehrerer Messreihen durch.
+
+    Siehe _run_multiple_analysis; bei aktiver Instrumentierung wird am Ende ein
+    JSON-Laufbericht geschrieben.
+    """
+    result = _run_multiple_analysis(parent_folder, config, plotter, exporter, debug_printer, cache,
+                                    workers, load_workers, output_path, render_workers, incremental,
+                                    plot_decimation, details_path, pipeline)
+    write_run_report(report_path, parent_folder, output_path, debug_printer, mode="multiple",
+                     input=parent_folder, workers=workers, load_workers=load_workers,
+                     render_workers=render_workers, pipeline=asdict(pipeline) if pipeline else None,
+                     result=result)
+    return result
+
+
+def _run_multiple_analysis(parent_folder: Path, config: YarnPulloutConfig,
+                           plotter: Optional[YarnPulloutPlotter], exporter: ExcelExporter,
+                           debug_printer: DebugPrinter, cache: Optional[MeasurementCache],
+                           workers: int, load_workers: int, output_path: Optional[Path],
+                           render_workers: int, incremental: bool,
+                           plot_decimation: Optional[str], details_path: Optional[Path],
+                           pipeline: Optional[PipelineSettings] = None) -> Optional[bool]:
+    """
+    Implementierung der Mehrfachanalyse.
+
+    Mit workers > 1 werden die Messreihen parallel in einem Prozesspool verarbeitet,
+    mit load_workers > 1 die CSV-Dateien jeder Messreihe in einem Thread-Pool gelesen.
+    Mit render_workers > 0 werden die Plots erst nach der Analyse im Batch gerendert
+    (wiederverwendete Figure, eigene Render-Prozesse, Verlinkung nach plots_gesamt);
+    die Kurven werden dabei mit plot_decimation auf die Bildbreite reduziert.
+    Mit incremental=True werden nur Messreihen neu berechnet, deren Eingabedateien oder
+    Konfiguration sich seit dem letzten Lauf geändert haben (siehe RunManifest).
+    Mit details_path werden die Kennwerte aller Einzelmessungen in einer Tabelle
+    (.npz, .parquet oder .feather) gespeichert.
+    Mit pipeline laufen Discovery, Lesen, Analyse, Rendering und Export als
+    überlappende Stufen (siehe run_pipeline); workers und render_workers werden
+    dann durch die Einstellungen der Stufen ersetzt.
+    Ohne plotter werden keine Plots erzeugt, ohne output_path wird nach dem Speicherort gefragt.
+    """
     plot_dir_gesamt = parent_folder / "plots_gesamt" #  Plot-Ordner *gesamt* VOR der Schleife erstellen, damit er bereit ist
-    plot_dir_gesamt.mkdir(exist_ok=True) # Erstelle den Ordner *gesamt* *vor* der Schleife!
-    debug_printer.print_progress(f"Plot-Ordner (gesamt) erstellt: {plot_dir_gesamt}") # Debug-Ausgabe angepasst
-
-
-    series_folders = [f for f in parent_folder.iterdir()
-                      if f.is_dir() and not f.name == "plots" and not f.name == "plots_gesamt"] # "plots_gesamt" ausgeschlossen
-
-    for folder in series_folders:
-        debug_printer.print_progress(f"\nVerarbeite Messreihe: {folder.name}")
-        analyzer = YarnPulloutAnalyzer(config)
-        process_measurement_series(folder, analyzer, debug_printer)
-
-        if analyzer.measurements:
-            try:
-                analyzer.calculate_force_modulus()
-                analyzer.calculate_work()
-                analyzer.calculate_statistics()
-                stats = analyzer.get_statistics()
-                exporter.add_measurement_series(folder.name, stats)
-
-                # Plot-Erstellung *innerhalb* der Schleife (wie gehabt)
-                try:
-                    figure = plotter.create_plot(analyzer, folder.name)
-                    plot_folder_serie = folder / "plots" # Plot-Ordner *pro Messreihe* (wie gehabt)
-                    plot_folder_serie.mkdir(exist_ok=True)
-                    plot_path = plot_folder_serie / f"{folder.name}_analysis.png"
-                    figure.savefig(plot_path, dpi=300, bbox_inches='tight')
-                    plt.close(figure)
-                    debug_printer.print_progress(f"Plot gespeichert für {folder.name}: {plot_path}")
-
-                    # NEU: Plot in den 'plots_gesamt' Ordner KOPIEREN
-                    plot_path_gesamt = plot_dir_gesamt / f"{folder.name}_analysis.png" # Pfad für den 'gesamt' Plot
-                    shutil.copy2(plot_path, plot_path_gesamt) # Kopiere den Plot in den 'gesamt' Ordner (copy2 kopiert auch Metadaten)
-                    debug_printer.print_progress(f"Plot kopiert nach: {plot_path_gesamt}") # Debug-Ausgabe für das Kopieren
-
-                except Exception as e:
-                    debug_printer.print_progress(f"Fehler beim Plotting von {folder.name}: {str(e)}")
-
-            except Exception as e:
-                debug_printer.print_progress(f"Fehler bei der Verarbeitung von {folder.name}: {str(e)}")
-                continue
+    if plotter is not None:  # ohne Plots (--no-plots) keinen leeren Ordner anlegen
+        plot_dir_gesamt.mkdir(exist_ok=True) # Erstelle den Ordner *gesamt* *vor* der Schleife!
+        debug_printer.print_progress(f"Plot-Ordner (gesamt) erstellt: {plot_dir_gesamt}") # Debug-Ausgabe angepasst
+
+
+    with get_instrumentation().stage("folder_discovery"):
+        series_folders = [f for f in parent_folder.iterdir()
+                          if f.is_dir() and f.name not in IGNORED_FOLDERS] # "plots_gesamt" und Archiv ausgeschlossen
+
+    # Fortsetzen eines abgebrochenen Laufs: bereits exportierte Messreihen überspringen
+    completed = set(exporter.completed_series())
+    if completed:
+        debug_printer.print_progress(f"Bereits exportiert (Journal): {len(completed)} Messreihen")
+    active_folders = [f for f in series_folders if f.name not in completed]
+
+    # Inkrementeller Modus: unveränderte Messreihen aus dem Manifest übernehmen
+    manifest = RunManifest.load(parent_folder) if incremental else None
+    config_fingerprint = config.fingerprint()
+    input_fingerprints = {}
+    reused = {}
+    pending_folders = active_folders
+    if manifest is not None:
+        for folder in active_folders:
+            input_fingerprints[folder.name] = RunManifest.fingerprint_inputs(folder, config.data_ending)
+            entry = manifest.lookup(folder.name, input_fingerprints[folder.name], config_fingerprint,
+                                    require_plots=plotter is not None)
+            if entry is not None:
+                reused[folder.name] = SeriesResult(folder.name, stats=entry['stats'],
+                                                   error=entry.get('error'),
+                                                   plot_paths=[Path(p) for p in entry['plot_paths']],
+                                                   statistics=RunManifest.entry_statistics(entry),
+                                                   samples=RunManifest.entry_samples(entry),
+                                                   details=RunManifest.entry_details(entry))
+        pending_folders = [f for f in active_folders if f.name not in reused]
+        debug_printer.print_progress(f"Unveränderte Messreihen: {len(reused)}, "
+                                     f"neu zu berechnen: {len(pending_folders)}")
+
+    # Detailwerte unveränderter Messreihen stammen aus dem Manifest; Manifeste älterer
+    # Läufe enthalten sie nicht, dann aus der Tabelle des letzten Laufs (gleicher Pfad)
+    detail_writer = DetailTableWriter(details_path) if details_path is not None else None
+    previous_details = None
+    if (detail_writer is not None and details_path.exists()
+            and any(result.details is None and result.stats is not None for result in reused.values())):
+        try:
+            previous_details = load_detail_table(details_path)
+        except (OSError, ValueError, KeyError) as e:
+            debug_printer.print_progress(f"Detailtabelle des letzten Laufs nicht lesbar: {str(e)}")
+
+    plot_jobs = []
+
+    def consume(result: SeriesResult) -> None:
+        """Übernimmt das Ergebnis einer Messreihe (in fester Ordnerreihenfolge)"""
+        get_instrumentation().merge_series(result.name, result.metrics)
+        if result.stats is not None:
+            exporter.add_measurement_series(result.name, result.stats, result.statistics, result.samples)
+        if manifest is not None and result.name not in reused:
+            manifest.update(result.name, input_fingerprints[result.name], config_fingerprint,
+                            result.stats, result.plot_paths, result.statistics, result.samples,
+                            result.details, result.error)
+        if detail_writer is not None:
+            details = result.details
+            if details is None and result.name in reused and previous_details is not None:
+                details = select_series(previous_details, result.name)
+                if len(details['measurement']) == 0:
+                    details = None
+            if details is None and result.name in reused and result.stats is not None:
+                debug_printer.print_progress(f"Keine Detailwerte für unveränderte Messreihe {result.name}; "
+                                             f"fehlt in der Detailtabelle (ohne --incremental neu berechnen)")
+            detail_writer.add_series(result.name, details)
+        if result.plot_job is not None:
+            result.plot_job.decimation = plot_decimation
+            plot_jobs.append(result.plot_job)
+
+    if pipeline is not None:
+        debug_printer.print_progress(f"Gestufte Verarbeitung: {pipeline.read_workers} Lese-, "
+                                     f"{pipeline.analysis_workers} Analyse-, {pipeline.render_workers} "
+                                     f"Render-Worker, Warteschlangen {pipeline.queue_size}")
+        run_pipeline(active_folders, config, plotter, debug_printer, plot_dir_gesamt, consume, pipeline,
+                     cache, plot_decimation, reused)
+    else:
+        defer_plots = render_workers > 0 and plotter is not None
+        if workers > 1 and pending_folders:
+            debug_printer.print_progress(f"Parallele Verarbeitung mit {workers} Prozessen")
+            results = analyse_series_parallel(pending_folders, config, plot_dir_gesamt, workers, cache,
+                                              load_workers, make_plots=plotter is not None,
+                                              defer_plots=defer_plots)
+        else:
+            results = (analyse_series(folder, config, plotter, debug_printer, plot_dir_gesamt, cache,
+                                      load_workers, defer_plots)
+                       for folder in pending_folders)
+        if reused:
+            computed = {result.name: result for result in results}
+            results = (reused.get(folder.name) or computed[folder.name] for folder in active_folders)
+
+        # Ergebnisse in fester Ordnerreihenfolge übernehmen
+        for result in results:
+            consume(result)
+
+    if plot_jobs:
+        debug_printer.print_progress(f"Rendere {len(plot_jobs)} Plots mit {render_workers} Prozessen")
+        for name, error in render_plot_jobs(plot_jobs, render_workers):
+            if error:
+                debug_printer.print_progress(f"Fehler beim Plotting von {name}: {error}")
+            else:
+                debug_printer.print_progress(f"Plot gespeichert für {name}")
+
+    if detail_writer is not None:
+        debug_printer.print_progress(f"Detailtabelle gespeichert: {detail_writer.close()}")
+
+    print_campaign_statistics(exporter, debug_printer)
+
+    if manifest is not None:
+        manifest.prune(folder.name for folder in series_folders)
+        manifest.save()
+        debug_printer.print_progress(f"Manifest gespeichert: {manifest.path}")
 
     # Speichern der zusammenfassenden Excel-Datei (wie gehabt)
-    if exporter.results['Messreihe']:
+    if exporter.has_results():
         debug_printer.print_progress("Wähle Speicherort für zusammengefasste Excel-Datei...")
-        excel_path = exporter.save_to_excel()
+        with get_instrumentation().stage("excel_write"):
+            excel_path = exporter.save_to_excel(output_path)
         if excel_path:
             debug_printer.print_progress(f"Excel-Datei mit allen Messreihen gespeichert: {excel_path}")
             return True
@@ -144,12 +343,323 @@ def process_multiple_analysis(parent_folder: Path, config: YarnPulloutConfig,
         return None
 
 
-def main():
+def process_watch(root: Path, config: YarnPulloutConfig, debug_printer: DebugPrinter,
+                  output_path: Path, interval: float = 2.0, settle_seconds: float = 5.0,
+                  details_path: Optional[Path] = None, report_path: Optional[Path] = None,
+                  max_cycles: Optional[int] = None,
+                  bootstrap: Optional[BootstrapSettings] = None) -> Optional[bool]:
+    """
+    Überwacht einen Zusammenfassungsordner und wertet neue Messungen laufend aus.
+
+    Alle interval Sekunden wird der Ordner abgefragt (siehe FolderWatcher). Sobald
+    eine Messung fertig geschrieben ist, wird nur sie analysiert, die Statistik
+    ihrer Messreihe aktualisiert und die Zusammenfassung neu geschrieben. Plots
+    werden im Überwachungsmodus nicht erzeugt. Mit bootstrap enthält die
+    Zusammenfassung Konfidenzintervalle. Beendet wird mit Strg+C oder nach
+    max_cycles Durchläufen.
+    """
+    watcher = FolderWatcher(root, config, settle_seconds)
+    statistics = {}
+    debug_printer.print_progress(f"Überwache {root} (Abfrage alle {interval} s, Ruhezeit {settle_seconds} s)")
+    cycles = 0
+    try:
+        while True:
+            changed = watcher.update()
+            if changed:
+                for name in changed:
+                    analyzer = watcher.series_analyzer(name)
+                    if analyzer is None:
+                        statistics.pop(name, None)
+                        debug_printer.print_progress(f"Messreihe entfernt: {name}")
+                        continue
+                    statistics[name] = (analyzer.get_statistics(), analyzer.get_measurement_details(),
+                                        analyzer.series_statistics, analyzer.measurement_samples())
+                    debug_printer.print_progress(f"Aktualisiert: {name} ({len(analyzer.max_forces)} Messungen)")
+                _write_watch_summary(statistics, output_path, details_path, debug_printer, bootstrap)
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        debug_printer.print_progress("Überwachung beendet")
+    write_run_report(report_path, root, output_path, debug_printer, mode="watch", input=root)
+    return True
+
+
+def _write_watch_summary(statistics: dict, output_path: Path, details_path: Optional[Path],
+                         debug_printer: DebugPrinter, bootstrap: Optional[BootstrapSettings]) -> None:
+    """Schreibt die Zusammenfassung (und Detailtabelle) des Überwachungsmodus atomar neu"""
+    exporter = ExcelExporter(bootstrap)
+    detail_writer = DetailTableWriter(details_path) if details_path is not None else None
+    for name in sorted(statistics):
+        stats, details, series_statistics, samples = statistics[name]
+        exporter.add_measurement_series(name, stats, series_statistics, samples)
+        if detail_writer is not None:
+            detail_writer.add_series(name, details)
+
+    try:
+        # Temporäre Datei mit gleicher Endung, damit pandas das Format erkennt
+        temp_path = output_path.with_name(f"{output_path.stem}.partial{output_path.suffix}")
+        with get_instrumentation().stage("excel_write"):
+            exporter.save_to_excel(temp_path)
+        os.replace(temp_path, output_path)
+        if detail_writer is not None:
+            detail_writer.close()
+        debug_printer.print_progress(f"Zusammenfassung aktualisiert: {output_path} ({len(statistics)} Messreihen)")
+    except OSError as e:  # z.B. Datei in Excel geöffnet; beim nächsten Update erneut versuchen
+        debug_printer.print_progress(f"Zusammenfassung konnte nicht geschrieben werden: {str(e)}")
+
+
+def process_follow(filepath: Path, config: YarnPulloutConfig, debug_printer: DebugPrinter,
+                   interval: float = 1.0) -> Optional[bool]:
+    """
+    Zeigt die Kennwerte einer laufenden Messung live an, während die CSV wächst.
+
+    Es werden nur die jeweils neu angehängten Zeilen gelesen (siehe TrackingFileTail).
+    Strg+C beendet die Verfolgung und gibt die abschließenden Kennwerte aus.
+    """
+    tail = TrackingFileTail(filepath, config)
+    debug_printer.print_progress(f"Verfolge {filepath} (Abfrage alle {interval} s, Strg+C beendet)")
+    try:
+        while True:
+            try:
+                if tail.poll():
+                    debug_printer.print_progress(_format_live_result(tail.result()))
+            except (OSError, TrackingFormatError) as e:  # z.B. Datei gesperrt; beim nächsten Abruf erneut
+                debug_printer.print_progress(f"Fehler beim Lesen von {filepath.name}: {str(e)}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        try:
+            tail.finish()
+        except (OSError, TrackingFormatError) as e:
+            debug_printer.print_progress(f"Fehler beim Lesen von {filepath.name}: {str(e)}")
+
+    result = tail.result()
+    if result is None:
+        debug_printer.print_progress("Keine Datenzeilen gelesen")
+        return None
+    debug_printer.print_progress(f"Endstand: {_format_live_result(result)}")
+    return True
+
+
+def _format_live_result(result) -> str:
+    """Einzeilige Anzeige der laufenden Kennwerte"""
+    return (f"{result.sample_count} Punkte | F_max {result.max_force:.4f} kN | "
+            f"Modul {result.modulus:.2f} | Arbeit {result.work:.2f} Nm")
+
+
+def process_sweep(input_folder: Path, grid: SweepGrid, config: YarnPulloutConfig, debug_printer: DebugPrinter,
+                  output_path: Path, cache: Optional[MeasurementCache] = None, load_workers: int = 1,
+                  single: bool = False, report_path: Optional[Path] = None) -> Optional[bool]:
+    """
+    Parameterstudie: wertet jede Messreihe für alle Kombinationen der Schwellwerte
+    und Wegbegrenzungen aus und schreibt eine Tabelle mit einer Zeile je Messreihe
+    und Parametersatz (siehe run_sweep).
+    """
+    debug_printer.print_progress(f"Starte Parameter-Sweep ({grid.combinations} Kombinationen): {input_folder}")
+    table = run_sweep(input_folder, grid, config, debug_printer, cache, load_workers, single,
+                      debug_printer.print_progress)
+    if len(table['series']) == 0:
+        debug_printer.print_progress("Keine Ergebnisse zum Speichern.")
+        return None
+    try:
+        with get_instrumentation().stage("sweep_write"):
+            write_sweep_table(table, output_path)
+    except (ImportError, OSError) as e:
+        debug_printer.print_error(f"Sweep-Tabelle konnte nicht geschrieben werden: {str(e)}")
+        return None
+    debug_printer.print_progress(f"Sweep-Tabelle gespeichert: {output_path} ({len(table['series'])} Zeilen)")
+    write_run_report(report_path, input_folder, output_path, debug_printer, mode="sweep", input=input_folder)
+    return True
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """Liest die Kommandozeilenargumente für den Batch-Betrieb ohne Dialoge"""
+    parser = argparse.ArgumentParser(
+        description="Yarn Pull-Out Analyse. Ohne Argumente werden Auswahldialoge angezeigt."
+    )
+    parser.add_argument("--input", "-i", type=Path, required=True,
+                        help="Messreihe (single), Zusammenfassungsordner (multiple, import) bzw. "
+                             "wachsende Tracking-CSV (follow)")
+    parser.add_argument("--mode", "-m", choices=["single", "multiple", "follow", "import", "sweep"],
+                        default="multiple",
+                        help="Analysetyp (Standard: multiple; follow zeigt eine laufende Messung live an, "
+                             "import erstellt ein Binärarchiv der Messdaten, sweep wertet Parameterraster aus)")
+    parser.add_argument("--output", "-o", type=Path,
+                        help="Pfad der Excel-Datei (Standard: Zeitstempel-Datei im Eingabeordner) "
+                             "bzw. des Archivs bei import (Standard: <Eingabe>/yarn_pullout_archive) "
+                             "bzw. der Sweep-Tabelle (.csv, .xlsx oder .parquet)")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Anzahl paralleler Prozesse für Messreihen (nur multiple)")
+    parser.add_argument("--load-workers", type=int, default=1,
+                        help="Anzahl Threads zum Lesen der CSV-Dateien je Messreihe")
+    parser.add_argument("--no-plots", action="store_true", help="Keine Plots erzeugen")
+    parser.add_argument("--render-workers", type=int, default=0,
+                        help="Plots nach der Analyse im Batch mit N Prozessen rendern (nur multiple)")
+    parser.add_argument("--plot-decimation", choices=["minmax", "lttb", "none"], default="minmax",
+                        help="Kurvendezimierung beim Batch-Rendering (Standard: minmax)")
+    parser.add_argument("--report", nargs="?", const="", default=None, metavar="PFAD",
+                        help="Laufzeit- und Ressourcenbericht als JSON schreiben (optional mit Pfad)")
+    parser.add_argument("--details", nargs="?", const="", default=None, metavar="PFAD",
+                        help="Kennwerte je Einzelmessung speichern (.npz, .parquet oder .feather; "
+                             "Standard: <Ausgabe>_details.npz)")
+    parser.add_argument("--archive", type=Path,
+                        help="Messdaten aus einem mit '-m import' erstellten Archiv lesen "
+                             "(geänderte Messreihen weiterhin aus den CSV-Dateien)")
+    parser.add_argument("--modulus-method", choices=["two_point", "regression"], default="two_point",
+                        help="Modul als Anstieg zwischen den Schwellpunkten (Standard) oder als "
+                             "Ausgleichsgerade durch alle Punkte dazwischen")
+    parser.add_argument("--bootstrap-ci", nargs="?", type=int, const=10_000, default=None, metavar="N",
+                        help="Bootstrap-Konfidenzintervalle der Mittelwerte exportieren (N Resamples, "
+                             "Standard: 10000)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="Konfidenzniveau der Bootstrap-Intervalle (Standard: 0.95)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed der Bootstrap-Stichproben (Standard: 0)")
+    parser.add_argument("--sweep-low", type=float, nargs="+", metavar="ANTEIL",
+                        help="Unterer Schwellwert für den Modul im Sweep (mehrere Werte; Standard: 0.2)")
+    parser.add_argument("--sweep-high", type=float, nargs="+", metavar="ANTEIL",
+                        help="Oberer Schwellwert für den Modul im Sweep (mehrere Werte; Standard: 0.7)")
+    parser.add_argument("--sweep-distance", type=float, nargs="+", metavar="MM",
+                        help="Wegbegrenzung der Arbeit im Sweep (mehrere Werte; Standard: 2.5)")
+    parser.add_argument("--sweep-single", action="store_true",
+                        help="Sweep über eine einzelne Messreihe statt eines Zusammenfassungsordners")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Lesen, Analyse, Plotten und Export als überlappende Stufen ausführen (multiple)")
+    parser.add_argument("--read-workers", type=int, default=2,
+                        help="Gleichzeitig gelesene Messreihen in der gestuften Verarbeitung (Standard: 2)")
+    parser.add_argument("--analysis-workers", type=int, default=1,
+                        help="Gleichzeitig berechnete Messreihen in der gestuften Verarbeitung (Standard: 1)")
+    parser.add_argument("--queue-size", type=int, default=2,
+                        help="Messreihen, die höchstens zwischen zwei Stufen warten (Standard: 2)")
+    parser.add_argument("--cache-dir", type=Path, help="Verzeichnis für den Messdaten-Cache")
+    parser.add_argument("--range-limited", action="store_true",
+                        help="CSV-Dateien nur bis zum benötigten Weg parsen (Rest nur auf Kraftmaximum prüfen)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Messungen in einem Durchlauf ohne Rohdaten im Speicher analysieren (keine Plots)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Jede Messreihe sofort in die Ausgabe schreiben (Format nach Endung: "
+                             ".xlsx, .csv, .parquet, .feather)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Abgebrochenen Streaming-Lauf fortsetzen (impliziert --stream)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Eingabeordner dauerhaft überwachen und neue Messungen sofort auswerten "
+                             "(nur multiple, ohne Plots)")
+    parser.add_argument("--interval", type=float, default=2.0,
+                        help="Abfrageintervall im Überwachungs- und follow-Modus in Sekunden (Standard: 2)")
+    parser.add_argument("--settle", type=float, default=5.0,
+                        help="Ruhezeit in Sekunden, nach der eine Messdatei als fertig gilt (Standard: 5)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Nur geänderte Messreihen neu berechnen (Manifest im Eingabeordner, nur multiple)")
+    return parser.parse_args(argv)
+
+
+def run_batch(args: argparse.Namespace) -> Optional[bool]:
+    """Führt die Analyse ohne Benutzerinteraktion aus (z.B. aus Skripten oder Schedulern)."""
+    debug_printer = DebugPrinter()
+    config = YarnPulloutConfig(range_limited_read=args.range_limited, streaming=args.streaming,
+                               cache_dir=str(args.cache_dir) if args.cache_dir else None,
+                               archive_path=str(args.archive) if args.archive else None,
+                               modulus_method=args.modulus_method)
+    bootstrap = (BootstrapSettings(args.bootstrap_ci, args.confidence, args.seed)
+                 if args.bootstrap_ci else None)
+    exporter = ExcelExporter(bootstrap)
+    cache = MeasurementCache(Path(config.cache_dir), config.cache_max_bytes) if config.cache_dir else None
+
+    if args.mode == "follow":
+        return process_follow(args.input, config, debug_printer, args.interval)
+
+    if not args.input.is_dir():
+        debug_printer.print_error(f"Eingabeordner nicht gefunden: {args.input}")
+        return None
+
+    if args.mode == "import":
+        archive_path = args.output or args.input / DEFAULT_ARCHIVE_NAME
+        debug_printer.print_progress(f"Importiere {args.input} nach {archive_path}")
+        try:
+            build_archive(args.input, archive_path, config, debug_printer.print_progress)
+        except OSError as e:
+            debug_printer.print_error(f"Archiv konnte nicht erstellt werden: {str(e)}")
+            return None
+        return True
+
+    if args.mode == "sweep":
+        grid = SweepGrid.from_config(config, args.sweep_low, args.sweep_high, args.sweep_distance)
+        report_path = None
+        if args.report is not None:
+            enable_instrumentation()
+            report_path = Path(args.report) if args.report else None
+        output_path = args.output or args.input / default_sweep_filename()
+        return process_sweep(args.input, grid, config, debug_printer, output_path, cache, args.load_workers,
+                             args.sweep_single, report_path)
+
+    output_path = args.output
+    if output_path is None:
+        output_path = args.input / ExcelExporter.default_filename()
+
+    plotter = None
+    if not args.no_plots and not args.streaming:
+        import matplotlib
+        matplotlib.use("Agg")  # kein GUI-Backend im Batch-Betrieb
+        from src.core.data_plotter import YarnPulloutPlotter
+        plotter = YarnPulloutPlotter()
+
+    if args.stream or args.resume:
+        try:
+            completed = exporter.start_streaming(output_path, resume=args.resume)
+        except (ImportError, ValueError, OSError) as e:
+            debug_printer.print_error(f"Streaming-Ausgabe nicht möglich: {str(e)}")
+            return None
+        debug_printer.print_progress(f"Streaming-Ausgabe: {output_path} "
+                                     f"({len(completed)} Messreihen aus Journal übernommen)")
+
+    report_path = None
+    if args.report is not None:
+        enable_instrumentation()
+        report_path = Path(args.report) if args.report else None
+
+    details_path = None
+    if args.details is not None:
+        details_path = Path(args.details) if args.details else output_path.with_name(
+            f"{output_path.stem}_details.npz")
+
+    if args.watch:
+        if args.mode == "single":
+            debug_printer.print_error("Der Überwachungsmodus ist nur für Zusammenfassungsordner verfügbar")
+            return None
+        return process_watch(args.input, config, debug_printer, output_path, args.interval, args.settle,
+                             details_path, report_path, bootstrap=bootstrap)
+
+    pipeline = None
+    if args.pipeline:
+        pipeline = PipelineSettings(read_workers=args.read_workers, analysis_workers=args.analysis_workers,
+                                    render_workers=max(1, args.render_workers), queue_size=args.queue_size,
+                                    load_workers=args.load_workers)
+
+    debug_printer.print_progress(f"Starte Yarn Pull-Out Analyse (Batch, {args.mode}): {args.input}")
+    if args.mode == "single":
+        return process_single_analysis(args.input, config, plotter, exporter, debug_printer, cache,
+                                       args.load_workers, output_path, report_path, details_path)
+    return process_multiple_analysis(args.input, config, plotter, exporter, debug_printer, cache,
+                                     args.workers, args.load_workers, output_path, args.render_workers,
+                                     args.incremental, args.plot_decimation, report_path, details_path,
+                                     pipeline)
+
+
+def main(argv: Optional[List[str]] = None):
     """Hauptfunktion für die Yarn Pull-Out Analyse."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        result = run_batch(parse_arguments(argv))
+        sys.exit(0 if result else 1)
+
+    from src.core.data_plotter import YarnPulloutPlotter
+    from src.core.file_handler import FileHandler
+
     debug_printer = DebugPrinter()
     config = YarnPulloutConfig()
     plotter = YarnPulloutPlotter()
     exporter = ExcelExporter()
+    cache = MeasurementCache(Path(config.cache_dir), config.cache_max_bytes) if config.cache_dir else None
 
     try:
         debug_printer.print_progress("Starte Yarn Pull-Out Analyse")
@@ -162,7 +672,7 @@ def main():
                 debug_printer.print_progress("Kein Ordner ausgewählt")
                 return
 
-            process_single_analysis(folder_path, config, plotter, exporter, debug_printer)
+            process_single_analysis(folder_path, config, plotter, exporter, debug_printer, cache)
 
         else:
             parent_folder = FileHandler.select_folder("Zusammenfassungsordner auswählen")
@@ -170,7 +680,7 @@ def main():
                 debug_printer.print_progress("Kein Ordner ausgewählt")
                 return
 
-            process_multiple_analysis(parent_folder, config, plotter, exporter, debug_printer)
+            process_multiple_analysis(parent_folder, config, plotter, exporter, debug_printer, cache)
 
     except Exception as e:
         debug_printer.print_progress(f"Fehler bei der Analyse: {str(e)}")
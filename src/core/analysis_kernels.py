@@ -0,0 +1,175 @@
+# src/core/analysis_kernels.py
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass
+class ModulusResult:
+    """Ergebnis des Modul-Kernels für alle Messungen einer Reihe"""
+    max_index: np.ndarray  # Index der (ersten) Maximalkraft je Messung
+    index_low: np.ndarray  # Index des unteren Schwellpunkts, -1 falls nicht gefunden
+    index_high: np.ndarray  # Index des oberen Schwellpunkts, -1 falls nicht gefunden
+    modulus: np.ndarray  # Anstieg, NaN falls nicht berechenbar
+
+
+def segment_max(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Maximum je Segment eines ragged Arrays.
+
+    Args:
+        values: Zusammenhängende Werte aller Segmente
+        offsets: Segmentgrenzen (Länge: Anzahl Segmente + 1)
+
+    Returns:
+        Maximum je Segment, -inf für leere Segmente
+    """
+    starts = offsets[:-1]
+    nonempty = starts < offsets[1:]
+    result = np.full(starts.shape[0], -np.inf)
+    if nonempty.any():
+        result[nonempty] = np.maximum.reduceat(values, starts[nonempty])
+    return result
+
+
+def segment_first_true(mask: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Globaler Index des ersten True-Werts je Segment.
+
+    Args:
+        mask: Boolesche Maske über alle Segmente
+        offsets: Segmentgrenzen (Länge: Anzahl Segmente + 1)
+
+    Returns:
+        Globaler Index je Segment, len(mask) falls kein Treffer
+    """
+    total = mask.shape[0]
+    starts = offsets[:-1]
+    nonempty = starts < offsets[1:]
+    result = np.full(starts.shape[0], total, dtype=np.int64)
+    if nonempty.any():
+        positions = np.where(mask, np.arange(total, dtype=np.int64), total)
+        result[nonempty] = np.minimum.reduceat(positions, starts[nonempty])
+    return result
+
+
+def force_modulus_kernel(displacement: np.ndarray, force: np.ndarray, offsets: np.ndarray,
+                         threshold_low: float, threshold_high: float) -> ModulusResult:
+    """
+    Berechnet den Kraft-Modul aller Messungen in einem vektorisierten Durchlauf.
+
+    Entspricht der bisherigen Einzelberechnung: Schwellwerte relativ zur ersten
+    Maximalkraft, Suche des ersten Punkts über dem Schwellwert nur VOR dem Maximum,
+    Vertauschen der Indizes falls der untere Punkt hinter dem oberen liegt.
+
+    Args:
+        displacement: Wegwerte aller Messungen
+        force: Kraftwerte aller Messungen
+        offsets: Messungsgrenzen (Länge: Anzahl Messungen + 1)
+        threshold_low: Unterer Schwellwert als Anteil der Maximalkraft
+        threshold_high: Oberer Schwellwert als Anteil der Maximalkraft
+
+    Returns:
+        ModulusResult mit lokalen Indizes und Modulwerten je Messung
+    """
+    displacement = np.asarray(displacement, dtype=np.float64)
+    force = np.asarray(force, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    starts = offsets[:-1]
+    lengths = np.diff(offsets)
+    total = force.shape[0]
+
+    # Maximalkraft und deren erstes Auftreten je Messung
+    max_force = segment_max(force, offsets)
+    max_per_sample = np.repeat(max_force, lengths)
+    max_global = segment_first_true(force == max_per_sample, offsets)
+    before_max = np.arange(total, dtype=np.int64) < np.repeat(max_global, lengths)
+
+    # Erster Punkt über dem jeweiligen Schwellwert vor dem Maximum
+    first_low = segment_first_true(
+        before_max & (force >= np.repeat(max_force * threshold_low, lengths)), offsets)
+    first_high = segment_first_true(
+        before_max & (force >= np.repeat(max_force * threshold_high, lengths)), offsets)
+
+    found = (first_low < total) & (first_high < total)
+    lower = np.where(found, np.minimum(first_low, first_high), 0)
+    upper = np.where(found, np.maximum(first_low, first_high), 0)
+
+    modulus = np.full(starts.shape[0], np.nan)
+    if total:
+        delta_x = displacement[upper] - displacement[lower]
+        delta_y = force[upper] - force[lower]
+        valid = found & (delta_x != 0)
+        modulus[valid] = delta_y[valid] / delta_x[valid]
+
+    return ModulusResult(
+        max_index=np.where(lengths > 0, max_global - starts, -1),
+        index_low=np.where(found, lower - starts, -1),
+        index_high=np.where(found, upper - starts, -1),
+        modulus=modulus
+    )
+
+
+def work_kernel(displacement: np.ndarray, force: np.ndarray, offsets: np.ndarray,
+                distance_limit: float, interpolate: bool = False) -> np.ndarray:
+    """
+    Berechnet die Arbeit (Trapezintegral der Kraft über dem Weg) aller Messungen
+    bis zum Distance Limit in einem vektorisierten Durchlauf.
+
+    Ohne Interpolation werden wie bisher alle Punkte mit Weg <= distance_limit
+    integriert (Maske). Mit Interpolation wird bis zum ersten Überschreiten des
+    Limits integriert und das letzte Trapez exakt bei distance_limit abgeschnitten,
+    sodass das Ergebnis nicht von der Lage der Abtastpunkte abhängt.
+
+    Args:
+        displacement: Wegwerte aller Messungen
+        force: Kraftwerte aller Messungen
+        offsets: Messungsgrenzen (Länge: Anzahl Messungen + 1)
+        distance_limit: Integrationsgrenze in mm
+        interpolate: Exakte Interpolation an der Integrationsgrenze
+
+    Returns:
+        Arbeit je Messung, NaN falls keine Punkte bis zum Limit vorhanden sind
+    """
+    displacement = np.asarray(displacement, dtype=np.float64)
+    force = np.asarray(force, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    count = lengths.shape[0]
+    segment = np.repeat(np.arange(count), lengths)
+
+    if interpolate:
+        cutoff = segment_first_true(displacement > distance_limit, offsets)
+        cutoff = np.minimum(cutoff, offsets[1:])
+        mask = np.arange(displacement.shape[0]) < np.repeat(cutoff, lengths)
+    else:
+        mask = displacement <= distance_limit
+
+    x_kept = displacement[mask]
+    y_kept = force[mask]
+    seg_kept = segment[mask]
+
+    kept_counts = np.bincount(seg_kept, minlength=count)
+    kept_offsets = np.concatenate(([0], np.cumsum(kept_counts)))
+
+    # Trapezflächen aller benachbarten Punkte; Flächen über Messungsgrenzen hinweg
+    # werden beim segmentweisen Summieren ausgelassen. reduceat summiert der Reihe
+    # nach, np.trapezoid paarweise; die Ergebnisse sind daher nur bis auf Rundung gleich
+    areas = (x_kept[1:] - x_kept[:-1]) * (y_kept[1:] + y_kept[:-1]) / 2.0
+    areas = np.append(areas, 0.0)
+    work = np.zeros(count)
+    summable = kept_counts >= 2
+    if summable.any():
+        bounds = np.stack((kept_offsets[:-1][summable], kept_offsets[1:][summable] - 1), axis=1)
+        work[summable] = np.add.reduceat(areas, bounds.ravel())[::2]
+
+    if interpolate:
+        # Angeschnittenes Trapez zwischen letztem Punkt und distance_limit
+        partial = (cutoff < offsets[1:]) & (cutoff > offsets[:-1])
+        upper = cutoff[partial]
+        lower = upper - 1
+        x0, x1 = displacement[lower], displacement[upper]
+        y0, y1 = force[lower], force[upper]
+        y_limit = y0 + (y1 - y0) * (distance_limit - x0) / (x1 - x0)
+        work[partial] += (distance_limit - x0) * (y0 + y_limit) / 2.0
+
+    return np.where(kept_counts > 0, work, np.nan)
@@ -0,0 +1,231 @@
+# src/core/async_pipeline.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, TYPE_CHECKING
+from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
+from src.core.debug_printer import DebugPrinter
+from src.core.instrumentation import get_instrumentation
+from src.core.measurement_cache import MeasurementCache
+from src.core.plot_renderer import create_render_pool, render_job_in_worker
+from src.core.series_processor import (SeriesResult, find_measurement_files, load_series_files,
+                                       compute_series, deferred_plot_job)
+
+if TYPE_CHECKING:
+    from src.core.data_plotter import YarnPulloutPlotter
+
+# Markiert das Ende des Datenstroms in einer Warteschlange
+_DONE = object()
+
+
+@dataclass
+class PipelineSettings:
+    """Nebenläufigkeit je Stufe und Größe der Warteschlangen der gestuften Verarbeitung"""
+    read_workers: int = 2  # Messreihen, die gleichzeitig gelesen werden (Threads, I/O)
+    analysis_workers: int = 1  # Messreihen, die gleichzeitig berechnet werden (Threads)
+    render_workers: int = 1  # Render-Prozesse
+    queue_size: int = 2  # Messreihen, die höchstens zwischen zwei Stufen warten
+    load_workers: int = 1  # Threads zum Lesen der CSV-Dateien innerhalb einer Messreihe
+
+
+@dataclass
+class _Item:
+    """Eine Messreihe auf dem Weg durch die Stufen"""
+    position: int
+    folder: Path
+    csv_paths: List[Path] = field(default_factory=list)
+    analyzer: Optional[YarnPulloutAnalyzer] = None
+    result: Optional[SeriesResult] = None
+
+
+async def _run_stage(handler: Callable, workers: int, inbox: asyncio.Queue, outbox: asyncio.Queue,
+                     downstream_workers: int) -> None:
+    """
+    Betreibt eine Stufe mit workers Verbrauchern.
+
+    Jeder Verbraucher endet mit einer Endmarke; erst wenn alle beendet sind,
+    erhält die nächste Stufe eine Endmarke je eigenem Verbraucher.
+    """
+    async def worker():
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+            await outbox.put(await handler(item))
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    for _ in range(downstream_workers):
+        await outbox.put(_DONE)
+
+
+async def _pipeline(series_folders: Sequence[Path], config: YarnPulloutConfig,
+                    plotter: Optional['YarnPulloutPlotter'], debug_printer: DebugPrinter,
+                    plot_dir_gesamt: Path, sink: Callable[[SeriesResult], None], settings: PipelineSettings,
+                    cache: Optional[MeasurementCache], plot_decimation: Optional[str],
+                    precomputed: Dict[str, SeriesResult]) -> int:
+    loop = asyncio.get_running_loop()
+    instrumentation = get_instrumentation()
+    make_plots = plotter is not None and not config.streaming
+    read_workers = max(1, settings.read_workers)
+    analysis_workers = max(1, settings.analysis_workers)
+    render_workers = max(1, settings.render_workers) if make_plots else 1
+
+    read_queue = asyncio.Queue(maxsize=max(1, settings.queue_size))
+    analysis_queue = asyncio.Queue(maxsize=max(1, settings.queue_size))
+    render_queue = asyncio.Queue(maxsize=max(1, settings.queue_size))
+    sink_queue = asyncio.Queue()  # die Senke ist schnell; Ergebnisse werden dort sortiert
+
+    read_executor = ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix="read")
+    analysis_executor = ThreadPoolExecutor(max_workers=analysis_workers, thread_name_prefix="analysis")
+    sink_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sink")
+    render_pool = create_render_pool(render_workers) if make_plots else None
+
+    def discover(folder: Path) -> List[Path]:
+        with instrumentation.series(folder.name), instrumentation.stage("folder_discovery"):
+            return find_measurement_files(folder, config.data_ending)
+
+    async def discovery() -> None:
+        for position, folder in enumerate(series_folders):
+            if folder.name in precomputed:
+                await sink_queue.put(_Item(position, folder, result=precomputed[folder.name]))
+                continue
+            item = _Item(position, folder)
+            try:
+                item.csv_paths = await loop.run_in_executor(read_executor, discover, folder)
+            except OSError as e:
+                item.result = SeriesResult(folder.name, error=str(e))
+                debug_printer.print_progress(f"Fehler beim Durchsuchen von {folder.name}: {str(e)}")
+            await read_queue.put(item)
+        for _ in range(read_workers):
+            await read_queue.put(_DONE)
+
+    # Die Zuordnung zur Messreihe gilt je Thread (RunInstrumentation.current_series),
+    # daher öffnet jeder Schritt seinen eigenen Messreihen-Block
+    def read(item: _Item) -> _Item:
+        debug_printer.print_progress(f"\nLese Messreihe: {item.folder.name}")
+        item.analyzer = YarnPulloutAnalyzer(config)
+        with instrumentation.series(item.folder.name):
+            load_series_files(item.folder, item.csv_paths, item.analyzer, debug_printer, cache,
+                              settings.load_workers)
+        return item
+
+    def analyse(item: _Item) -> _Item:
+        with instrumentation.series(item.folder.name):
+            return _analyse(item)
+
+    def _analyse(item: _Item) -> _Item:
+        item.result = SeriesResult(item.folder.name, measurement_count=len(item.analyzer.max_forces))
+        if item.analyzer.max_forces:
+            try:
+                compute_series(item.result, item.analyzer)
+                if make_plots:
+                    deferred_plot_job(item.result, item.folder, item.analyzer, plotter, plot_dir_gesamt)
+                    item.result.plot_job.decimation = plot_decimation
+            except Exception as e:
+                item.result.error = str(e)
+                debug_printer.print_progress(f"Fehler bei der Verarbeitung von {item.folder.name}: {str(e)}")
+        item.analyzer = None  # Messdaten freigeben, sobald die Kurven im PlotJob liegen
+        return item
+
+    async def read_stage(item: _Item) -> _Item:
+        if item.result is not None:
+            return item
+        try:
+            return await loop.run_in_executor(read_executor, read, item)
+        except Exception as e:
+            item.result = SeriesResult(item.folder.name, error=str(e))
+            debug_printer.print_progress(f"Fehler beim Laden von {item.folder.name}: {str(e)}")
+            return item
+
+    async def analysis_stage(item: _Item) -> _Item:
+        if item.result is not None:
+            return item
+        return await loop.run_in_executor(analysis_executor, analyse, item)
+
+    async def render_stage(item: _Item) -> _Item:
+        job = item.result.plot_job
+        if job is None:
+            return item
+        name, error, metrics = await loop.run_in_executor(render_pool, render_job_in_worker, job)
+        instrumentation.merge_series(name, metrics)
+        item.result.plot_job = None  # bereits gerendert
+        if error:
+            item.result.plot_paths = []
+            debug_printer.print_progress(f"Fehler beim Plotting von {name}: {error}")
+        else:
+            debug_printer.print_progress(f"Plot gespeichert für {name}")
+        return item
+
+    async def sink_stage() -> int:
+        # Ergebnisse in fester Ordnerreihenfolge weitergeben, unabhängig von der Fertigstellung
+        pending: Dict[int, SeriesResult] = {}
+        position = 0
+        while True:
+            item = await sink_queue.get()
+            if item is _DONE:
+                return position
+            pending[item.position] = item.result
+            while position in pending:
+                await loop.run_in_executor(sink_executor, sink, pending.pop(position))
+                position += 1
+
+    tasks = [
+        asyncio.create_task(discovery()),
+        asyncio.create_task(_run_stage(read_stage, read_workers, read_queue, analysis_queue, analysis_workers)),
+        asyncio.create_task(_run_stage(analysis_stage, analysis_workers, analysis_queue, render_queue,
+                                       render_workers)),
+        asyncio.create_task(_run_stage(render_stage, render_workers, render_queue, sink_queue, 1)),
+        asyncio.create_task(sink_stage()),
+    ]
+    try:
+        done, pending_tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending_tasks:
+            task.cancel()
+        for task in done:
+            task.result()  # Ausnahme einer Stufe weitergeben
+        return tasks[-1].result()
+    finally:
+        read_executor.shutdown(wait=True)
+        analysis_executor.shutdown(wait=True)
+        sink_executor.shutdown(wait=True)
+        if render_pool is not None:
+            render_pool.shutdown(wait=True)
+
+
+def run_pipeline(series_folders: Sequence[Path], config: YarnPulloutConfig,
+                 plotter: Optional['YarnPulloutPlotter'], debug_printer: DebugPrinter,
+                 plot_dir_gesamt: Path, sink: Callable[[SeriesResult], None],
+                 settings: PipelineSettings = PipelineSettings(),
+                 cache: Optional[MeasurementCache] = None, plot_decimation: Optional[str] = "minmax",
+                 precomputed: Optional[Dict[str, SeriesResult]] = None) -> int:
+    """
+    Verarbeitet mehrere Messreihen in überlappenden Stufen.
+
+    Discovery, CSV-Lesen, Analyse, Rendering und Ergebnis-Senke laufen als
+    eigene asyncio-Stufen, verbunden durch begrenzte Warteschlangen: Ist eine
+    Stufe langsamer, füllt sich ihre Warteschlange und die vorherige wartet,
+    statt beliebig viele Messreihen im Speicher anzusammeln. Die blockierenden
+    Schritte laufen in Executoren (Lesen und Analyse in Threads, Rendern in
+    Prozessen), sodass z.B. das Lesen von einem langsamen Netzlaufwerk mit der
+    Analyse und dem Plotten früherer Messreihen überlappt.
+
+    Args:
+        series_folders: Ordner der Messreihen
+        config: Analysekonfiguration
+        plotter: Plotter (None = keine Plots)
+        debug_printer: Ausgabe der Fortschrittsmeldungen
+        plot_dir_gesamt: Sammelordner für alle Plots
+        sink: Übernimmt jedes Ergebnis (in der Reihenfolge von series_folders,
+            nacheinander in einem eigenen Thread)
+        settings: Nebenläufigkeit je Stufe und Größe der Warteschlangen
+        cache: Optionaler Messdaten-Cache
+        plot_decimation: Kurvendezimierung der Plots
+        precomputed: Bereits vorliegende Ergebnisse je Messreihe (z.B. aus dem Manifest),
+            die ohne Verarbeitung an die Senke gehen
+
+    Returns:
+        Anzahl der an die Senke übergebenen Messreihen
+    """
+    return asyncio.run(_pipeline(list(series_folders), config, plotter, debug_printer, plot_dir_gesamt, sink,
+                                 settings, cache, plot_decimation, precomputed or {}))
@@ -0,0 +1,96 @@
+# src/core/bootstrap.py
+from dataclasses import dataclass
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.core.running_stats import QUANTITIES
+
+# Obergrenze der gleichzeitig gezogenen Stichprobenwerte (Messreihen x Resamples x Messungen)
+_CHUNK_ELEMENTS = 4_000_000
+
+
+@dataclass
+class BootstrapSettings:
+    """Einstellungen der Bootstrap-Konfidenzintervalle"""
+    resamples: int = 10_000
+    confidence: float = 0.95
+    seed: int = 0
+
+
+def bootstrap_mean_intervals(groups: Sequence[np.ndarray], resamples: int = 10_000,
+                             confidence: float = 0.95, seed: int = 0) -> np.ndarray:
+    """
+    Perzentil-Bootstrap-Intervalle des Mittelwerts für viele Gruppen gleichzeitig.
+
+    Alle Gruppen teilen sich dieselben gleichverteilten Zufallszahlen (Resamples x
+    größte Gruppe): Für eine Gruppe mit n Werten ergibt floor(u * n) der ersten n
+    Spalten die Ziehungsindizes. Jede Spalte hat einen eigenen Zufallsstrom, aus
+    dem die Resamples blockweise gezogen werden; so wird nie die ganze Matrix
+    angelegt, und das Ergebnis hängt weder von der Blockgröße noch von der größten
+    Gruppe im Batch ab.
+
+    Args:
+        groups: Werte je Gruppe (z.B. Maximalkräfte je Messreihe)
+        resamples: Anzahl der Bootstrap-Stichproben
+        confidence: Konfidenzniveau (z.B. 0.95)
+        seed: Startwert des Zufallsgenerators (gleicher Seed = gleiche Intervalle)
+
+    Returns:
+        Array der Form (Gruppen, 2) mit unterer und oberer Grenze (NaN für leere Gruppen)
+    """
+    sizes = np.array([len(group) for group in groups], dtype=np.int64)
+    intervals = np.full((len(groups), 2), np.nan)
+    valid = np.flatnonzero(sizes > 0)
+    if valid.size == 0:
+        return intervals
+
+    sizes = sizes[valid]
+    width = int(sizes.max())
+    padded = np.zeros((valid.size, width))
+    for row, index in enumerate(valid):
+        padded[row, :sizes[row]] = groups[index]
+
+    # Ein Zufallsstrom je Spalte: die ersten n Spalten hängen nicht von der größten Gruppe
+    # ab, daher erhält eine Messreihe allein oder im Batch dasselbe Intervall
+    streams = [np.random.default_rng([seed, column]) for column in range(width)]
+    flat = padded.ravel()
+    row_offsets = (np.arange(valid.size) * width)[:, None, None]
+    used = (np.arange(width) < sizes[:, None])[:, None, :]  # Spalten jenseits von n nicht mitzählen
+
+    means = np.empty((valid.size, resamples))
+    chunk = max(1, _CHUNK_ELEMENTS // (valid.size * width))
+    for start in range(0, resamples, chunk):
+        count = min(chunk, resamples - start)
+        block = np.stack([stream.random(count) for stream in streams], axis=1)  # (Resamples, Spalten)
+        indices = (block[None, :, :] * sizes[:, None, None]).astype(np.intp) + row_offsets
+        drawn = np.where(used, flat[indices], 0.0)
+        means[:, start:start + chunk] = drawn.sum(axis=2) / sizes[:, None]
+
+    alpha = (1.0 - confidence) / 2.0
+    intervals[valid] = np.quantile(means, [alpha, 1.0 - alpha], axis=1).T
+    return intervals
+
+
+def series_confidence_intervals(samples: Sequence[Optional[Dict[str, np.ndarray]]],
+                                settings: BootstrapSettings = BootstrapSettings()
+                                ) -> List[Optional[Dict[str, Tuple[float, float]]]]:
+    """
+    Konfidenzintervalle von F_max, Arbeit und Modul für mehrere Messreihen in einem Batch.
+
+    Args:
+        samples: Kennwerte je Messreihe (YarnPulloutAnalyzer.measurement_samples();
+            None, falls nicht verfügbar)
+        settings: Anzahl der Resamples, Konfidenzniveau und Seed
+
+    Returns:
+        Je Messreihe {Kennwert: (untere, obere Grenze)} bzw. None
+    """
+    results: List[Optional[Dict[str, Tuple[float, float]]]] = [
+        {} if series is not None else None for series in samples]
+    for quantity in QUANTITIES:
+        groups = [np.asarray(series[quantity], dtype=np.float64) if series is not None else np.empty(0)
+                  for series in samples]
+        intervals = bootstrap_mean_intervals(groups, settings.resamples, settings.confidence, settings.seed)
+        for result, (low, high) in zip(results, intervals):
+            if result is not None:
+                result[quantity] = (float(low), float(high))
+    return results
@@ -0,0 +1,114 @@
+# src/core/curve_decimation.py
+import numpy as np
+from typing import Optional, Tuple
+
+DECIMATION_METHODS = ("minmax", "lttb")
+
+
+def minmax_indices(y: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Min-Max-Dezimierung: je Bucket erster, letzter, kleinster und größter Punkt.
+
+    Die Buckets sind gleich groß (nach Index); Minimum und Maximum werden über
+    eine aufgefüllte Matrix (Bucket x Punkt) in einem Schritt bestimmt. Da die
+    Buckets Indexbereiche und keine Pixelspalten der x-Achse sind, ist das
+    gerasterte Bild nur visuell nahezu gleich zur vollen Kurve, nicht identisch.
+
+    Args:
+        y: Werte der Kurve
+        buckets: Anzahl der Buckets
+
+    Returns:
+        Sortierte Indizes der behaltenen Punkte
+    """
+    count = y.shape[0]
+    size = -(-count // max(1, buckets))
+    rows = -(-count // size)
+    starts = np.arange(rows) * size
+
+    grid = np.full(rows * size, -np.inf)
+    grid[:count] = y
+    maxima = grid.reshape(rows, size).argmax(axis=1) + starts
+    grid[count:] = np.inf
+    minima = grid.reshape(rows, size).argmin(axis=1) + starts
+    ends = np.minimum(starts + size, count) - 1
+
+    return np.unique(np.concatenate((starts, minima, maxima, ends)))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets-Dezimierung.
+
+    Bucket-Grenzen und Bucket-Mittelwerte werden vektorisiert berechnet; die Wahl
+    je Bucket hängt vom zuvor gewählten Punkt ab und läuft daher Bucket für Bucket
+    (innerhalb eines Buckets vektorisiert).
+
+    Args:
+        x: Wegwerte der Kurve
+        y: Kraftwerte der Kurve
+        points: Anzahl der Ausgabepunkte (inklusive erstem und letztem Punkt)
+
+    Returns:
+        Sortierte Indizes der behaltenen Punkte
+    """
+    count = x.shape[0]
+    if points >= count or points < 3:
+        return np.arange(count)
+
+    # Innere Buckets über die Punkte 1 .. count-2
+    edges = np.linspace(1, count - 1, points - 1).astype(np.int64)
+    lengths = np.diff(edges)
+    mean_x = np.add.reduceat(x[:count - 1], edges[:-1]) / lengths
+    mean_y = np.add.reduceat(y[:count - 1], edges[:-1]) / lengths
+    # Ankerpunkt rechts: Mittelwert des nächsten Buckets bzw. letzter Punkt
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, count - 1
+    anchor = 0
+    for bucket in range(points - 2):
+        low, high = edges[bucket], edges[bucket + 1]
+        area = np.abs((x[anchor] - next_x[bucket]) * (y[low:high] - y[anchor])
+                      - (x[anchor] - x[low:high]) * (next_y[bucket] - y[anchor]))
+        anchor = low + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def decimate_curve(x: np.ndarray, y: np.ndarray, pixel_width: int,
+                   method: Optional[str] = "minmax") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduziert eine Kurve auf eine zur Bildbreite passende Punktzahl.
+
+    Der Punkt der Maximalkraft (erstes Auftreten) bleibt immer exakt erhalten.
+
+    Args:
+        x: Wegwerte der Kurve
+        y: Kraftwerte der Kurve
+        pixel_width: Breite der Zeichenfläche in Pixeln
+        method: "minmax" (ein Bucket je Pixelspalte), "lttb" (zwei Punkte je
+            Pixelspalte) oder None für keine Dezimierung
+
+    Returns:
+        Tupel (Weg, Kraft) der reduzierten Kurve
+    """
+    if method is None or method == "none":
+        return x, y
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f"Unbekannte Dezimierungsmethode: {method}")
+
+    if method == "minmax":
+        if x.shape[0] <= 4 * pixel_width:
+            return x, y
+        indices = minmax_indices(y, pixel_width)
+    else:
+        if x.shape[0] <= 2 * pixel_width:
+            return x, y
+        indices = lttb_indices(x, y, 2 * pixel_width)
+
+    peak = int(np.argmax(y))
+    if not np.any(indices == peak):
+        indices = np.union1d(indices, [peak])
+    return x[indices], y[indices]
@@ -0,0 +1,255 @@
+# src/core/curve_index.py
+import numpy as np
+from typing import Sequence, Tuple
+from src.core.analysis_kernels import ModulusResult, work_kernel
+
+MODULUS_METHODS = ("two_point", "regression")
+
+
+class CurveIndex:
+    """
+    Vorberechneter Index über alle Messungen eines MeasurementStore.
+
+    Einmal nach dem Laden aufgebaut, beantwortet er Fragen, für die sonst jede
+    Kurve erneut durchlaufen werden müsste:
+
+    - kumulatives Trapezintegral: Arbeit bis zu einem beliebigen Weg in O(log n)
+      (Binärsuche im laufenden Wegmaximum, dann O(1))
+    - Präfixsummen von x, y, x², xy: Least-Squares-Anstieg über jeden
+      Indexbereich in O(1)
+    - laufendes Kraftmaximum: erster Punkt über einem Anteil der Maximalkraft
+      in O(log n)
+    - Minimum des Wegs ab jedem Punkt: erkennt in O(1), ob die Kurve hinter der
+      Integrationsgrenze wieder unter sie zurückläuft
+
+    Alle Arrays liegen wie im MeasurementStore hintereinander; Präfixsummen
+    beginnen je Messung bei 0 (Länge je Messung: n + 1).
+    """
+
+    def __init__(self, displacement: np.ndarray, force: np.ndarray, offsets: np.ndarray):
+        self.displacement = np.asarray(displacement, dtype=np.float64)
+        self.force = np.asarray(force, dtype=np.float64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        count = self.offsets.shape[0] - 1
+        total = self.force.shape[0]
+
+        # Präfixsummen je Messung (mit führender 0) über ein gemeinsames Array:
+        # Messung i belegt prefix_offsets[i] .. prefix_offsets[i + 1] (n + 1 Einträge)
+        self.prefix_offsets = self.offsets + np.arange(count + 1)
+        segment = np.repeat(np.arange(count), np.diff(self.offsets))
+        positions = np.arange(total) + segment + 1  # Platz hinter der führenden 0
+
+        x, y = self.displacement, self.force
+        areas = np.zeros(total)
+        if total > 1:
+            areas[1:] = (x[1:] - x[:-1]) * (y[1:] + y[:-1]) / 2.0
+        areas[self.offsets[:-1][self.offsets[:-1] < self.offsets[1:]]] = 0.0  # kein Trapez über Messungsgrenzen
+
+        self.running_max_force = np.empty(total)
+        self.running_max_displacement = np.empty(total)
+        self.suffix_min_displacement = np.empty(total)
+        self._sums = {}
+        for name, values in (('work', areas), ('x', x), ('y', y), ('xx', x * x), ('xy', x * y)):
+            prefix = np.zeros(total + count)
+            prefix[positions] = values
+            self._sums[name] = prefix
+        for i in range(count):
+            start, stop = self.offsets[i], self.offsets[i + 1]
+            first, last = self.prefix_offsets[i], self.prefix_offsets[i + 1]
+            for prefix in self._sums.values():
+                np.cumsum(prefix[first:last], out=prefix[first:last])
+            np.maximum.accumulate(y[start:stop], out=self.running_max_force[start:stop])
+            np.maximum.accumulate(x[start:stop], out=self.running_max_displacement[start:stop])
+            self.suffix_min_displacement[start:stop] = np.minimum.accumulate(x[start:stop][::-1])[::-1]
+
+    @classmethod
+    def from_store(cls, store) -> 'CurveIndex':
+        """Baut den Index für alle Messungen eines MeasurementStore auf"""
+        return cls(store.displacement, store.force, store.offsets)
+
+    def __len__(self) -> int:
+        return self.offsets.shape[0] - 1
+
+    def _range_sums(self, name: str, measurements: np.ndarray, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+        """Summen der Werte name über die lokalen Indizes starts .. stops - 1 (elementweise)"""
+        base = self.prefix_offsets[measurements]
+        prefix = self._sums[name]
+        return prefix[base + stops] - prefix[base + starts]
+
+    def work_table(self, distances: Sequence[float], interpolate: bool = True) -> np.ndarray:
+        """
+        Arbeit aller Messungen bis zu mehreren Wegen.
+
+        Die Ergebnisse entsprechen work_kernel (bis auf Rundung). Mit interpolate
+        wird bis zum ersten Punkt integriert, an dem der Weg die Grenze
+        überschreitet, und das letzte Trapez exakt an der Grenze abgeschnitten.
+        Ohne Interpolation zählen wie in work_kernel alle Punkte mit Weg <= Grenze:
+        Liegen das nur die Punkte vor dem ersten Überschreiten, wird die Arbeit aus
+        den Präfixsummen abgelesen; läuft der Weg danach wieder unter die Grenze
+        zurück, wird die Messung für diese Grenze mit work_kernel berechnet.
+
+        Args:
+            distances: Integrationsgrenzen in mm
+            interpolate: Letztes Trapez an der Grenze abschneiden
+
+        Returns:
+            Array (Messungen, Grenzen); NaN, falls kein Punkt bis zur Grenze existiert
+        """
+        distances = np.asarray(distances, dtype=np.float64)
+        count = len(self)
+        work = np.full((count, distances.shape[0]), np.nan)
+        if count == 0 or distances.size == 0 or self.force.size == 0:
+            return work
+
+        # Binärsuche je Messung im laufenden Wegmaximum, für alle Grenzen auf einmal
+        cutoff = np.empty((count, distances.shape[0]), dtype=np.int64)
+        for i in range(count):
+            start, stop = self.offsets[i], self.offsets[i + 1]
+            cutoff[i] = np.searchsorted(self.running_max_displacement[start:stop], distances, side='right')
+
+        measurements = np.broadcast_to(np.arange(count)[:, None], cutoff.shape)
+        valid = cutoff > 0
+        work[valid] = self._range_sums('work', measurements[valid], np.zeros(valid.sum(), dtype=np.int64),
+                                       cutoff[valid])
+        if interpolate:
+            lengths = np.diff(self.offsets)[:, None]
+            partial = valid & (cutoff < lengths)
+            upper = (self.offsets[:-1][:, None] + cutoff)[partial]
+            lower = upper - 1
+            limit = np.broadcast_to(distances[None, :], cutoff.shape)[partial]
+            x0, x1 = self.displacement[lower], self.displacement[upper]
+            y0, y1 = self.force[lower], self.force[upper]
+            y_limit = y0 + (y1 - y0) * (limit - x0) / (x1 - x0)
+            work[partial] += (limit - x0) * (y0 + y_limit) / 2.0
+            return work
+
+        # Punkte hinter dem ersten Überschreiten, die wieder unter der Grenze liegen
+        lengths = np.diff(self.offsets)[:, None]
+        behind = np.minimum(self.offsets[:-1][:, None] + cutoff, self.force.shape[0] - 1)
+        returning = (cutoff < lengths) & (self.suffix_min_displacement[behind] <= distances[None, :])
+        for i, j in zip(*np.nonzero(returning)):
+            start, stop = self.offsets[i], self.offsets[i + 1]
+            work[i, j] = work_kernel(self.displacement[start:stop], self.force[start:stop],
+                                     np.array([0, stop - start]), distances[j], False)[0]
+        return work
+
+    def work_at(self, distance: float, interpolate: bool = True) -> np.ndarray:
+        """Arbeit aller Messungen bis zum Weg distance (siehe work_table)"""
+        return self.work_table([distance], interpolate)[:, 0]
+
+    def threshold_indices(self, fractions: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Erster Punkt über mehreren Anteilen der Maximalkraft, jeweils vor dem Maximum.
+
+        Args:
+            fractions: Anteile der Maximalkraft
+
+        Returns:
+            Tupel (Index des ersten Maximums je Messung, Array (Messungen, Anteile) der
+            lokalen Indizes; -1 = nicht vor dem Maximum erreicht)
+        """
+        fractions = np.asarray(fractions, dtype=np.float64)
+        count = len(self)
+        max_index = np.full(count, -1, dtype=np.int64)
+        indices = np.full((count, fractions.shape[0]), -1, dtype=np.int64)
+        for i in range(count):
+            start, stop = self.offsets[i], self.offsets[i + 1]
+            if start == stop:
+                continue
+            running = self.running_max_force[start:stop]
+            max_force = running[-1]
+            # Erster Punkt >= Schwellwert = erster Punkt, an dem das laufende Maximum ihn erreicht
+            max_index[i] = np.searchsorted(running, max_force, side='left')
+            first = np.searchsorted(running, max_force * fractions, side='left')
+            indices[i] = np.where(first < max_index[i], first, -1)
+        return max_index, indices
+
+    def threshold_points(self, fraction_low: float, fraction_high: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Schwellpunkte für den Modul wie in force_modulus_kernel (inklusive Vertauschen,
+        falls der untere Punkt hinter dem oberen liegt).
+
+        Returns:
+            Tupel (Index des Maximums, unterer Index, oberer Index) je Messung (lokal, -1 = nicht gefunden)
+        """
+        max_index, indices = self.threshold_indices([fraction_low, fraction_high])
+        lower, upper = self._ordered_pair(indices[:, 0], indices[:, 1])
+        return max_index, lower, upper
+
+    @staticmethod
+    def _ordered_pair(first_low: np.ndarray, first_high: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        found = (first_low >= 0) & (first_high >= 0)
+        return (np.where(found, np.minimum(first_low, first_high), -1),
+                np.where(found, np.maximum(first_low, first_high), -1))
+
+    def least_squares_slopes(self, measurements: np.ndarray, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+        """
+        Anstiege der Ausgleichsgeraden durch die Punkte starts .. stops - 1, je O(1).
+
+        Returns:
+            Anstiege; NaN bei weniger als zwei Punkten bzw. konstantem Weg
+        """
+        n = (stops - starts).astype(np.float64)
+        sx = self._range_sums('x', measurements, starts, stops)
+        sy = self._range_sums('y', measurements, starts, stops)
+        sxx = self._range_sums('xx', measurements, starts, stops)
+        sxy = self._range_sums('xy', measurements, starts, stops)
+        denominator = n * sxx - sx * sx
+        slopes = np.full(n.shape, np.nan)
+        valid = (n >= 2) & (denominator > 0)
+        slopes[valid] = (n * sxy - sx * sy)[valid] / denominator[valid]
+        return slopes
+
+    def _slopes(self, lower: np.ndarray, upper: np.ndarray, method: str) -> np.ndarray:
+        """Modul je Eintrag für Schwellpunkt-Paare (Arrays gleicher Form wie (Messungen, ...))"""
+        if method not in MODULUS_METHODS:
+            raise ValueError(f"Unbekannte Modulmethode: {method}")
+        measurements = np.broadcast_to(np.arange(len(self)).reshape((-1,) + (1,) * (lower.ndim - 1)), lower.shape)
+        found = lower >= 0
+        modulus = np.full(lower.shape, np.nan)
+        if method == "regression":
+            modulus[found] = self.least_squares_slopes(measurements[found], lower[found], upper[found] + 1)
+            return modulus
+        start = self.offsets[:-1][measurements[found]]
+        delta_x = self.displacement[start + upper[found]] - self.displacement[start + lower[found]]
+        delta_y = self.force[start + upper[found]] - self.force[start + lower[found]]
+        slopes = np.full(delta_x.shape, np.nan)
+        nonzero = delta_x != 0
+        slopes[nonzero] = delta_y[nonzero] / delta_x[nonzero]
+        modulus[found] = slopes
+        return modulus
+
+    def modulus(self, fraction_low: float, fraction_high: float, method: str = "two_point") -> ModulusResult:
+        """
+        Kraft-Modul aller Messungen zwischen zwei Anteilen der Maximalkraft.
+
+        Args:
+            fraction_low: Unterer Schwellwert als Anteil der Maximalkraft
+            fraction_high: Oberer Schwellwert als Anteil der Maximalkraft
+            method: "two_point" (Anstieg zwischen den beiden Schwellpunkten, wie bisher)
+                oder "regression" (Ausgleichsgerade durch alle Punkte dazwischen)
+
+        Returns:
+            ModulusResult mit lokalen Indizes und Modulwerten je Messung
+        """
+        max_index, lower, upper = self.threshold_points(fraction_low, fraction_high)
+        return ModulusResult(max_index=max_index, index_low=lower, index_high=upper,
+                             modulus=self._slopes(lower, upper, method))
+
+    def modulus_table(self, fractions_low: Sequence[float], fractions_high: Sequence[float],
+                      method: str = "two_point") -> np.ndarray:
+        """
+        Kraft-Modul aller Messungen für alle Kombinationen zweier Schwellwert-Raster.
+
+        Die Schwellpunkte werden je Messung mit einer Binärsuche für alle Anteile
+        zugleich bestimmt, die Anstiege für alle Kombinationen gemeinsam berechnet.
+
+        Returns:
+            Array (Messungen, len(fractions_low), len(fractions_high)); NaN = nicht berechenbar
+        """
+        fractions_low = np.asarray(fractions_low, dtype=np.float64)
+        _, indices = self.threshold_indices(np.concatenate((fractions_low, np.asarray(fractions_high))))
+        first_low = indices[:, :fractions_low.shape[0], None]
+        first_high = indices[:, None, fractions_low.shape[0]:]
+        lower, upper = self._ordered_pair(*np.broadcast_arrays(first_low, first_high))
+        return self._slopes(lower, upper, method)
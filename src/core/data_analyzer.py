@@ -1,10 +1,21 @@
 # src/core/data_analyzer.py
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from pathlib import Path
+import hashlib
+import json
 import numpy as np
-import pandas as pd
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
 import logging
+from src.core.instrumentation import get_instrumentation, instrumented
+from src.core.analysis_kernels import ModulusResult, force_modulus_kernel, work_kernel
+from src.core.curve_index import CurveIndex
+from src.core.measurement_cache import MeasurementCache
+from src.core.measurement_store import MeasurementStore, MeasurementTupleView
+from src.core.running_stats import SeriesStatistics
+from src.core.tracking_reader import read_tracking_columns, read_tracking_range
+
+if TYPE_CHECKING:
+    from src.core.streaming_analyzer import StreamingResult
 
 
 @dataclass
@@ -14,6 +25,41 @@ class YarnPulloutConfig:
     distance_limit: float = 2.5  # mm
     force_threshold_low: float = 0.2  # 20% für Modulberechnung
     force_threshold_high: float = 0.7  # 70% für Modulberechnung
+    storage_dtype: str = "float64"  # Datentyp der Messdaten ("float64" oder "float32")
+    interpolate_work_cutoff: bool = False  # Arbeit exakt bis distance_limit interpolieren
+    modulus_method: str = "two_point"  # "two_point" (Schwellpunkte) oder "regression" (Ausgleichsgerade)
+    plot_distance_limit: float = 4.0  # mm, größter dargestellter Weg
+    range_limited_read: bool = False  # Nur bis max(distance_limit, plot_distance_limit) parsen
+    read_hysteresis: float = 0.1  # mm Abstand zum Horizont, bevor das Lesen endet
+    read_confirm_samples: int = 10  # Punkte in Folge jenseits des Horizonts bis zum Abbruch
+    scan_force_tail: bool = True  # Rest der Datei auf ein höheres Kraftmaximum prüfen
+    streaming: bool = False  # Einpass-Analyse ohne Speicherung der Rohdaten (keine Plots)
+    cache_dir: Optional[str] = None  # Verzeichnis für den Messdaten-Cache (None = deaktiviert)
+    cache_max_bytes: int = 512 * 1024 * 1024  # Größenbudget des Caches
+    archive_path: Optional[str] = None  # Binärarchiv der Messdaten (None = CSV-Dateien lesen)
+    
+    def fingerprint(self) -> str:
+        """Kurzer Hash über alle Analyseparameter (ohne Cache- und Archiv-Einstellungen)"""
+        values = {key: value for key, value in asdict(self).items()
+                  if not key.startswith('cache_') and key != 'archive_path'}
+        return hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+    
+    def parse_fingerprint(self) -> str:
+        """
+        Kurzer Hash über die Parameter, von denen die geparsten Messdaten abhängen
+        (Schlüssel des Messdaten-Caches). Analyseparameter wie Schwellwerte oder
+        Modulmethode gehören nicht dazu; die Wegbegrenzung nur beim
+        bereichsbegrenzten Lesen, über den Lesehorizont.
+        """
+        values = {'data_ending': self.data_ending, 'storage_dtype': self.storage_dtype}
+        if self.range_limited_read:
+            values.update(read_horizon=self.read_horizon(), read_hysteresis=self.read_hysteresis,
+                          read_confirm_samples=self.read_confirm_samples, scan_force_tail=self.scan_force_tail)
+        return hashlib.sha1(json.dumps(values, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    
+    def read_horizon(self) -> float:
+        """Größter Weg (relativ zum ersten Messpunkt), der für Analyse und Plot benötigt wird"""
+        return max(self.distance_limit, self.plot_distance_limit)
 
 
 class YarnPulloutAnalyzer:
@@ -21,10 +67,17 @@ class YarnPulloutAnalyzer:
     
     def __init__(self, config: YarnPulloutConfig = YarnPulloutConfig()):
         self.config = config
-        self.measurements: List[List[Tuple[float, float]]] = []
+        self.store = MeasurementStore(config.storage_dtype)
+        self._measurement_view = self.store.as_tuples()
         self.max_forces: List[float] = []
         self.force_moduli: List[float] = []
         self.total_work: List[Tuple[int, float]] = []
+        self.streamed_results: List['StreamingResult'] = []  # nur im Streaming-Modus
+        self.measurement_names: List[str] = []
+        self.modulus_result: Optional[ModulusResult] = None  # Indizes der Schwellpunkte je Messung
+        self.work_values: Optional[np.ndarray] = None  # ungerundete Arbeit je Messung (NaN = keine)
+        self.series_statistics = SeriesStatistics()  # ungerundete, zusammenführbare Statistiken
+        self._curve_index: Optional[CurveIndex] = None
         self.logger = self._setup_logger()
         
         # Statistische Ergebnisse
@@ -46,42 +99,174 @@ class YarnPulloutAnalyzer:
             logger.addHandler(handler)
         return logger
     
-    def load_data(self, filepath: Path) -> None:
+    @property
+    def measurements(self) -> MeasurementTupleView:
+        """Schreibgeschützte Tupel-Sicht auf die Messdaten (Weg, Kraft)"""
+        return self._measurement_view
+    
+    @staticmethod
+    def normalize(displacement: np.ndarray, force: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Normalisiert Weg und Kraft auf den ersten Messpunkt.
+
+        Args:
+            displacement: Rohe Wegwerte in mm
+            force: Rohe Kraftwerte in kN
+
+        Returns:
+            Tupel (Weg, Kraft), wie bisher auf 4 Stellen gerundet
+        """
+        displacement = np.asarray(displacement, dtype=np.float64)
+        force = np.asarray(force, dtype=np.float64)
+        if displacement.size == 0:
+            raise ValueError("Messung enthält keine Datenpunkte")
+        return (np.round(displacement - displacement[0], 4),
+                np.round(force - force[0], 4))
+    
+    def read_measurement(self, filepath: Path,
+                         cache: Optional[MeasurementCache] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Liest und normalisiert eine Messung, ohne sie dem Analyzer hinzuzufügen.
+
+        Args:
+            filepath: Pfad zur CSV-Datei
+            cache: Optionaler Messdaten-Cache
+
+        Returns:
+            Tupel (Weg, Kraft) der normalisierten Messung
+        """
+        with get_instrumentation().stage("csv_load") as stage:
+            fingerprint = self.config.parse_fingerprint()
+            if cache is not None:
+                cached = cache.get(filepath, fingerprint)
+                if cached is not None:
+                    stage.add(rows=len(cached[0]))
+                    return cached
+            
+            if self.config.range_limited_read:
+                counter = {}
+                raw = read_tracking_range(filepath, self.config.read_horizon(), self.config.read_hysteresis,
+                                          self.config.read_confirm_samples, self.config.scan_force_tail,
+                                          counter=counter)
+                bytes_read = counter['bytes_read']  # nur der tatsächlich geparste Teil
+            else:
+                raw = read_tracking_columns(filepath)
+                bytes_read = filepath.stat().st_size
+            stage.add(bytes_read=bytes_read, rows=len(raw[0]))
+            displacement, force = self.normalize(*raw)
+            if cache is not None:
+                cache.put(filepath, fingerprint,
+                          displacement.astype(self.store.dtype), force.astype(self.store.dtype))
+            return displacement, force
+    
+    def measurement_name(self, filepath: Path) -> str:
+        """Name einer Messung aus dem Dateinamen (ohne Dateiendung der Messdaten)"""
+        name = filepath.name
+        if name.endswith(self.config.data_ending):
+            return name[:-len(self.config.data_ending)]
+        return filepath.stem
+    
+    def add_measurement(self, displacement: np.ndarray, force: np.ndarray,
+                        normalized: bool = False, name: Optional[str] = None) -> int:
+        """
+        Legt eine Messung im Messdatenspeicher ab.
+
+        Args:
+            displacement: Wegwerte in mm
+            force: Kraftwerte in kN
+            normalized: True, wenn die Werte bereits normalisiert sind
+            name: Name der Messung (Standard: fortlaufende Nummer)
+
+        Returns:
+            Index der neuen Messung
+        """
+        if normalized:
+            x_normalized, y_normalized = displacement, force
+            if len(x_normalized) == 0:
+                raise ValueError("Messung enthält keine Datenpunkte")
+        else:
+            x_normalized, y_normalized = self.normalize(displacement, force)
+        
+        index = self.store.append(x_normalized, y_normalized)
+        self.measurement_names.append(name or f"Messung_{index + 1}")
+        # Finde maximale Kraft
+        self.max_forces.append(float(self.store[index][1].max()))
+        return index
+    
+    def stream_measurement(self, filepath: Path) -> 'StreamingResult':
+        """
+        Analysiert eine Messung in einem Durchlauf, ohne die Rohdaten zu behalten.
+
+        Args:
+            filepath: Pfad zur CSV-Datei
+
+        Returns:
+            StreamingResult mit den Kennwerten der Messung
+        """
+        from src.core.streaming_analyzer import analyze_tracking_file
+        
+        with get_instrumentation().stage("csv_load") as stage:
+            result = analyze_tracking_file(filepath, self.config)
+            stage.add(bytes_read=filepath.stat().st_size, rows=result.sample_count)
+        return result
+    
+    def add_streaming_result(self, result: 'StreamingResult', name: Optional[str] = None) -> int:
+        """
+        Übernimmt die Kennwerte einer im Streaming-Modus analysierten Messung.
+
+        Args:
+            result: Ergebnis von stream_measurement
+            name: Name der Messung (Standard: fortlaufende Nummer)
+
+        Returns:
+            Index der Messung
+        """
+        self.streamed_results.append(result)
+        self.measurement_names.append(name or f"Messung_{len(self.streamed_results)}")
+        self.max_forces.append(float(result.max_force))
+        return len(self.streamed_results) - 1
+    
+    def use_store(self, store: MeasurementStore, names: List[str]) -> None:
+        """
+        Übernimmt einen fertigen Messdatenspeicher (z.B. aus dem Binärarchiv) ohne Kopie.
+
+        Args:
+            store: Speicher mit normalisierten Messdaten
+            names: Namen der Messungen in Speicherreihenfolge
+        """
+        if len(self.store) or self.streamed_results:
+            raise ValueError("Analyzer enthält bereits Messungen")
+        if len(names) != len(store):
+            raise ValueError("Anzahl der Namen passt nicht zur Anzahl der Messungen")
+        if np.any(store.lengths == 0):
+            raise ValueError("Messung enthält keine Datenpunkte")
+        self.store = store
+        self._measurement_view = store.as_tuples()
+        self.measurement_names = list(names)
+        starts = store.offsets[:-1]
+        self.max_forces = ([float(value) for value in np.maximum.reduceat(store.force, starts)]
+                           if len(store) else [])
+    
+    def load_data(self, filepath: Path, cache: Optional[MeasurementCache] = None) -> None:
         """
         Lädt die Daten aus einer CSV-Datei.
 
+        Im Streaming-Modus werden nur die Kennwerte übernommen, der Cache wird
+        dann nicht verwendet.
+
         Args:
             filepath: Pfad zur CSV-Datei
+            cache: Optionaler Messdaten-Cache
         """
         try:
-            dataset = pd.read_csv(
-                filepath,
-                sep=";",
-                usecols=[7, 8],  # [x in mm, y in kN]
-                decimal=',',
-                encoding='utf-8'
-            )
-            
-            # Normalisiere x-Werte (Weg)
-            x_values = dataset.iloc[:, 0]
-            x_offset = x_values.iloc[0]
-            x_normalized = x_values - x_offset
+            if self.config.streaming:
+                self.add_streaming_result(self.stream_measurement(filepath), self.measurement_name(filepath))
+                self.logger.info(f"Daten erfolgreich analysiert (Streaming): {filepath.name}")
+                return
             
-            # Normalisiere y-Werte (Kraft)
-            y_values = dataset.iloc[:, 1]
-            y_offset = y_values.iloc[0]
-            y_normalized = y_values - y_offset
-            
-            # Erstelle Liste von Tupeln
-            measurement_data = [
-                (round(float(x), 4), round(float(y), 4))
-                for x, y in zip(x_normalized, y_normalized)
-            ]
-            
-            self.measurements.append(measurement_data)
-            # Finde maximale Kraft
-            max_force = max(measurement_data, key=lambda x: x[1])[1]
-            self.max_forces.append(max_force)
+            # Spalten direkt als Arrays übernehmen (keine Tupel-Listen)
+            displacement, force = self.read_measurement(filepath, cache)
+            self.add_measurement(displacement, force, normalized=True, name=self.measurement_name(filepath))
             
             self.logger.info(f"Daten erfolgreich geladen: {filepath.name}")
         
@@ -89,6 +274,54 @@ class YarnPulloutAnalyzer:
             self.logger.error(f"Fehler beim Laden der Datei {filepath}: {str(e)}")
             raise
     
+    @property
+    def curve_index(self) -> CurveIndex:
+        """
+        Präfixsummen-Index über alle geladenen Messungen.
+
+        Wird beim ersten Zugriff aufgebaut und nur neu erstellt, wenn seitdem
+        Messungen hinzugekommen sind.
+        """
+        if self.streamed_results:
+            raise ValueError("Im Streaming-Modus liegen keine Rohdaten für den Index vor")
+        if self._curve_index is None or len(self._curve_index) != len(self.store):
+            self._curve_index = CurveIndex.from_store(self.store)
+        return self._curve_index
+    
+    def work_up_to(self, distance: float, interpolate: Optional[bool] = None) -> np.ndarray:
+        """
+        Arbeit aller Messungen bis zu einem beliebigen Weg, ohne die Kurven erneut zu durchlaufen.
+
+        Entspricht calculate_work mit distance als Distance Limit (bis auf Rundung),
+        auch wenn der Weg zurückläuft (siehe CurveIndex.work_table).
+
+        Args:
+            distance: Integrationsgrenze in mm
+            interpolate: Letztes Trapez bei distance abschneiden (Standard: interpolate_work_cutoff)
+
+        Returns:
+            Arbeit je Messung (NaN, falls kein Punkt bis distance existiert)
+        """
+        if interpolate is None:
+            interpolate = self.config.interpolate_work_cutoff
+        return self.curve_index.work_at(distance, interpolate)
+    
+    def modulus_between(self, fraction_low: float, fraction_high: float,
+                        method: Optional[str] = None) -> ModulusResult:
+        """
+        Kraft-Modul aller Messungen zwischen zwei beliebigen Anteilen der Maximalkraft.
+
+        Args:
+            fraction_low: Unterer Schwellwert als Anteil der Maximalkraft
+            fraction_high: Oberer Schwellwert als Anteil der Maximalkraft
+            method: "two_point" oder "regression" (Standard: modulus_method der Konfiguration)
+
+        Returns:
+            ModulusResult mit lokalen Indizes und Modulwerten je Messung
+        """
+        return self.curve_index.modulus(fraction_low, fraction_high, method or self.config.modulus_method)
+    
+    @instrumented("modulus")
     def calculate_force_modulus(self) -> None:
         """
         Berechnet den Kraft-Modul für alle Messungen.
@@ -96,102 +329,171 @@ class YarnPulloutAnalyzer:
         Der Modul wird aus dem Anstieg zwischen 20% und 70% der Maximalkraft berechnet,
         wobei nur Datenpunkte VOR dem Erreichen der Maximalkraft berücksichtigt werden.
         Dies verhindert Verfälschungen durch mögliche Kraftanstiege nach dem ersten Maximum.
+        Mit modulus_method="regression" wird statt des Anstiegs zwischen den beiden
+        Schwellpunkten die Ausgleichsgerade durch alle Punkte dazwischen verwendet.
         """
         self.force_moduli = []
+        self.modulus_result = None
         
-        for measurement, max_force in zip(self.measurements, self.max_forces):
+        if self.streamed_results:
+            if self.config.modulus_method != "two_point":
+                self.logger.warning("Regressionsmodul im Streaming-Modus nicht verfügbar, "
+                                    "verwende Zwei-Punkt-Anstieg")
+            result = ModulusResult(
+                max_index=np.array([r.max_index for r in self.streamed_results]),
+                index_low=np.array([r.index_low for r in self.streamed_results]),
+                index_high=np.array([r.index_high for r in self.streamed_results]),
+                modulus=np.array([r.modulus for r in self.streamed_results])
+            )
+        else:
             try:
-                # Finde Punkt mit maximaler Kraft und dessen Index
-                max_point = max(measurement, key=lambda point: point[1])
-                max_force_index = measurement.index(max_point)
-                
-                # Berechne Schwellwerte
-                threshold_20 = max_point[1] * self.config.force_threshold_low
-                threshold_70 = max_point[1] * self.config.force_threshold_high
-                
-                # Initialisiere Indizes
-                index_20 = None
-                index_70 = None
-                
-                # Suche nur in Datenpunkten VOR dem Maximum
-                for i, point in enumerate(measurement[:max_force_index]):
-                    if point[1] >= threshold_20 and index_20 is None:
-                        index_20 = i
-                    if point[1] >= threshold_70 and index_70 is None:
-                        index_70 = i
-                
-                # Überprüfe, ob beide Punkte gefunden wurden
-                if index_20 is None or index_70 is None:
-                    self.logger.warning("Nicht genügend Werte vor Maximalkraft für die Berechnung.")
-                    self.force_moduli.append(0.0)
-                    continue
-                
-                # Stelle sicher, dass index_20 kleiner ist als index_70
-                if index_20 > index_70:
-                    index_20, index_70 = index_70, index_20
-                
-                # Hole die entsprechenden Punkte
-                point_20 = measurement[index_20]
-                point_70 = measurement[index_70]
-                
-                # Berechne den Modul (Anstieg)
-                modulus = (point_70[1] - point_20[1]) / (point_70[0] - point_20[0])
-                self.force_moduli.append(round(modulus, 2))
-                
-                self.logger.debug(f"Modul berechnet: {modulus:.2f} "
-                                  f"(20% bei {point_20}, 70% bei {point_70})")
-            
+                if self.config.modulus_method == "two_point":
+                    result = force_modulus_kernel(
+                        self.store.displacement, self.store.force, self.store.offsets,
+                        self.config.force_threshold_low, self.config.force_threshold_high
+                    )
+                else:
+                    result = self.modulus_between(self.config.force_threshold_low,
+                                                  self.config.force_threshold_high)
             except Exception as e:
                 self.logger.error(f"Fehler bei der Modulberechnung: {str(e)}")
+                self.force_moduli = [0.0] * len(self.store)
+                return
+        
+        self.modulus_result = result
+        for i, modulus in enumerate(result.modulus):
+            # Überprüfe, ob beide Punkte gefunden wurden
+            if result.index_low[i] < 0:
+                self.logger.warning("Nicht genügend Werte vor Maximalkraft für die Berechnung.")
+                self.force_moduli.append(0.0)
+                continue
+            
+            if np.isnan(modulus):
+                self.logger.error("Fehler bei der Modulberechnung: Division durch Null")
                 self.force_moduli.append(0.0)
+                continue
+            
+            self.force_moduli.append(round(float(modulus), 2))
+            self.logger.debug(f"Modul berechnet: {modulus:.2f} "
+                              f"(Indizes {result.index_low[i]} und {result.index_high[i]})")
     
+    @instrumented("work")
     def calculate_work(self) -> None:
         """Berechnet die verrichtete Arbeit für alle Messungen"""
         self.total_work = []
+        self.work_values = None
         
-        for i, measurement in enumerate(self.measurements):
+        if self.streamed_results:
+            work = np.array([r.work for r in self.streamed_results])
+        else:
             try:
-                # Filtere Daten bis zum Distance Limit
-                filtered_data = [
-                    (x, y) for x, y in measurement
-                    if x <= self.config.distance_limit
-                ]
-                
-                if not filtered_data:
-                    continue
-                
-                x_values = [x for x, _ in filtered_data]
-                y_values = [y for _, y in filtered_data]
-                
-                # Berechne Integral
-                work = np.trapezoid(y_values, x_values)
-                self.total_work.append((i, round(work, 2)))
-            
+                work = work_kernel(
+                    self.store.displacement, self.store.force, self.store.offsets,
+                    self.config.distance_limit, self.config.interpolate_work_cutoff
+                )
             except Exception as e:
-                self.logger.error(f"Fehler bei der Arbeitsberechnung für Messung {i}: {str(e)}")
+                self.logger.error(f"Fehler bei der Arbeitsberechnung: {str(e)}")
+                return
+        
+        self.work_values = work
+        # Messungen ohne Punkte bis zum Distance Limit werden übersprungen
+        self.total_work = [
+            (i, round(value, 2))
+            for i, value in enumerate(work) if not np.isnan(value)
+        ]
     
+    @instrumented("statistics")
     def calculate_statistics(self) -> None:
-        """Berechnet statistische Kennwerte"""
+        """
+        Berechnet statistische Kennwerte.
+
+        Die ungerundeten Statistiken liegen danach in series_statistics und lassen
+        sich mit denen anderer Messreihen zusammenführen; gerundet wird nur für
+        die Kennwerte mean_* und *_stddev.
+        """
         try:
+            self.series_statistics = SeriesStatistics.from_values(
+                self.max_forces, [work[1] for work in self.total_work], self.force_moduli)
+            summary = self.series_statistics.summary()
+            
             # Maximalkraft-Statistiken
             if self.max_forces:
-                self.mean_max_force = round(np.mean(self.max_forces), 2)
-                self.force_stddev = round(np.std(self.max_forces), 2)
+                self.mean_max_force = summary['max_force']['mean']
+                self.force_stddev = summary['max_force']['std']
             
             # Arbeits-Statistiken
             if self.total_work:
-                work_values = [work[1] for work in self.total_work]
-                self.mean_work = round(np.mean(work_values), 2)
-                self.work_stddev = round(np.std(work_values), 2)
+                self.mean_work = summary['work']['mean']
+                self.work_stddev = summary['work']['std']
             
             # Modul-Statistiken
             if self.force_moduli:
-                self.mean_force_modulus = round(np.mean(self.force_moduli), 2)
-                self.force_modulus_stddev = round(np.std(self.force_moduli), 2)
+                self.mean_force_modulus = summary['modulus']['mean']
+                self.force_modulus_stddev = summary['modulus']['std']
         
         except Exception as e:
             self.logger.error(f"Fehler bei der statistischen Berechnung: {str(e)}")
     
+    def get_measurement_details(self) -> Dict[str, np.ndarray]:
+        """
+        Gibt die Kennwerte jeder einzelnen Messung als Spalten zurück.
+
+        Setzt calculate_force_modulus und calculate_work voraus. Indizes und Lagen
+        der Schwellpunkte beziehen sich auf die normalisierten Messdaten; nicht
+        gefundene Punkte sind -1 bzw. NaN.
+
+        Returns:
+            Dictionary Spaltenname -> Array (eine Zeile je Messung)
+        """
+        count = len(self.max_forces)
+        result = self.modulus_result
+        index_low = result.index_low if result is not None else np.full(count, -1)
+        index_high = result.index_high if result is not None else np.full(count, -1)
+        
+        if self.streamed_results:
+            sample_count = np.array([r.sample_count for r in self.streamed_results])
+            points = np.array([(r.displacement_low, r.force_low, r.displacement_high, r.force_high)
+                               for r in self.streamed_results], dtype=np.float64).reshape(count, 4)
+        else:
+            sample_count = self.store.lengths
+            starts = self.store.offsets[:-1]
+            points = np.full((count, 4), np.nan)
+            for column, indices in ((0, index_low), (2, index_high)):
+                found = indices >= 0
+                positions = starts[found] + indices[found]
+                points[found, column] = self.store.displacement[positions]
+                points[found, column + 1] = self.store.force[positions]
+        
+        moduli = self.force_moduli if len(self.force_moduli) == count else [np.nan] * count
+        work = self.work_values if self.work_values is not None else np.full(count, np.nan)
+        return {
+            'measurement': np.array(self.measurement_names, dtype=str),
+            'sample_count': np.asarray(sample_count, dtype=np.int64),
+            'max_force': np.array(self.max_forces, dtype=np.float64),
+            'modulus': np.array(moduli, dtype=np.float64),
+            'work': np.round(np.asarray(work, dtype=np.float64), 2),
+            'index_low': np.asarray(index_low, dtype=np.int64),
+            'displacement_low': points[:, 0],
+            'force_low': points[:, 1],
+            'index_high': np.asarray(index_high, dtype=np.int64),
+            'displacement_high': points[:, 2],
+            'force_high': points[:, 3],
+        }
+    
+    def measurement_samples(self) -> Dict[str, np.ndarray]:
+        """
+        Kennwerte je Messung, aus denen calculate_statistics die Statistiken bildet.
+
+        Returns:
+            Dictionary {'max_force', 'work', 'modulus'} -> Array (Arbeit nur für Messungen mit Punkten
+            bis zum Distance Limit)
+        """
+        return {
+            'max_force': np.array(self.max_forces, dtype=np.float64),
+            'work': np.array([work[1] for work in self.total_work], dtype=np.float64),
+            'modulus': np.array(self.force_moduli, dtype=np.float64),
+        }
+    
     def get_statistics(self) -> Dict:
         """
         Gibt alle statistischen Kennwerte zurück.
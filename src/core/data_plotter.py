@@ -1,7 +1,14 @@
 # src/core/data_plotter.py
 
 import matplotlib.pyplot as plt
+import numpy as np
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+from src.core.curve_decimation import decimate_curve
 from src.core.data_analyzer import YarnPulloutAnalyzer
+from src.core.instrumentation import get_instrumentation
+
+Curve = Tuple[np.ndarray, np.ndarray]
 
 
 class YarnPulloutPlotter:
@@ -34,9 +41,8 @@ class YarnPulloutPlotter:
         plt.rcParams['lines.linewidth'] = 3  # Liniendicke der Messdaten
 
 
-    def create_plot(self, analyzer: YarnPulloutAnalyzer, title: str) -> plt.Figure:
-        fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
-
+    def setup_axes(self, ax: plt.Axes) -> None:
+        """Setzt Achsgrenzen, Beschriftungen und Ticks"""
         ax.set_xlim(0, 4.05)
         ax.set_ylim(0, 2)
 
@@ -47,13 +53,78 @@ class YarnPulloutPlotter:
         #ax.tick_params(axis='both', labelsize=22, width=3) # width ist bereits global gesetzt
         ax.set_yticks([0, 0.5, 1, 1.5, 2])
 
-        for i, measurement in enumerate(analyzer.measurements):
-            x_values = [x for x, _ in measurement if x <= 4]
-            y_values = [y for x, y in measurement if x <= 4]
-            color = plt.cm.plasma(i / len(analyzer.measurements))
+    @staticmethod
+    def get_curves(analyzer: YarnPulloutAnalyzer) -> List[Curve]:
+        """Liefert die darzustellenden Kurven (Weg bis plot_distance_limit, 4 mm) aller Messungen"""
+        curves = []
+        limit = analyzer.config.plot_distance_limit
+        for displacement, force in analyzer.store:
+            mask = displacement <= limit
+            curves.append((displacement[mask], force[mask]))
+        return curves
+
+    def create_plot(self, analyzer: YarnPulloutAnalyzer, title: str) -> plt.Figure:
+        fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+        self.setup_axes(ax)
+
+        curves = self.get_curves(analyzer)
+        for i, (x_values, y_values) in enumerate(curves):
+            color = plt.cm.plasma(i / len(curves))
             ax.plot(x_values, y_values, color=color) # Linienstärke ist global gesetzt
 
         # ax.set_title(title, fontweight='bold', fontname='Arial') # Titel setzen
         plt.grid(True)
         plt.tight_layout()
-        return fig
\ No newline at end of file
+        return fig
+
+
+class ReusablePlotFigure:
+    """
+    Vorkonfigurierte Agg-Figure für das Rendern vieler Messreihen.
+
+    Figure, Achsen und Ticks werden nur einmal aufgebaut; pro Messreihe werden
+    lediglich die Liniendaten ausgetauscht. Die Figure läuft ohne pyplot und
+    wird daher auch nicht im pyplot-Figure-Manager registriert. Die Kurven
+    werden vor dem Zeichnen auf die Pixelbreite der Achsen dezimiert.
+    """
+
+    def __init__(self, plotter: YarnPulloutPlotter):
+        from matplotlib.figure import Figure
+
+        self.dpi = plotter.dpi
+        self.figure = Figure(figsize=plotter.figure_size, dpi=plotter.dpi)
+        self.ax = self.figure.add_subplot()
+        plotter.setup_axes(self.ax)
+        self.ax.grid(True)
+        self.figure.tight_layout()
+        self.pixel_width = int(np.ceil(self.ax.get_position().width * self.figure.get_figwidth() * self.dpi))
+        self.lines = []
+
+    def render(self, curves: Sequence[Curve], path: Path, decimation: Optional[str] = "minmax") -> Path:
+        """
+        Zeichnet die Kurven einer Messreihe und speichert das Bild.
+
+        Args:
+            curves: Kurven (Weg, Kraft) der Messreihe
+            path: Zielpfad der PNG-Datei
+            decimation: "minmax", "lttb" oder None (alle Punkte zeichnen)
+
+        Returns:
+            Zielpfad der PNG-Datei
+        """
+        with get_instrumentation().stage("plot_render"):
+            while len(self.lines) < len(curves):
+                line, = self.ax.plot([], [])
+                self.lines.append(line)
+
+            for i, line in enumerate(self.lines):
+                if i < len(curves):
+                    line.set_data(*decimate_curve(*curves[i], self.pixel_width, decimation))
+                    line.set_color(plt.cm.plasma(i / len(curves)))
+                    line.set_visible(True)
+                else:
+                    line.set_visible(False)
+
+        with get_instrumentation().stage("png_write"):
+            self.figure.savefig(path, dpi=self.dpi, bbox_inches='tight')
+        return path
@@ -9,8 +9,13 @@ class DebugPrinter:
         self._setup_logger()
 
     def _setup_logger(self):
+        # Handler nur einmal anlegen (z.B. bei mehreren Instanzen in Worker-Prozessen)
+        if any(getattr(h, 'yarn_debug_printer', False) for h in self.logger.handlers):
+            return
+
         # Erstelle Handler für die Konsolenausgabe
         handler = logging.StreamHandler(sys.stdout)
+        handler.yarn_debug_printer = True
 
         # Erstelle einen Formatter, der die Farbe basierend auf dem Log-Level setzt
         class ColorFormatter(logging.Formatter):
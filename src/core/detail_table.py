@@ -0,0 +1,109 @@
+# src/core/detail_table.py
+import os
+from pathlib import Path
+import numpy as np
+from typing import Dict, List, Optional
+
+# Spalten der Detailtabelle (eine Zeile je Messung)
+DETAIL_COLUMNS = ('series', 'measurement', 'sample_count', 'max_force', 'modulus', 'work',
+                  'index_low', 'displacement_low', 'force_low',
+                  'index_high', 'displacement_high', 'force_high')
+
+
+def _concatenate(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Fügt Spaltenblöcke mehrerer Messreihen zusammen"""
+    if not parts:
+        return {column: np.empty(0) for column in DETAIL_COLUMNS}
+    return {column: np.concatenate([part[column] for part in parts]) for column in DETAIL_COLUMNS}
+
+
+class DetailTableWriter:
+    """
+    Sammelt die Kennwerte aller Einzelmessungen und schreibt sie spaltenweise.
+
+    Das Format ergibt sich aus der Dateiendung: .npz (Standard, nur numpy),
+    .parquet oder .feather (pyarrow). Pro Messung fällt nur eine Zeile mit
+    wenigen Zahlen an, daher wird die Tabelle im Speicher gesammelt und am Ende
+    atomar geschrieben.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.parts: List[Dict[str, np.ndarray]] = []
+
+    def add_series(self, series: str, details: Optional[Dict[str, np.ndarray]]) -> None:
+        """
+        Übernimmt die Detailwerte einer Messreihe.
+
+        Args:
+            series: Name der Messreihe
+            details: Ergebnis von YarnPulloutAnalyzer.get_measurement_details()
+                (mit oder ohne Spalte 'series')
+        """
+        if not details or len(details['measurement']) == 0:
+            return
+        count = len(details['measurement'])
+        part = {column: np.asarray(details[column]) for column in DETAIL_COLUMNS if column != 'series'}
+        part['series'] = np.full(count, series)
+        self.parts.append(part)
+
+    def close(self) -> Path:
+        """
+        Schreibt die Tabelle.
+
+        Returns:
+            Pfad der geschriebenen Datei
+        """
+        table = _concatenate(self.parts)
+        table['series'] = table['series'].astype(str)
+        table['measurement'] = table['measurement'].astype(str)
+        temp_path = self.path.with_name(self.path.name + ".partial")
+        suffix = self.path.suffix.lower()
+
+        if suffix in ('.parquet', '.feather', '.arrow'):
+            try:
+                import pyarrow as pa
+            except ImportError as e:
+                raise ImportError(f"Für das Format '{suffix}' wird pyarrow benötigt") from e
+            arrow_table = pa.table({column: table[column] for column in DETAIL_COLUMNS})
+            if suffix == '.parquet':
+                import pyarrow.parquet as pq
+                pq.write_table(arrow_table, str(temp_path))
+            else:
+                import pyarrow.feather as feather
+                feather.write_feather(arrow_table, str(temp_path))
+        else:
+            with open(temp_path, 'wb') as file:
+                np.savez_compressed(file, **table)
+        os.replace(temp_path, self.path)
+        return self.path
+
+
+def load_detail_table(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Lädt eine Detailtabelle als Dictionary von Spalten.
+
+    Args:
+        path: .npz-, .parquet- oder .feather-Datei
+
+    Returns:
+        Dictionary Spaltenname -> numpy-Array
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in ('.parquet', '.feather', '.arrow'):
+        if suffix == '.parquet':
+            import pyarrow.parquet as pq
+            arrow_table = pq.read_table(str(path))
+        else:
+            import pyarrow.feather as feather
+            arrow_table = feather.read_table(str(path))
+        return {column: arrow_table.column(column).to_numpy() for column in arrow_table.column_names}
+    with np.load(path) as data:
+        return {column: data[column] for column in data.files}
+
+
+def select_series(table: Dict[str, np.ndarray], series: str) -> Dict[str, np.ndarray]:
+    """Zeilen einer Messreihe aus einer geladenen Detailtabelle"""
+    rows = table['series'] == series
+    return {column: values[rows] for column, values in table.items()}
@@ -1,15 +1,31 @@
 # src/core/excel_exporter.py
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
-from src.core.file_handler import FileHandler
+from typing import Dict, List, Optional, Tuple
+from src.core.bootstrap import BootstrapSettings, series_confidence_intervals
+from src.core.result_writer import StreamingResultWriter
+from src.core.running_stats import SeriesStatistics
+
+
+# Spalten der Konfidenzintervalle je Kennwert (untere, obere Grenze)
+CI_COLUMNS = {
+    'max_force': ('F_max_CI_low [kN]', 'F_max_CI_high [kN]'),
+    'work': ('Work_CI_low [Nm]', 'Work_CI_high [Nm]'),
+    'modulus': ('Force Modulus_CI_low', 'Force Modulus_CI_high'),
+}
+
+# Messreihen, deren Konfidenzintervalle im Streaming-Modus gemeinsam berechnet werden
+STREAM_CI_BATCH = 16
 
 
 class ExcelExporter:
     """Klasse für den Export von Analyseergebnissen nach Excel"""
     
-    def __init__(self):
+    def __init__(self, bootstrap: Optional[BootstrapSettings] = None):
+        """
+        Args:
+            bootstrap: Einstellungen für Bootstrap-Konfidenzintervalle (None = keine CI-Spalten)
+        """
         self.results = {
             'Messreihe': [],
             'F_max [kN]': [],
@@ -19,40 +35,158 @@ class ExcelExporter:
             'Force Modulus': [],
             'Force Modulus_std': []
         }
+        self.bootstrap = bootstrap
+        self.samples: List[Optional[Dict]] = []  # Kennwerte je Messung für die CI-Berechnung
+        if bootstrap is not None:
+            for columns in CI_COLUMNS.values():
+                for column in columns:
+                    self.results[column] = []
+        self.writer: Optional[StreamingResultWriter] = None
+        # Im Streaming-Modus auf die gemeinsame CI-Berechnung wartende Zeilen (Zeile, Kennwerte, Zustand)
+        self._stream_pending: List[Tuple[Dict, Optional[Dict], Dict]] = []
+        self.campaign = SeriesStatistics()  # über alle Messreihen zusammengeführte Statistiken
+    
+    def start_streaming(self, path: Path, resume: bool = False) -> List[str]:
+        """
+        Schreibt jede Messreihe sofort in die Ausgabedatei statt am Ende.
+
+        Das Format ergibt sich aus der Dateiendung (.xlsx, .csv, .parquet, .feather).
+        Die Zeilen werden nicht mehr im Speicher gesammelt. Beim Fortsetzen werden
+        die im Journal abgelegten Statistiken bereits exportierter Messreihen in
+        die Gesamtstatistik (campaign) übernommen.
+
+        Args:
+            path: Ausgabedatei
+            resume: Zeilen eines abgebrochenen Laufs (Journal) übernehmen
+
+        Returns:
+            Namen der bereits exportierten Messreihen
+        """
+        self.writer = StreamingResultWriter(path, list(self.results), resume=resume)
+        # Statistiken der übernommenen Messreihen gehören weiter zur Gesamtstatistik
+        for state in self.writer.resumed_states.values():
+            if state.get('statistics') is not None:
+                self.campaign.merge(SeriesStatistics.from_dict(state['statistics']))
+        return list(self.writer.completed)
+    
+    def completed_series(self) -> List[str]:
+        """Namen der beim Fortsetzen aus dem Journal übernommenen Messreihen"""
+        return list(self.writer.completed) if self.writer is not None else []
     
-    def add_measurement_series(self, name: str, stats: Dict) -> None:
+    def has_results(self) -> bool:
+        """True, wenn mindestens eine Messreihe exportiert werden kann"""
+        if self.writer is not None:
+            return self.writer.row_count + len(self._stream_pending) > 0
+        return bool(self.results['Messreihe'])
+    
+    def add_measurement_series(self, name: str, stats: Dict,
+                               statistics: Optional[SeriesStatistics] = None,
+                               samples: Optional[Dict] = None) -> None:
         """
         Fügt eine Messreihe zu den Ergebnissen hinzu.
 
+        Die Konfidenzintervalle werden erst beim Speichern für alle Messreihen
+        gemeinsam berechnet; im Streaming-Modus jeweils für STREAM_CI_BATCH
+        Messreihen, deren Zeilen bis dahin zurückgehalten werden.
+
         Args:
             name: Name der Messreihe
             stats: Dictionary mit statistischen Werten
+            statistics: Ungerundete Statistiken der Messreihe; werden in die
+                Gesamtstatistik (campaign) übernommen
+            samples: Kennwerte je Messung (YarnPulloutAnalyzer.measurement_samples()),
+                nur für Konfidenzintervalle benötigt
         """
-        self.results['Messreihe'].append(name)
-        self.results['F_max [kN]'].append(stats['max_force']['mean'])
-        self.results['F_max_std [kN]'].append(stats['max_force']['std'])
-        self.results['Mean Work [Nm]'].append(stats['work']['mean'])
-        self.results['Work_std [Nm]'].append(stats['work']['std'])
-        self.results['Force Modulus'].append(stats['modulus']['mean'])
-        self.results['Force Modulus_std'].append(stats['modulus']['std'])
+        if statistics is not None:
+            self.campaign.merge(statistics)
+        row = {
+            'Messreihe': name,
+            'F_max [kN]': stats['max_force']['mean'],
+            'F_max_std [kN]': stats['max_force']['std'],
+            'Mean Work [Nm]': stats['work']['mean'],
+            'Work_std [Nm]': stats['work']['std'],
+            'Force Modulus': stats['modulus']['mean'],
+            'Force Modulus_std': stats['modulus']['std']
+        }
+        if self.writer is not None:
+            state = {'statistics': statistics.to_dict() if statistics is not None else None}
+            if self.bootstrap is None:
+                self.writer.write_row(row, state)
+                return
+            self._stream_pending.append((row, samples, state))
+            if len(self._stream_pending) >= STREAM_CI_BATCH:
+                self._flush_stream_pending()
+            return
+        for column, value in row.items():
+            self.results[column].append(value)
+        if self.bootstrap is not None:
+            self.samples.append(samples)
+    
+    @staticmethod
+    def _interval_columns(intervals: Optional[Dict]) -> Dict:
+        """Ordnet die Konfidenzintervalle einer Messreihe den CI-Spalten zu (gerundet)"""
+        row = {}
+        for quantity, columns in CI_COLUMNS.items():
+            bounds = intervals.get(quantity) if intervals else None
+            for column, value in zip(columns, bounds or (None, None)):
+                row[column] = None if value is None or value != value else round(value, 2)
+        return row
+    
+    def _flush_stream_pending(self) -> None:
+        """Berechnet die Konfidenzintervalle der zurückgehaltenen Zeilen in einem Batch und schreibt sie"""
+        if not self._stream_pending:
+            return
+        intervals = series_confidence_intervals([samples for _, samples, _ in self._stream_pending],
+                                                self.bootstrap)
+        for (row, _, state), series_intervals in zip(self._stream_pending, intervals):
+            row.update(self._interval_columns(series_intervals))
+            self.writer.write_row(row, state)
+        self._stream_pending = []
+
+    def _fill_confidence_intervals(self) -> None:
+        """Berechnet die Konfidenzintervalle aller gesammelten Messreihen in einem Batch"""
+        rows = [self._interval_columns(intervals)
+                for intervals in series_confidence_intervals(self.samples, self.bootstrap)]
+        for columns in CI_COLUMNS.values():
+            for column in columns:
+                self.results[column] = [row[column] for row in rows]
+    
+    @staticmethod
+    def default_filename() -> str:
+        """Standard-Dateiname mit Zeitstempel"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"YarnPullout_Ergebnisse_{timestamp}.xlsx"
     
     def save_to_excel(self, save_path: Optional[Path] = None, initial_dir: Optional[Path] = None) -> Optional[Path]:
         """
         Speichert die Ergebnisse in einer Excel-Datei.
 
+        Im Streaming-Modus (start_streaming) wird stattdessen die laufende Ausgabe
+        abgeschlossen; save_path wird dann ignoriert.
+
         Args:
             save_path: Optionaler Speicherpfad. Wenn None, wird nach einem Pfad gefragt.
 
         Returns:
             Path-Objekt zum gespeicherten File oder None bei Abbruch
         """
+        if self.writer is not None:
+            self._flush_stream_pending()
+            path = self.writer.close()
+            self.writer = None
+            return path
+        
         if not save_path:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_name = f"YarnPullout_Ergebnisse_{timestamp}.xlsx"
-            save_path = FileHandler.select_save_location(default_name, "Excel",
+            from src.core.file_handler import FileHandler
+            
+            save_path = FileHandler.select_save_location(self.default_filename(), "Excel",
                                                          initial_dir=initial_dir)  # initial_dir hinzugefügt
         
         if save_path:
+            import pandas as pd
+            
+            if self.bootstrap is not None:
+                self._fill_confidence_intervals()
             df = pd.DataFrame(self.results)
             df.to_excel(save_path, index=False)
             return save_path
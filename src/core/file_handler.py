@@ -1,6 +1,4 @@
 # src/core/file_handler.py
-import tkinter as tk
-from tkinter import filedialog
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +14,8 @@ class FileHandler:
         Returns:
             '1' für Einzelanalyse, '2' für Mehrfachanalyse
         """
+        import tkinter as tk
+
         root = tk.Tk()
         root.title("Yarn Pull-Out Analyzer - Analysetyp wählen")
         
@@ -52,6 +52,9 @@ class FileHandler:
     @staticmethod
     def select_folder(title: str = "Ordner auswählen") -> Optional[Path]:
         """Öffnet einen Dialog zur Ordnerauswahl"""
+        import tkinter as tk
+        from tkinter import filedialog
+
         root = tk.Tk()
         root.withdraw()
         
@@ -62,6 +65,9 @@ class FileHandler:
     def select_save_location(default_name: str, file_type: str = "Excel", initial_dir: Optional[Path] = None) -> \
     Optional[Path]:
         """Öffnet einen Dialog zur Auswahl des Speicherorts"""
+        import tkinter as tk
+        from tkinter import filedialog
+
         root = tk.Tk()
         root.withdraw()
         
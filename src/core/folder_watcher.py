@@ -0,0 +1,126 @@
+# src/core/folder_watcher.py
+import logging
+from pathlib import Path
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
+from src.core.series_processor import find_measurement_files, IGNORED_FOLDERS
+from src.core.streaming_analyzer import StreamingResult
+
+logger = logging.getLogger('YarnPullout')
+
+
+class FolderWatcher:
+    """
+    Überwacht einen Zusammenfassungsordner per Polling auf neue Messungen.
+
+    Eine Messdatei gilt als fertig geschrieben, wenn sich Größe und mtime seit
+    settle_seconds nicht mehr geändert haben (Entprellung ohne betriebssystem-
+    spezifische Dateisystem-Events). Beim ersten Auftauchen zählt das Alter der
+    Datei bereits mit, sodass vorhandene Messungen sofort ausgewertet werden.
+
+    Jede fertige Datei wird genau einmal im Streaming-Modus analysiert; die
+    Kennwerte bleiben je Messung erhalten, damit bei einer neuen Messung nur
+    diese gelesen werden muss. Ändert sich eine Datei erneut, wird sie neu
+    analysiert, gelöschte Dateien fallen aus der Statistik heraus.
+    """
+
+    def __init__(self, root: Path, config: YarnPulloutConfig = YarnPulloutConfig(),
+                 settle_seconds: float = 5.0, clock: Callable[[], float] = time.time):
+        self.root = Path(root)
+        self.config = config
+        self.settle_seconds = settle_seconds
+        self._clock = clock
+        self._seen: Dict[Path, Tuple[Tuple[int, int], float]] = {}  # Datei -> (Fingerabdruck, letzte Änderung)
+        self._analysed: Dict[Path, Tuple[int, int]] = {}  # Fingerabdruck zum Zeitpunkt der Analyse
+        self.results: Dict[str, Dict[str, StreamingResult]] = {}  # Messreihe -> Messung -> Kennwerte
+
+    def _series_folders(self) -> List[Path]:
+        try:
+            return sorted(f for f in self.root.iterdir() if f.is_dir() and f.name not in IGNORED_FOLDERS)
+        except OSError:
+            return []
+
+    def _scan(self) -> Tuple[Dict[str, List[Path]], Set[Path]]:
+        """Ermittelt fertige, noch nicht analysierte Dateien und alle vorhandenen Dateien"""
+        now = self._clock()
+        ready: Dict[str, List[Path]] = {}
+        present = set()
+        for folder in self._series_folders():
+            try:
+                csv_paths = find_measurement_files(folder, self.config.data_ending)
+            except OSError:
+                continue  # Ordner wurde währenddessen verschoben oder gelöscht
+            for csv_path in csv_paths:
+                try:
+                    stat = csv_path.stat()
+                except OSError:
+                    continue
+                present.add(csv_path)
+                fingerprint = (stat.st_size, stat.st_mtime_ns)
+                previous = self._seen.get(csv_path)
+                if previous is None:
+                    changed_at = min(now, stat.st_mtime_ns / 1e9)  # Dateialter zählt als Ruhezeit
+                    self._seen[csv_path] = (fingerprint, changed_at)
+                elif previous[0] != fingerprint:
+                    self._seen[csv_path] = (fingerprint, now)
+                    continue
+                _, changed_at = self._seen[csv_path]
+                if (stat.st_size > 0 and now - changed_at >= self.settle_seconds
+                        and self._analysed.get(csv_path) != fingerprint):
+                    ready.setdefault(folder.name, []).append(csv_path)
+        return ready, present
+
+    def update(self) -> List[str]:
+        """
+        Führt einen Polling-Durchlauf aus und analysiert alle fertigen neuen Messungen.
+
+        Returns:
+            Namen der Messreihen, deren Kennwerte sich geändert haben
+        """
+        ready, present = self._scan()
+        changed = set()
+
+        for path in [p for p in self._seen if p not in present]:
+            del self._seen[path]
+            self._analysed.pop(path, None)
+            series = path.parent.parent.name
+            if self.results.get(series, {}).pop(path.parent.name, None) is not None:
+                changed.add(series)
+                if not self.results[series]:
+                    del self.results[series]
+
+        for series, csv_paths in ready.items():
+            analyzer = YarnPulloutAnalyzer(self.config)
+            for csv_path in csv_paths:
+                self._analysed[csv_path] = self._seen[csv_path][0]
+                try:
+                    result = analyzer.stream_measurement(csv_path)
+                except Exception as e:
+                    # Nicht erneut versuchen, bis sich die Datei wieder ändert
+                    logger.error(f"Fehler beim Analysieren von {csv_path}: {str(e)}")
+                    continue
+                self.results.setdefault(series, {})[analyzer.measurement_name(csv_path)] = result
+                changed.add(series)
+        return sorted(changed)
+
+    def series_analyzer(self, series: str) -> Optional[YarnPulloutAnalyzer]:
+        """
+        Baut einen Analyzer mit den Kennwerten aller Messungen einer Messreihe auf.
+
+        Args:
+            series: Name der Messreihe
+
+        Returns:
+            Analyzer mit berechneten Statistiken oder None, falls keine Messungen vorliegen
+        """
+        measurements = self.results.get(series)
+        if not measurements:
+            return None
+        analyzer = YarnPulloutAnalyzer(self.config)
+        for name in sorted(measurements):
+            analyzer.add_streaming_result(measurements[name], name)
+        analyzer.calculate_force_modulus()
+        analyzer.calculate_work()
+        analyzer.calculate_statistics()
+        return analyzer
@@ -0,0 +1,301 @@
+# src/core/instrumentation.py
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, Optional
+
+# Stufen der Pipeline (Reihenfolge im Bericht)
+STAGES = ("folder_discovery", "csv_load", "modulus", "work", "statistics",
+          "plot_render", "png_write", "excel_write")
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """
+    Höchster Speicherverbrauch (RSS) des aktuellen Prozesses seit dem Start.
+
+    Returns:
+        Bytes oder None, falls auf dieser Plattform nicht ermittelbar
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024  # Linux: kB, macOS: Bytes
+    try:
+        import psutil
+        return getattr(psutil.Process().memory_info(), 'peak_wset', None)
+    except ImportError:
+        return None
+
+
+class _NullStage:
+    """Messpunkt ohne Wirkung (Instrumentierung deaktiviert)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, bytes_read: int = 0, rows: int = 0) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class NullInstrumentation:
+    """Standard ohne Messung; alle Aufrufe sind nahezu kostenlos"""
+
+    enabled = False
+    current_series = None
+
+    def stage(self, name: str) -> _NullStage:
+        return _NULL_STAGE
+
+    def series(self, name: str) -> _NullStage:
+        return _NULL_STAGE
+
+    def attach(self, name: Optional[str]) -> _NullStage:
+        return _NULL_STAGE
+
+    def series_metrics(self, name: str) -> Optional[Dict]:
+        return None
+
+    def merge_series(self, name: str, metrics: Optional[Dict]) -> None:
+        pass
+
+
+class _StageTimer:
+    """Misst Wandzeit und CPU-Zeit (des aktuellen Threads) einer Stufe"""
+
+    __slots__ = ('owner', 'name', 'series', 'bytes_read', 'rows', 'wall', 'cpu')
+
+    def __init__(self, owner: 'RunInstrumentation', name: str):
+        self.owner = owner
+        self.name = name
+        self.series = owner.current_series
+        self.bytes_read = 0
+        self.rows = 0
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.owner._record(self.series, self.name, time.perf_counter() - self.wall,
+                           time.thread_time() - self.cpu, self.bytes_read, self.rows)
+        return False
+
+    def add(self, bytes_read: int = 0, rows: int = 0) -> None:
+        """Zählt gelesene Bytes und geparste Zeilen zur Stufe hinzu"""
+        self.bytes_read += bytes_read
+        self.rows += rows
+
+
+class _SeriesAttachment:
+    """Ordnet die Stufen des aktuellen Threads einer Messreihe zu, ohne ihre Zeit erneut zu zählen"""
+
+    def __init__(self, owner: 'RunInstrumentation', name: Optional[str]):
+        self.owner = owner
+        self.name = name
+
+    def __enter__(self):
+        self.previous = self.owner.current_series
+        self.owner.current_series = self.name
+        return self
+
+    def __exit__(self, *exc):
+        self.owner.current_series = self.previous
+        return False
+
+
+class _SeriesScope:
+    """Ordnet alle Stufen innerhalb des Blocks (im aktuellen Thread) einer Messreihe zu"""
+
+    def __init__(self, owner: 'RunInstrumentation', name: str):
+        self.owner = owner
+        self.name = name
+
+    def __enter__(self):
+        self.previous = self.owner.current_series
+        self.owner.current_series = self.name
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        with self.owner._lock:
+            entry = self.owner._series_entry(self.name)
+            entry['wall_seconds'] += time.perf_counter() - self.wall
+            # Höchststand des ganzen Prozesses bis zum Ende der Messreihe, kein Verbrauch der Messreihe
+            entry['process_peak_rss_bytes'] = peak_memory_bytes()
+            entry['pid'] = os.getpid()
+        self.owner.current_series = self.previous
+        return False
+
+
+def _empty_stage() -> Dict:
+    return {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'bytes_read': 0, 'rows': 0}
+
+
+class RunInstrumentation:
+    """
+    Sammelt Laufzeiten und Ressourcenverbrauch je Stufe und Messreihe.
+
+    Stufen werden mit `with instrumentation.stage("csv_load") as stage:` gemessen
+    (Wandzeit, CPU-Zeit des Threads, optional gelesene Bytes und Zeilen). Innerhalb
+    von `instrumentation.series(name)` werden sie zusätzlich der Messreihe
+    zugeordnet. Die Zuordnung gilt je Thread; Hilfsthreads einer Messreihe
+    übernehmen sie mit `instrumentation.attach(name)`. Messwerte aus
+    Worker-Prozessen werden mit series_metrics() abgegeben und im Hauptprozess
+    mit merge_series() übernommen.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.started = datetime.now()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._lock = threading.Lock()
+        self._local = threading.local()  # aktuelle Messreihe je Thread
+        self.stages: Dict[str, Dict] = {}
+        self.series_data: Dict[str, Dict] = {}
+
+    @property
+    def current_series(self) -> Optional[str]:
+        return getattr(self._local, 'series', None)
+
+    @current_series.setter
+    def current_series(self, name: Optional[str]) -> None:
+        self._local.series = name
+
+    def stage(self, name: str) -> _StageTimer:
+        return _StageTimer(self, name)
+
+    def series(self, name: str) -> _SeriesScope:
+        return _SeriesScope(self, name)
+
+    def attach(self, name: Optional[str]) -> _SeriesAttachment:
+        """Übernimmt die Messreihe eines anderen Threads (z.B. in einem Lese-Thread)"""
+        return _SeriesAttachment(self, name)
+
+    def _series_entry(self, name: str) -> Dict:
+        if name not in self.series_data:
+            self.series_data[name] = {'wall_seconds': 0.0, 'process_peak_rss_bytes': None, 'pid': None,
+                                      'stages': {}}
+        return self.series_data[name]
+
+    @staticmethod
+    def _accumulate(target: Dict, values: Dict) -> None:
+        for key, value in values.items():
+            target[key] += value
+
+    def _record(self, series: Optional[str], name: str, wall: float, cpu: float,
+                bytes_read: int, rows: int) -> None:
+        values = {'calls': 1, 'wall_seconds': wall, 'cpu_seconds': cpu, 'bytes_read': bytes_read, 'rows': rows}
+        with self._lock:
+            self._accumulate(self.stages.setdefault(name, _empty_stage()), values)
+            if series is not None:
+                stages = self._series_entry(series)['stages']
+                self._accumulate(stages.setdefault(name, _empty_stage()), values)
+
+    def series_metrics(self, name: str) -> Optional[Dict]:
+        """
+        Gibt die Messwerte einer Messreihe ab (z.B. zur Rückgabe aus einem Worker).
+
+        Die Werte werden dabei aus dieser Instanz entfernt, damit sie nach dem
+        Zusammenführen nicht doppelt gezählt werden.
+        """
+        with self._lock:
+            metrics = self.series_data.pop(name, None)
+            if metrics is not None:
+                for stage, values in metrics['stages'].items():
+                    for key, value in values.items():
+                        self.stages[stage][key] -= value
+        return metrics
+
+    def merge_series(self, name: str, metrics: Optional[Dict]) -> None:
+        """Übernimmt die Messwerte einer Messreihe aus einem anderen Prozess"""
+        if not metrics:
+            return
+        with self._lock:
+            entry = self._series_entry(name)
+            entry['wall_seconds'] += metrics['wall_seconds']
+            peak = metrics['process_peak_rss_bytes']
+            if entry['process_peak_rss_bytes'] is None or (peak or 0) > entry['process_peak_rss_bytes']:
+                entry['process_peak_rss_bytes'] = peak  # Prozess mit dem höchsten Verbrauch
+                entry['pid'] = metrics['pid']
+            for stage, values in metrics['stages'].items():
+                self._accumulate(entry['stages'].setdefault(stage, _empty_stage()), values)
+                self._accumulate(self.stages.setdefault(stage, _empty_stage()), values)
+
+    def report(self, **info) -> Dict:
+        """
+        Erstellt den Laufbericht.
+
+        Args:
+            **info: Zusätzliche Angaben zum Lauf (z.B. Modus, Eingabeordner)
+
+        Returns:
+            JSON-fähiges Dictionary
+        """
+        ordered = sorted(self.stages, key=lambda s: STAGES.index(s) if s in STAGES else len(STAGES))
+        return {
+            'run': {
+                **{key: str(value) if isinstance(value, Path) else value for key, value in info.items()},
+                'started': self.started.isoformat(timespec='seconds'),
+                'wall_seconds': time.perf_counter() - self._wall_start,
+                'cpu_seconds': time.process_time() - self._cpu_start,
+                'peak_rss_bytes': peak_memory_bytes(),
+            },
+            'stages': {stage: self.stages[stage] for stage in ordered},
+            'series': self.series_data,
+        }
+
+    def write_report(self, path: Path, **info) -> Path:
+        """Schreibt den Laufbericht als JSON-Datei"""
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.report(**info), file, indent=2)
+        return path
+
+
+_current = NullInstrumentation()
+
+
+def get_instrumentation():
+    """Aktive Instrumentierung des Prozesses (standardmäßig ohne Messung)"""
+    return _current
+
+
+def instrumented(stage_name: str) -> Callable:
+    """Decorator: misst jeden Aufruf der Funktion als Stufe stage_name"""
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with _current.stage(stage_name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable_instrumentation() -> RunInstrumentation:
+    """Aktiviert eine neue Instrumentierung für den aktuellen Prozess"""
+    global _current
+    _current = RunInstrumentation()
+    return _current
+
+
+def disable_instrumentation() -> None:
+    """Deaktiviert die Instrumentierung wieder"""
+    global _current
+    _current = NullInstrumentation()
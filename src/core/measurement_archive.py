@@ -0,0 +1,237 @@
+# src/core/measurement_archive.py
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
+from src.core.measurement_store import MeasurementStore
+from src.core.run_manifest import RunManifest
+from src.core.series_processor import find_measurement_files, IGNORED_FOLDERS
+
+logger = logging.getLogger('YarnPullout')
+
+ARCHIVE_VERSION = 1
+INDEX_NAME = "index.json"
+DISPLACEMENT_NAME = "displacement.bin"
+FORCE_NAME = "force.bin"
+DEFAULT_ARCHIVE_NAME = "yarn_pullout_archive"  # Standardordner im Zusammenfassungsordner
+
+
+class MeasurementArchive:
+    """
+    Kompaktes Binärarchiv der normalisierten Messdaten eines Zusammenfassungsordners.
+
+    Das Archiv ist ein Ordner mit zwei Rohdateien (Weg und Kraft aller Messungen
+    hintereinander, float32 oder float64) und einer index.json mit Messreihen,
+    Messungsnamen, Offsets und den Fingerabdrücken (Größe, mtime) der
+    Quelldateien. Die Daten werden mit np.memmap geöffnet; eine Messreihe liegt
+    zusammenhängend im Archiv und wird ohne Kopie als MeasurementStore übergeben.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path / INDEX_NAME, 'r', encoding='utf-8') as file:
+            index = json.load(file)
+        if index.get('version') != ARCHIVE_VERSION:
+            raise ValueError(f"Archiv {self.path} hat eine nicht unterstützte Version")
+        self.dtype = np.dtype(index['dtype'])
+        self.data_ending: str = index['data_ending']
+        self.series: Dict[str, Dict] = index['series']
+        self.total_points: int = index['total_points']
+        self._displacement: Optional[np.ndarray] = None
+        self._force: Optional[np.ndarray] = None
+
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Öffnet die Datendateien beim ersten Zugriff als memmap"""
+        if self._displacement is None:
+            if self.total_points == 0:
+                self._displacement = self._force = np.empty(0, dtype=self.dtype)
+            else:
+                self._displacement = np.memmap(self.path / DISPLACEMENT_NAME, dtype=self.dtype, mode='r',
+                                               shape=(self.total_points,))
+                self._force = np.memmap(self.path / FORCE_NAME, dtype=self.dtype, mode='r',
+                                        shape=(self.total_points,))
+        return self._displacement, self._force
+
+    def close(self) -> None:
+        """Gibt die Speicherabbildungen frei (Views bleiben bis zu ihrer Freigabe gültig)"""
+        self._displacement = self._force = None
+
+    def series_names(self) -> List[str]:
+        return list(self.series)
+
+    def measurement_names(self, series: str) -> List[str]:
+        return [measurement['name'] for measurement in self.series[series]['measurements']]
+
+    def series_inputs(self, series: str) -> Dict[str, List[int]]:
+        """Fingerabdrücke der Quelldateien einer Messreihe beim Import"""
+        return {measurement['source']: measurement['fingerprint']
+                for measurement in self.series[series]['measurements']}
+
+    def is_current(self, series: str, folder: Path) -> bool:
+        """
+        Prüft, ob die Messreihe im Archiv dem aktuellen Stand der CSV-Dateien entspricht.
+
+        Args:
+            series: Name der Messreihe
+            folder: Ordner der Messreihe mit den Quelldateien
+
+        Returns:
+            True, wenn keine Quelldatei hinzugekommen, geändert oder entfernt wurde
+        """
+        if series not in self.series:
+            return False
+        return RunManifest.fingerprint_inputs(folder, self.data_ending) == self.series_inputs(series)
+
+    def load_series(self, series: str) -> Tuple[MeasurementStore, List[str]]:
+        """
+        Liefert die Messdaten einer Messreihe ohne Kopie.
+
+        Args:
+            series: Name der Messreihe
+
+        Returns:
+            Tupel (MeasurementStore über dem memmap, Namen der Messungen)
+        """
+        entry = self.series[series]
+        lengths = [measurement['length'] for measurement in entry['measurements']]
+        offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+        start, stop = entry['offset'], entry['offset'] + int(offsets[-1])
+        displacement, force = self._columns()
+        store = MeasurementStore.from_arrays(displacement[start:stop], force[start:stop], offsets)
+        return store, self.measurement_names(series)
+
+
+# Geöffnete Archive je Prozess (Index nur einmal lesen)
+_open_archives: Dict[Tuple[str, int], MeasurementArchive] = {}
+
+
+def open_archive(path: Path) -> MeasurementArchive:
+    """
+    Öffnet ein Archiv und hält es für weitere Zugriffe im Prozess offen.
+
+    Wird das Archiv neu geschrieben, ändert sich die mtime des Index und es
+    wird neu geöffnet.
+    """
+    path = Path(path)
+    key = (str(path.resolve()), (path / INDEX_NAME).stat().st_mtime_ns)
+    if key not in _open_archives:
+        for stale in [k for k in _open_archives if k[0] == key[0]]:
+            _open_archives.pop(stale).close()
+        _open_archives[key] = MeasurementArchive(path)
+    return _open_archives[key]
+
+
+def _archive_series(folder: Path, previous: Optional[MeasurementArchive], analyzer: YarnPulloutAnalyzer,
+                    dtype: np.dtype, files: Tuple, counts: Dict[str, int],
+                    progress: Callable[[str], None]) -> List[Dict]:
+    """Schreibt die Messungen einer Messreihe an das Ende der Datendateien und liefert ihre Indexeinträge"""
+    data_ending = analyzer.config.data_ending
+    old_entries = {}
+    if previous is not None and folder.name in previous.series:
+        old_store, _ = previous.load_series(folder.name)
+        for i, measurement in enumerate(previous.series[folder.name]['measurements']):
+            old_entries[measurement['source']] = (measurement['fingerprint'], old_store[i])
+
+    inputs = RunManifest.fingerprint_inputs(folder, data_ending)
+    measurements = []
+    for csv_path in sorted(find_measurement_files(folder, data_ending)):
+        source = csv_path.relative_to(folder).as_posix()
+        if source not in inputs:
+            continue  # Messordner ohne Messdatei
+        old = old_entries.get(source)
+        if old is not None and old[0] == inputs[source]:
+            displacement, force = old[1]
+            counts['reused'] += 1
+        else:
+            try:
+                displacement, force = analyzer.read_measurement(csv_path)
+            except Exception as e:
+                progress(f"Fehler beim Import von {csv_path}: {str(e)}")
+                continue
+            counts['parsed'] += 1
+        np.ascontiguousarray(displacement, dtype=dtype).tofile(files[0])
+        np.ascontiguousarray(force, dtype=dtype).tofile(files[1])
+        measurements.append({'name': analyzer.measurement_name(csv_path), 'source': source,
+                             'length': int(len(displacement)), 'fingerprint': inputs[source]})
+    return measurements
+
+
+def build_archive(summary_folder: Path, archive_path: Path,
+                  config: YarnPulloutConfig = YarnPulloutConfig(),
+                  progress: Callable[[str], None] = logger.info) -> MeasurementArchive:
+    """
+    Importiert alle Messungen eines Zusammenfassungsordners in ein Archiv.
+
+    Messungen, die im bisherigen Archiv mit gleichem Fingerabdruck vorliegen,
+    werden daraus übernommen statt neu geparst. Das neue Archiv wird in einem
+    temporären Ordner erstellt und ersetzt das alte erst am Ende.
+
+    Args:
+        summary_folder: Zusammenfassungsordner mit den Messreihen
+        archive_path: Zielordner des Archivs
+        config: Konfiguration (storage_dtype bestimmt den Datentyp des Archivs)
+        progress: Ausgabe der Fortschrittsmeldungen
+
+    Returns:
+        Das geöffnete neue Archiv
+    """
+    summary_folder = Path(summary_folder)
+    archive_path = Path(archive_path)
+    dtype = np.dtype(config.storage_dtype)
+    # Das Archiv enthält immer die vollständigen Messungen
+    analyzer = YarnPulloutAnalyzer(YarnPulloutConfig(data_ending=config.data_ending,
+                                                     storage_dtype=config.storage_dtype))
+
+    previous = None
+    if (archive_path / INDEX_NAME).exists():
+        try:
+            previous = MeasurementArchive(archive_path)
+            if previous.dtype != dtype or previous.data_ending != config.data_ending:
+                previous = None
+        except (OSError, ValueError, KeyError) as e:
+            progress(f"Bisheriges Archiv nicht lesbar, wird neu erstellt: {str(e)}")
+
+    # Liegt das Archiv im Zusammenfassungsordner, gehören es und seine Zwischenstände nicht dazu
+    excluded = set(IGNORED_FOLDERS)
+    if archive_path.parent.resolve() == summary_folder.resolve():
+        excluded |= {archive_path.name, archive_path.name + ".partial", archive_path.name + ".old"}
+    series_folders = sorted(f for f in summary_folder.iterdir() if f.is_dir() and f.name not in excluded)
+
+    temp_path = archive_path.with_name(archive_path.name + ".partial")
+    shutil.rmtree(temp_path, ignore_errors=True)
+    temp_path.mkdir(parents=True)
+
+    series_index: Dict[str, Dict] = {}
+    position = 0
+    counts = {'parsed': 0, 'reused': 0}
+    with open(temp_path / DISPLACEMENT_NAME, 'wb') as displacement_file, \
+            open(temp_path / FORCE_NAME, 'wb') as force_file:
+        for folder in series_folders:
+            measurements = _archive_series(folder, previous, analyzer, dtype, (displacement_file, force_file),
+                                           counts, progress)
+            if measurements:
+                series_index[folder.name] = {'offset': position, 'measurements': measurements}
+                position += sum(measurement['length'] for measurement in measurements)
+                progress(f"Archiviert: {folder.name} ({len(measurements)} Messungen)")
+
+    with open(temp_path / INDEX_NAME, 'w', encoding='utf-8') as file:
+        json.dump({'version': ARCHIVE_VERSION, 'dtype': dtype.name, 'data_ending': config.data_ending,
+                   'total_points': position, 'series': series_index}, file, indent=1)
+
+    # Altes Archiv erst nach dem vollständigen Schreiben ersetzen
+    if previous is not None:
+        previous.close()
+        previous = None
+    old_path = archive_path.with_name(archive_path.name + ".old")
+    if archive_path.exists():
+        shutil.rmtree(old_path, ignore_errors=True)
+        os.replace(archive_path, old_path)
+    os.replace(temp_path, archive_path)
+    shutil.rmtree(old_path, ignore_errors=True)
+    progress(f"Archiv gespeichert: {archive_path} ({counts['parsed']} Messungen importiert, "
+             f"{counts['reused']} übernommen)")
+    return MeasurementArchive(archive_path)
@@ -0,0 +1,120 @@
+# src/core/measurement_cache.py
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+import numpy as np
+from typing import List, Optional, Tuple
+
+
+class MeasurementCache:
+    """
+    Persistenter Cache für normalisierte Weg-/Kraftdaten.
+
+    Jede geparste CSV-Datei wird als .npz-Datei im Cache-Verzeichnis abgelegt.
+    Der Schlüssel setzt sich aus Pfad, Dateigröße, Änderungszeit und dem
+    Fingerabdruck der Leseparameter (YarnPulloutConfig.parse_fingerprint)
+    zusammen; ändert sich eines davon, wird die Datei neu geparst.
+    Überschreitet der Cache sein Größenbudget, werden die am längsten nicht
+    genutzten Einträge gelöscht (LRU über die mtime).
+    """
+
+    SUFFIX = ".npz"
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger('YarnPullout')
+        self._lock = threading.Lock()
+        # Laufende Gesamtgröße; das Verzeichnis wird nur bei Überschreiten
+        # des Budgets erneut durchsucht
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    def _entry_path(self, filepath: Path, fingerprint: str) -> Path:
+        """Ermittelt den Cache-Eintrag für den aktuellen Dateistand"""
+        stat = filepath.stat()
+        key = f"{filepath.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{fingerprint}"
+        return self.cache_dir / (hashlib.sha1(key.encode('utf-8')).hexdigest() + self.SUFFIX)
+
+    def get(self, filepath: Path, fingerprint: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Liest die Messdaten aus dem Cache.
+
+        Args:
+            filepath: Pfad zur ursprünglichen CSV-Datei
+            fingerprint: Fingerabdruck der Leseparameter
+
+        Returns:
+            Tupel (Weg, Kraft) oder None, falls kein gültiger Eintrag existiert
+        """
+        try:
+            entry = self._entry_path(filepath, fingerprint)
+            with np.load(entry) as data:
+                displacement, force = data['displacement'], data['force']
+            os.utime(entry)  # Zugriff für LRU vermerken
+            return displacement, force
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def put(self, filepath: Path, fingerprint: str, displacement: np.ndarray, force: np.ndarray) -> None:
+        """
+        Legt die Messdaten im Cache ab und räumt bei Bedarf alte Einträge ab.
+
+        Args:
+            filepath: Pfad zur ursprünglichen CSV-Datei
+            fingerprint: Fingerabdruck der Leseparameter
+            displacement: Normalisierte Wegwerte
+            force: Normalisierte Kraftwerte
+        """
+        try:
+            entry = self._entry_path(filepath, fingerprint)
+            temp_path = entry.with_name(f"{entry.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, 'wb') as file:
+                np.savez(file, displacement=displacement, force=force)
+            size = os.path.getsize(temp_path)
+            try:
+                replaced = os.path.getsize(entry)
+            except OSError:
+                replaced = 0
+            os.replace(temp_path, entry)  # atomar, auch bei parallelen Läufen
+            with self._lock:
+                self._total_bytes += size - replaced
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            self.logger.warning(f"Cache-Eintrag für {filepath} konnte nicht geschrieben werden: {str(e)}")
+
+    def _scan(self) -> List[Tuple[int, int, str]]:
+        """Alle Einträge als (mtime, Größe, Pfad)"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(self.SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # von einem parallelen Lauf gelöscht
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Löscht die am längsten nicht genutzten Einträge bis das Budget eingehalten ist"""
+        entries = self._scan()  # aktueller Stand, auch mit Einträgen paralleler Läufe
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Entfernt alle Cache-Einträge"""
+        for entry in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            entry.unlink(missing_ok=True)
+        with self._lock:
+            self._total_bytes = 0
@@ -0,0 +1,168 @@
+# src/core/measurement_store.py
+from collections.abc import Sequence
+import numpy as np
+from typing import Iterator, Tuple, Dict, Union
+
+
+class MeasurementStore:
+    """
+    Spaltenweiser Speicher für die Weg-/Kraftdaten mehrerer Messungen.
+
+    Alle Messungen liegen hintereinander in zwei zusammenhängenden Arrays
+    (Weg in mm, Kraft in kN). Die Grenzen der einzelnen Messungen werden
+    über Offsets abgebildet (ragged layout): Messung i umfasst die Indizes
+    offsets[i] bis offsets[i + 1].
+    """
+
+    def __init__(self, dtype: Union[str, np.dtype] = np.float64, capacity: int = 0):
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.dtype(np.float64), np.dtype(np.float32)):
+            raise ValueError(f"Nicht unterstützter Datentyp für Messdaten: {self.dtype}")
+        self._displacement = np.empty(capacity, dtype=self.dtype)
+        self._force = np.empty(capacity, dtype=self.dtype)
+        self._offsets = [0]
+        self._size = 0
+
+    @classmethod
+    def from_arrays(cls, displacement: np.ndarray, force: np.ndarray, offsets: np.ndarray) -> 'MeasurementStore':
+        """
+        Erstellt einen Speicher über bereits vorhandenen Arrays, ohne sie zu kopieren.
+
+        Die Arrays (z.B. Ausschnitte eines np.memmap) werden direkt übernommen;
+        erst ein späteres append() legt neue Puffer an.
+
+        Args:
+            displacement: Wegwerte aller Messungen hintereinander
+            force: Kraftwerte aller Messungen hintereinander
+            offsets: Grenzen der Messungen (Länge: Anzahl Messungen + 1, beginnend bei 0)
+
+        Returns:
+            MeasurementStore mit den übergebenen Daten
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if displacement.ndim != 1 or displacement.shape != force.shape or displacement.dtype != force.dtype:
+            raise ValueError("Weg- und Kraftwerte müssen eindimensional, gleich lang und gleich typisiert sein")
+        if offsets.ndim != 1 or offsets.size == 0 or offsets[0] != 0 or offsets[-1] != displacement.shape[0] \
+                or np.any(np.diff(offsets) < 0):
+            raise ValueError("Ungültige Offsets für die übergebenen Messdaten")
+        store = cls(displacement.dtype)
+        store._displacement = displacement
+        store._force = force
+        store._offsets = offsets.tolist()
+        store._size = displacement.shape[0]
+        return store
+
+    def _reserve(self, required: int) -> None:
+        """Vergrößert die Puffer bei Bedarf (amortisiert durch Verdopplung)"""
+        capacity = self._displacement.shape[0]
+        if required <= capacity:
+            return
+        new_capacity = max(required, 2 * capacity, 1024)
+        for name in ('_displacement', '_force'):
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=self.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def append(self, displacement: np.ndarray, force: np.ndarray) -> int:
+        """
+        Hängt eine Messung an den Speicher an.
+
+        Args:
+            displacement: Wegwerte in mm
+            force: Kraftwerte in kN
+
+        Returns:
+            Index der neuen Messung
+        """
+        displacement = np.asarray(displacement)
+        force = np.asarray(force)
+        if displacement.ndim != 1 or displacement.shape != force.shape:
+            raise ValueError("Weg- und Kraftwerte müssen eindimensional und gleich lang sein")
+
+        count = displacement.shape[0]
+        self._reserve(self._size + count)
+        self._displacement[self._size:self._size + count] = displacement
+        self._force[self._size:self._size + count] = force
+        self._size += count
+        self._offsets.append(self._size)
+        return len(self._offsets) - 2
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Gibt (Weg, Kraft) der Messung als schreibgeschützte Views zurück"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Messungsindex außerhalb des gültigen Bereichs")
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        return (self._readonly(self._displacement[start:stop]),
+                self._readonly(self._force[start:stop]))
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @staticmethod
+    def _readonly(array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def displacement(self) -> np.ndarray:
+        """Alle Wegwerte aller Messungen als zusammenhängender View"""
+        return self._readonly(self._displacement[:self._size])
+
+    @property
+    def force(self) -> np.ndarray:
+        """Alle Kraftwerte aller Messungen als zusammenhängender View"""
+        return self._readonly(self._force[:self._size])
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Start-/Endoffsets der Messungen (Länge: Anzahl Messungen + 1)"""
+        return np.asarray(self._offsets, dtype=np.int64)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Anzahl der Datenpunkte pro Messung"""
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """Belegter Speicher der Nutzdaten in Bytes"""
+        return 2 * self._size * self.dtype.itemsize
+
+    def as_tuples(self) -> 'MeasurementTupleView':
+        """Schreibgeschützte Tupel-Sicht für bestehenden Code"""
+        return MeasurementTupleView(self)
+
+
+class MeasurementTupleView(Sequence):
+    """
+    Schreibgeschützte Sicht auf einen MeasurementStore im alten Format.
+
+    Jede Messung erscheint als Tupel von (Weg, Kraft)-Tupeln, wie früher
+    List[List[Tuple[float, float]]]. Die Tupel werden erst beim Zugriff
+    erzeugt und danach zwischengespeichert.
+    """
+
+    def __init__(self, store: MeasurementStore):
+        self._store = store
+        self._cache: Dict[int, Tuple[Tuple[float, float], ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index not in self._cache:
+            displacement, force = self._store[index]
+            self._cache[index] = tuple(zip(displacement.tolist(), force.tolist()))
+        return self._cache[index]
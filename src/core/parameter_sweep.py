@@ -0,0 +1,199 @@
+# src/core/parameter_sweep.py
+from dataclasses import dataclass, replace
+from datetime import datetime
+import logging
+import os
+from pathlib import Path
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence
+from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
+from src.core.debug_printer import DebugPrinter
+from src.core.instrumentation import get_instrumentation
+from src.core.measurement_cache import MeasurementCache
+from src.core.series_processor import process_measurement_series, IGNORED_FOLDERS
+
+logger = logging.getLogger('YarnPullout')
+
+# Spalten der Sweep-Tabelle (eine Zeile je Messreihe und Parameterkombination)
+SWEEP_COLUMNS = ('series', 'force_threshold_low', 'force_threshold_high', 'distance_limit', 'modulus_method',
+                 'measurements', 'max_force_mean', 'max_force_std',
+                 'work_count', 'work_mean', 'work_std',
+                 'modulus_failed', 'modulus_mean', 'modulus_std')
+
+
+@dataclass
+class SweepGrid:
+    """Raster der untersuchten Parameter; ausgewertet wird jede Kombination"""
+    force_threshold_low: Sequence[float]
+    force_threshold_high: Sequence[float]
+    distance_limit: Sequence[float]
+
+    @classmethod
+    def from_config(cls, config: YarnPulloutConfig, force_threshold_low: Optional[Sequence[float]] = None,
+                    force_threshold_high: Optional[Sequence[float]] = None,
+                    distance_limit: Optional[Sequence[float]] = None) -> 'SweepGrid':
+        """Nicht angegebene Raster bestehen nur aus dem Wert der Konfiguration"""
+        return cls(list(force_threshold_low or [config.force_threshold_low]),
+                   list(force_threshold_high or [config.force_threshold_high]),
+                   list(distance_limit or [config.distance_limit]))
+
+    @property
+    def combinations(self) -> int:
+        return len(self.force_threshold_low) * len(self.force_threshold_high) * len(self.distance_limit)
+
+
+def _column_statistics(values: np.ndarray, decimals: Optional[int]) -> tuple:
+    """Anzahl, Mittelwert und Standardabweichung (wie np.std) je Spalte, NaN-Werte ausgenommen"""
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=0)
+    filled = np.where(valid, values, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = filled.sum(axis=0) / count
+        std = np.sqrt(np.where(valid, (values - mean) ** 2, 0.0).sum(axis=0) / count)
+    if decimals is not None:
+        mean, std = np.round(mean, decimals), np.round(std, decimals)
+    return count, mean, std
+
+
+def sweep_analyzer(analyzer: YarnPulloutAnalyzer, grid: SweepGrid,
+                   decimals: Optional[int] = 2) -> Dict[str, np.ndarray]:
+    """
+    Wertet alle Parameterkombinationen für die geladenen Messungen eines Analyzers aus.
+
+    Die Schwellpunkte aller Anteile werden je Messung mit einer Binärsuche im
+    CurveIndex bestimmt und die Moduln aller Schwellwert-Paare gemeinsam
+    berechnet; die Arbeit wird je Grenze für alle Messungen in einem Aufruf
+    ermittelt. Die Kennwerte folgen calculate_force_modulus und calculate_work:
+    nicht berechenbare Moduln gehen als 0.0 ein, Messungen ohne Punkte bis zur
+    Grenze werden bei der Arbeit übersprungen, Einzelwerte werden vor der
+    Statistik auf zwei Nachkommastellen gerundet.
+
+    Args:
+        analyzer: Analyzer mit geladenen Messdaten (nicht im Streaming-Modus)
+        grid: Parameterraster
+        decimals: Nachkommastellen der Statistiken (None = volle Genauigkeit)
+
+    Returns:
+        Spalten der Sweep-Tabelle ohne 'series', Reihenfolge: low, high, distance
+    """
+    config = analyzer.config
+    low = np.asarray(grid.force_threshold_low, dtype=np.float64)
+    high = np.asarray(grid.force_threshold_high, dtype=np.float64)
+    distance = np.asarray(grid.distance_limit, dtype=np.float64)
+    index = analyzer.curve_index
+
+    moduli = index.modulus_table(low, high, config.modulus_method)  # (Messungen, low, high)
+    failed = np.isnan(moduli).sum(axis=0).reshape(-1)
+    moduli = np.where(np.isnan(moduli), 0.0, np.round(moduli, 2))
+    _, modulus_mean, modulus_std = _column_statistics(moduli.reshape(len(index), -1), decimals)
+
+    work = index.work_table(distance, interpolate=config.interpolate_work_cutoff)
+    work_count, work_mean, work_std = _column_statistics(np.round(work, 2), decimals)
+
+    max_force = np.asarray(analyzer.max_forces, dtype=np.float64)[:, None]
+    _, max_force_mean, max_force_std = _column_statistics(max_force, decimals)
+
+    # Kartesisches Produkt: Modul hängt von (low, high), Arbeit nur von distance ab
+    pairs, limits = np.meshgrid(np.arange(low.size * high.size), np.arange(distance.size), indexing='ij')
+    pairs, limits = pairs.ravel(), limits.ravel()
+    rows = pairs.size
+    return {
+        'force_threshold_low': low[pairs // high.size],
+        'force_threshold_high': high[pairs % high.size],
+        'distance_limit': distance[limits],
+        'modulus_method': np.full(rows, config.modulus_method),
+        'measurements': np.full(rows, len(index), dtype=np.int64),
+        'max_force_mean': np.full(rows, max_force_mean[0]),
+        'max_force_std': np.full(rows, max_force_std[0]),
+        'work_count': work_count[limits].astype(np.int64),
+        'work_mean': work_mean[limits],
+        'work_std': work_std[limits],
+        'modulus_failed': failed[pairs].astype(np.int64),
+        'modulus_mean': modulus_mean[pairs],
+        'modulus_std': modulus_std[pairs],
+    }
+
+
+def run_sweep(input_folder: Path, grid: SweepGrid, config: YarnPulloutConfig = YarnPulloutConfig(),
+              debug_printer: Optional[DebugPrinter] = None, cache: Optional[MeasurementCache] = None,
+              load_workers: int = 1, single: bool = False,
+              progress: Callable[[str], None] = logger.info) -> Dict[str, np.ndarray]:
+    """
+    Lädt jede Messreihe einmal und wertet alle Parameterkombinationen aus.
+
+    Geladen wird wie in der normalen Analyse (Binärarchiv und Messdaten-Cache
+    werden genutzt). Streaming ist abgeschaltet, da der Sweep die vollständigen
+    Kurven braucht; beim bereichsbegrenzten Lesen wird bis zur größten Grenze
+    des Rasters gelesen.
+
+    Args:
+        input_folder: Zusammenfassungsordner bzw. Messreihe (single)
+        grid: Parameterraster
+        config: Basiskonfiguration (Dateiendung, Modulmethode, Cache, ...)
+        debug_printer: Ausgabe der Lademeldungen
+        cache: Messdaten-Cache
+        load_workers: Threads für das Lesen der CSV-Dateien
+        single: input_folder ist eine einzelne Messreihe
+        progress: Ausgabe der Fortschrittsmeldungen
+
+    Returns:
+        Tidy-Tabelle als Dictionary von Spalten (SWEEP_COLUMNS)
+    """
+    input_folder = Path(input_folder)
+    debug_printer = debug_printer or DebugPrinter()
+    distance_limit = max(grid.distance_limit) if grid.distance_limit else config.distance_limit
+    config = replace(config, streaming=False, distance_limit=distance_limit)
+
+    if single:
+        series_folders = [input_folder]
+    else:
+        series_folders = sorted(f for f in input_folder.iterdir() if f.is_dir() and f.name not in IGNORED_FOLDERS)
+
+    parts: List[Dict[str, np.ndarray]] = []
+    for folder in series_folders:
+        analyzer = YarnPulloutAnalyzer(config)
+        with get_instrumentation().stage("load_data"):
+            process_measurement_series(folder, analyzer, debug_printer, cache, load_workers)
+        if not analyzer.max_forces:
+            progress(f"Keine Messungen in {folder.name}")
+            continue
+        with get_instrumentation().stage("sweep"):
+            part = sweep_analyzer(analyzer, grid)
+        part['series'] = np.full(len(part['measurements']), folder.name)
+        parts.append(part)
+        progress(f"Sweep: {folder.name} ({len(analyzer.max_forces)} Messungen, {grid.combinations} Kombinationen)")
+
+    if not parts:
+        return {column: np.empty(0) for column in SWEEP_COLUMNS}
+    return {column: np.concatenate([part[column] for part in parts]) for column in SWEEP_COLUMNS}
+
+
+def default_sweep_filename() -> str:
+    """Standard-Dateiname der Sweep-Tabelle mit Zeitstempel"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"YarnPullout_Sweep_{timestamp}.csv"
+
+
+def write_sweep_table(table: Dict[str, np.ndarray], path: Path) -> Path:
+    """
+    Schreibt die Sweep-Tabelle atomar; das Format ergibt sich aus der Dateiendung:
+    .csv (Standard), .xlsx oder .parquet (pyarrow).
+
+    Returns:
+        Pfad der geschriebenen Datei
+    """
+    import pandas as pd
+
+    path = Path(path)
+    frame = pd.DataFrame({column: table[column] for column in SWEEP_COLUMNS})
+    # Temporäre Datei mit gleicher Endung, damit pandas das Format erkennt
+    temp_path = path.with_name(f"{path.stem}.partial{path.suffix}")
+    suffix = path.suffix.lower()
+    if suffix == '.xlsx':
+        frame.to_excel(temp_path, index=False, sheet_name='Sweep')
+    elif suffix == '.parquet':
+        frame.to_parquet(temp_path, index=False)
+    else:
+        frame.to_csv(temp_path, index=False)
+    os.replace(temp_path, path)
+    return path
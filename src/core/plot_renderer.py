@@ -0,0 +1,121 @@
+# src/core/plot_renderer.py
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import shutil
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from src.core.instrumentation import get_instrumentation, enable_instrumentation
+
+Curve = Tuple[np.ndarray, np.ndarray]
+
+
+@dataclass
+class PlotJob:
+    """Ein zu rendernder Plot einer Messreihe"""
+    name: str
+    curves: List[Curve]
+    path: Path
+    link_paths: List[Path] = field(default_factory=list)  # z.B. Eintrag in plots_gesamt
+    decimation: Optional[str] = "minmax"  # Kurvendezimierung ("minmax", "lttb" oder None)
+
+
+def link_or_copy(source: Path, target: Path) -> str:
+    """
+    Stellt eine Datei unter einem zweiten Pfad bereit, ohne die Bytes zu kopieren.
+
+    Versucht nacheinander Hardlink und symbolischen Link; nur wenn beides
+    nicht möglich ist (z.B. anderes Laufwerk ohne Symlink-Rechte), wird kopiert.
+
+    Args:
+        source: Vorhandene Datei
+        target: Zusätzlicher Pfad
+
+    Returns:
+        "hardlink", "symlink" oder "copy"
+    """
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    try:
+        os.link(source, target)
+        return "hardlink"
+    except OSError:
+        pass
+    try:
+        target.symlink_to(os.path.relpath(source, target.parent))
+        return "symlink"
+    except OSError:
+        shutil.copy2(source, target)
+        return "copy"
+
+
+# Prozesslokale, wiederverwendete Figure der Render-Worker
+_render_state: Dict = {}
+
+
+def _reusable_figure():
+    """Liefert die Figure des aktuellen Prozesses und baut sie beim ersten Aufruf auf"""
+    if 'figure' not in _render_state:
+        from src.core.data_plotter import YarnPulloutPlotter, ReusablePlotFigure
+
+        _render_state['figure'] = ReusablePlotFigure(YarnPulloutPlotter())
+    return _render_state['figure']
+
+
+def _init_render_worker(instrument: bool = False) -> None:
+    """Initialisiert einen Render-Prozess mit dem Agg-Backend"""
+    import matplotlib
+    matplotlib.use("Agg")
+    _reusable_figure()
+    if instrument:
+        enable_instrumentation()
+
+
+def _render_job(job: PlotJob) -> Tuple[str, Optional[str]]:
+    """Rendert einen Plot im aktuellen Prozess und verlinkt ihn"""
+    try:
+        with get_instrumentation().series(job.name):
+            job.path.parent.mkdir(parents=True, exist_ok=True)
+            _reusable_figure().render(job.curves, job.path, job.decimation)
+            for link_path in job.link_paths:
+                link_or_copy(job.path, link_path)
+        return job.name, None
+    except Exception as e:
+        return job.name, str(e)
+
+
+def render_job_in_worker(job: PlotJob) -> Tuple[str, Optional[str], Optional[Dict]]:
+    """Einstiegspunkt eines Render-Prozesses; liefert zusätzlich die Messwerte"""
+    name, error = _render_job(job)
+    return name, error, get_instrumentation().series_metrics(name)
+
+
+def create_render_pool(workers: int) -> ProcessPoolExecutor:
+    """Prozesspool für render_job_in_worker (Agg-Backend, eine wiederverwendete Figure je Prozess)"""
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                               initargs=(get_instrumentation().enabled,))
+
+
+def render_plot_jobs(jobs: Sequence[PlotJob], workers: int = 1) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Rendert viele Plots mit wiederverwendeter Figure, optional in mehreren Prozessen.
+
+    Args:
+        jobs: Zu rendernde Plots
+        workers: Anzahl der Render-Prozesse (1 = im aktuellen Prozess)
+
+    Yields:
+        (Name, Fehlermeldung oder None) je Plot in der Reihenfolge der Jobs
+    """
+    if workers <= 1:
+        for job in jobs:
+            yield _render_job(job)
+        return
+
+    instrumentation = get_instrumentation()
+    with create_render_pool(workers) as executor:
+        for name, error, metrics in executor.map(render_job_in_worker, jobs,
+                                                 chunksize=max(1, len(jobs) // (4 * workers))):
+            instrumentation.merge_series(name, metrics)
+            yield name, error
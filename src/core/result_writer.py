@@ -0,0 +1,245 @@
+# src/core/result_writer.py
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import zlib
+
+# Dateiendung -> Ausgabeformat
+FORMATS = {
+    '.xlsx': 'xlsx',
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+}
+
+JOURNAL_SUFFIX = ".journal.csv"
+CSV_DELIMITER = ';'
+# Zusätzliche Spalten nur im Journal: Zustand der Messreihe (JSON) und Prüfsumme der Zeile
+STATE_COLUMN = "_state"
+CHECKSUM_COLUMN = "_crc32"
+
+
+def _to_cell(value) -> str:
+    """Wert verlustfrei als CSV-Feld (leer für None)"""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return repr(float(value))
+
+
+def _from_cell(text: str) -> Optional[float]:
+    """Umkehrung von _to_cell für Zahlenspalten"""
+    return float(text) if text else None
+
+
+def _checksum(cells: Sequence[str]) -> str:
+    """CRC32 über die Felder einer Journalzeile (ohne Prüfsummenspalte)"""
+    return f"{zlib.crc32(CSV_DELIMITER.join(cells).encode('utf-8')):08x}"
+
+
+class _CsvSink:
+    """CSV-Ausgabe mit denselben verlustfreien Feldern wie das Journal"""
+
+    def __init__(self, path: Path, columns: Sequence[str]):
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.writer = csv.writer(self.file, delimiter=CSV_DELIMITER)
+        self.writer.writerow(list(columns))
+
+    def write_rows(self, rows: List[List]) -> None:
+        self.writer.writerows([_to_cell(value) for value in row] for row in rows)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _XlsxSink:
+    """Excel-Ausgabe im write-only-Modus von openpyxl (Zeilen werden direkt serialisiert)"""
+
+    def __init__(self, path: Path, columns: Sequence[str]):
+        from openpyxl import Workbook
+
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Sheet1")
+        self.sheet.append(list(columns))
+
+    def write_rows(self, rows: List[List]) -> None:
+        for row in rows:
+            self.sheet.append(row)
+
+    def close(self) -> None:
+        self.workbook.save(self.path)
+
+
+class _ArrowSink:
+    """Parquet- bzw. Feather-Ausgabe über pyarrow; jeder Block wird sofort geschrieben"""
+
+    def __init__(self, path: Path, columns: Sequence[str], file_format: str):
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(f"Für das Format '{file_format}' wird pyarrow benötigt") from e
+
+        self.pa = pa
+        self.columns = list(columns)
+        self.schema = pa.schema([pa.field(self.columns[0], pa.string())]
+                                + [pa.field(name, pa.float64()) for name in self.columns[1:]])
+        if file_format == 'parquet':
+            import pyarrow.parquet as pq
+            self.writer = pq.ParquetWriter(str(path), self.schema)
+        else:
+            self.writer = pa.ipc.new_file(str(path), self.schema)
+
+    def write_rows(self, rows: List[List]) -> None:
+        arrays = [self.pa.array([row[i] for row in rows], type=field.type)
+                  for i, field in enumerate(self.schema)]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class StreamingResultWriter:
+    """
+    Schreibt Ergebniszeilen sofort beim Hinzufügen statt am Ende des Laufs.
+
+    Jede Zeile wird zuerst in ein CSV-Journal geschrieben und auf die Platte
+    gebracht (flush + fsync); bricht ein Lauf ab, bleiben alle bis dahin
+    berechneten Zeilen erhalten. Das Journal führt je Zeile zusätzlich einen
+    optionalen Zustand der Messreihe (JSON) und eine CRC32-Prüfsumme, an der eine
+    beim Abbruch abgeschnittene Zeile erkannt wird. Die Zieldatei wird parallel
+    dazu zeilen- bzw. blockweise in eine ".partial"-Datei geschrieben und erst
+    beim Schließen an ihren Platz verschoben; danach wird das Journal gelöscht.
+
+    Mit resume=True werden die gültigen Zeilen eines vorhandenen Journals
+    übernommen; completed nennt die bereits exportierten Messreihen, damit sie
+    nicht erneut berechnet werden müssen, resumed_states deren Zustände.
+    """
+
+    def __init__(self, path: Path, columns: Sequence[str], file_format: Optional[str] = None,
+                 resume: bool = False, batch_rows: int = 64):
+        self.path = Path(path)
+        self.columns = list(columns)
+        self.format = file_format or FORMATS.get(self.path.suffix.lower())
+        if self.format not in FORMATS.values():
+            raise ValueError(f"Unbekanntes Ausgabeformat: {self.path.suffix}")
+        self.batch_rows = max(1, batch_rows)
+        self.journal_path = self.path.with_name(self.path.name + JOURNAL_SUFFIX)
+        self.partial_path = self.path.with_name(self.path.name + ".partial")
+        self._journal_columns = self.columns + [STATE_COLUMN, CHECKSUM_COLUMN]
+
+        resumed = self._read_journal() if resume else []
+        self.completed: List[str] = [values[0] for values, _ in resumed]
+        self.resumed_states: Dict[str, Dict] = {values[0]: state for values, state in resumed
+                                                if state is not None}
+        self.row_count = len(resumed)
+
+        # Zielformat zuerst öffnen, damit fehlende Abhängigkeiten kein leeres Journal hinterlassen
+        self._pending: List[List] = []
+        if self.format == 'xlsx':
+            self._sink = _XlsxSink(self.partial_path, self.columns)
+        elif self.format in ('parquet', 'feather'):
+            self._sink = _ArrowSink(self.partial_path, self.columns, self.format)
+        else:
+            self._sink = _CsvSink(self.partial_path, self.columns)
+        if resumed:
+            self._sink.write_rows([values for values, _ in resumed])
+
+        if resumed:
+            # Journal auf Kopfzeile und gültige Zeilen zurücksetzen, damit die nächste
+            # Zeile nicht an eine abgebrochene angehängt wird
+            self._rewrite_journal(resumed)
+            self._journal = open(self.journal_path, 'a', encoding='utf-8', newline='')
+            self._csv = csv.writer(self._journal, delimiter=CSV_DELIMITER)
+        else:
+            self._journal = open(self.journal_path, 'w', encoding='utf-8', newline='')
+            self._csv = csv.writer(self._journal, delimiter=CSV_DELIMITER)
+            self._csv.writerow(self._journal_columns)
+            self._sync()
+
+    @staticmethod
+    def _journal_cells(values: List, state: Optional[Dict]) -> List[str]:
+        """Felder einer Journalzeile: Werte, Zustand und Prüfsumme"""
+        cells = [_to_cell(value) for value in values]
+        cells.append(json.dumps(state) if state is not None else "")
+        return cells + [_checksum(cells)]
+
+    def _read_journal(self) -> List[Tuple[List, Optional[Dict]]]:
+        """Liest die gültigen Zeilen eines vorhandenen Journals (leer, falls keines existiert)"""
+        if not self.journal_path.exists():
+            return []
+        with open(self.journal_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file, delimiter=CSV_DELIMITER)
+            header = next(reader, None)
+            if header != self._journal_columns:
+                raise ValueError(f"Journal {self.journal_path} passt nicht zu den Ergebnisspalten")
+            rows = []
+            for row in reader:
+                # Beim Abbruch abgeschnittene oder beschädigte Zeilen verwerfen
+                if len(row) != len(self._journal_columns) or _checksum(row[:-1]) != row[-1]:
+                    continue
+                try:
+                    values = [row[0]] + [_from_cell(cell) for cell in row[1:-2]]
+                    state = json.loads(row[-2]) if row[-2] else None
+                except ValueError:
+                    continue
+                rows.append((values, state))
+            return rows
+
+    def _rewrite_journal(self, rows: List[Tuple[List, Optional[Dict]]]) -> None:
+        """Schreibt das Journal mit den übernommenen Zeilen atomar neu"""
+        temp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file, delimiter=CSV_DELIMITER)
+            writer.writerow(self._journal_columns)
+            for values, state in rows:
+                writer.writerow(self._journal_cells(values, state))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.journal_path)
+
+    def _sync(self) -> None:
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def write_row(self, row: Dict, state: Optional[Dict] = None) -> None:
+        """
+        Schreibt eine Ergebniszeile.
+
+        Args:
+            row: Werte je Spaltenname
+            state: JSON-serialisierbarer Zustand der Messreihe, der nur im Journal
+                abgelegt und beim Fortsetzen über resumed_states zurückgegeben wird
+        """
+        values = [row.get(name) for name in self.columns]
+        values = [values[0]] + [None if value is None else float(value) for value in values[1:]]
+        self._csv.writerow(self._journal_cells(values, state))
+        self._sync()
+        self.row_count += 1
+
+        self._pending.append(values)
+        if len(self._pending) >= self.batch_rows or self.format in ('xlsx', 'csv'):
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        if self._pending:
+            self._sink.write_rows(self._pending)
+            self._pending = []
+
+    def close(self) -> Path:
+        """
+        Schließt die Ausgabe und entfernt das Journal.
+
+        Returns:
+            Pfad der fertigen Ausgabedatei
+        """
+        self._journal.close()
+        self._flush_pending()
+        self._sink.close()
+        os.replace(self.partial_path, self.path)
+        os.remove(self.journal_path)
+        return self.path
@@ -0,0 +1,166 @@
+# src/core/run_manifest.py
+import json
+import os
+from pathlib import Path
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+from src.core.running_stats import SeriesStatistics
+from src.core.series_processor import find_measurement_files
+
+MANIFEST_NAME = "yarn_pullout_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _to_builtin(value):
+    """Wandelt numpy-Zahlen in JSON-taugliche Python-Typen um"""
+    if isinstance(value, dict):
+        return {key: _to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _to_builtin(value.tolist())
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+    if isinstance(value, np.integer):
+        return int(value)
+    return float(value)
+
+
+class RunManifest:
+    """
+    Manifest eines Analyselaufs für die inkrementelle Mehrfachanalyse.
+
+    Für jede Messreihe werden die Fingerabdrücke der Eingabedateien (Größe und
+    mtime), der Fingerabdruck der Konfiguration, die berechneten Statistiken
+    (gerundet und als zusammenführbare SeriesStatistics), die Kennwerte je
+    Messung (für Konfidenzintervalle und Detailtabelle) und die Plotpfade
+    festgehalten. Ein späterer Lauf verarbeitet nur
+    Messreihen, bei denen sich davon etwas geändert hat.
+    """
+
+    def __init__(self, path: Path, series: Optional[Dict[str, Dict]] = None):
+        self.path = Path(path)
+        self.series: Dict[str, Dict] = series or {}
+
+    @classmethod
+    def load(cls, folder: Path) -> 'RunManifest':
+        """
+        Lädt das Manifest eines Zusammenfassungsordners.
+
+        Args:
+            folder: Zusammenfassungsordner
+
+        Returns:
+            Geladenes oder leeres Manifest (bei fehlender/ungültiger Datei)
+        """
+        path = Path(folder) / MANIFEST_NAME
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') == MANIFEST_VERSION:
+                return cls(path, data.get('series', {}))
+        except (OSError, ValueError):
+            pass
+        return cls(path)
+
+    @staticmethod
+    def fingerprint_inputs(folder: Path, data_ending: str = ".steps.tracking.csv") -> Dict[str, List[int]]:
+        """
+        Ermittelt Größe und mtime aller Messdateien einer Messreihe.
+
+        Args:
+            folder: Ordner der Messreihe
+            data_ending: Dateiendung der Messdateien
+
+        Returns:
+            Dictionary relativer Dateipfad -> [Größe, mtime in ns]
+        """
+        inputs = {}
+        for csv_path in find_measurement_files(folder, data_ending):
+            try:
+                stat = csv_path.stat()
+            except OSError:
+                continue
+            inputs[csv_path.relative_to(folder).as_posix()] = [stat.st_size, stat.st_mtime_ns]
+        return inputs
+
+    def lookup(self, name: str, inputs: Dict[str, List[int]], config_fingerprint: str,
+               require_plots: bool = True) -> Optional[Dict]:
+        """
+        Gibt den gespeicherten Eintrag zurück, wenn die Messreihe unverändert ist.
+
+        Args:
+            name: Name der Messreihe
+            inputs: Aktuelle Fingerabdrücke der Eingabedateien
+            config_fingerprint: Aktueller Fingerabdruck der Konfiguration
+            require_plots: Eintrag nur verwenden, wenn die Plots noch existieren
+
+        Returns:
+            Manifest-Eintrag oder None, falls neu berechnet werden muss
+        """
+        entry = self.series.get(name)
+        if entry is None:
+            return None
+        if entry.get('config') != config_fingerprint or entry.get('inputs') != inputs:
+            return None
+        if entry.get('stats') is None:
+            return entry  # unverändert ohne auswertbare Messungen bzw. mit Fehler
+        if require_plots and (not entry.get('plot_paths')
+                              or not all(os.path.exists(p) for p in entry['plot_paths'])):
+            return None
+        return entry
+
+    def update(self, name: str, inputs: Dict[str, List[int]], config_fingerprint: str,
+               stats: Optional[Dict], plot_paths: Iterable[Path],
+               statistics: Optional[SeriesStatistics] = None,
+               samples: Optional[Dict] = None, details: Optional[Dict] = None,
+               error: Optional[str] = None) -> None:
+        """
+        Speichert das Ergebnis einer neu berechneten Messreihe.
+
+        Auch Messreihen ohne Statistiken (keine ladbaren Messungen oder Fehler bei der
+        Analyse, stats=None) werden mit ihren Fingerabdrücken festgehalten, damit sie
+        erst bei einer Änderung erneut verarbeitet werden.
+        """
+        self.series[name] = {
+            'config': config_fingerprint,
+            'inputs': inputs,
+            'stats': _to_builtin(stats) if stats is not None else None,
+            'error': error,
+            'statistics': _to_builtin(statistics.to_dict()) if statistics is not None else None,
+            'samples': ({key: _to_builtin(list(values)) for key, values in samples.items()}
+                        if samples is not None else None),
+            'details': ({key: _to_builtin(values) for key, values in details.items()}
+                        if details is not None else None),
+            'plot_paths': [str(p) for p in plot_paths],
+        }
+
+    @staticmethod
+    def entry_statistics(entry: Dict) -> Optional[SeriesStatistics]:
+        """Zusammenführbare Statistiken eines Eintrags (None bei älteren Manifesten)"""
+        data = entry.get('statistics')
+        return SeriesStatistics.from_dict(data) if data else None
+
+    @staticmethod
+    def entry_samples(entry: Dict) -> Optional[Dict]:
+        """Kennwerte je Messung eines Eintrags (None bei älteren Manifesten)"""
+        samples = entry.get('samples')
+        return {key: np.array(values, dtype=np.float64) for key, values in samples.items()} if samples else None
+
+    @staticmethod
+    def entry_details(entry: Dict) -> Optional[Dict[str, np.ndarray]]:
+        """Detailwerte je Messung eines Eintrags (None bei älteren Manifesten)"""
+        details = entry.get('details')
+        return {key: np.array(values) for key, values in details.items()} if details else None
+
+    def prune(self, names: Iterable[str]) -> None:
+        """Entfernt Einträge von Messreihen, die nicht mehr existieren"""
+        keep = set(names)
+        self.series = {name: entry for name, entry in self.series.items() if name in keep}
+
+    def save(self) -> None:
+        """Schreibt das Manifest atomar"""
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': MANIFEST_VERSION, 'series': self.series}, file, indent=2)
+        os.replace(temp_path, self.path)
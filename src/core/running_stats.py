@@ -0,0 +1,142 @@
+# src/core/running_stats.py
+from dataclasses import dataclass, field
+import math
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+
+@dataclass
+class RunningStats:
+    """
+    Zusammenführbarer Mittelwert und Standardabweichung.
+
+    Gespeichert werden nur Anzahl, Mittelwert und die Summe der quadrierten
+    Abweichungen (m2). Einzelwerte nimmt add nach Welford auf; update fasst
+    dagegen einen ganzen Batch mit NumPy zusammen (Mittelwert, dann m2 in einem
+    zweiten Durchlauf über den Batch) und führt ihn wie ein Teilergebnis ein.
+    Teilergebnisse lassen sich verlustfrei zusammenführen (Chan et al.), z.B.
+    Messreihen zu einer Kampagne oder Ergebnisse aus mehreren Worker-Prozessen.
+    Gerundet wird erst bei der Ausgabe.
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Nimmt einen einzelnen Wert auf"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def update(self, values: Sequence[float]) -> None:
+        """
+        Nimmt mehrere Werte auf einmal auf.
+
+        Kein Welford-Schritt je Wert: Mittelwert und m2 des Batches werden wie bei
+        np.mean/np.var in zwei vektorisierten Durchläufen berechnet und dann mit
+        merge zusammengeführt. Für einen einzelnen Batch sind Mittelwert und
+        Standardabweichung damit identisch zu np.mean und np.std.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+        mean = float(np.mean(values))
+        self.merge(RunningStats(int(values.size), mean, float(np.sum((values - mean) ** 2))))
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """
+        Führt ein anderes Teilergebnis in dieses zusammen.
+
+        Args:
+            other: Teilergebnis über eine disjunkte Wertemenge
+
+        Returns:
+            self (für Verkettungen)
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        return self
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Varianz der Grundgesamtheit (wie np.var), None ohne Werte"""
+        return self.m2 / self.count if self.count else None
+
+    @property
+    def std(self) -> Optional[float]:
+        """Standardabweichung der Grundgesamtheit (wie np.std), None ohne Werte"""
+        return math.sqrt(self.variance) if self.count else None
+
+    def to_dict(self) -> Dict:
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RunningStats':
+        return cls(int(data['count']), float(data['mean']), float(data['m2']))
+
+
+# Kennwerte einer Messung, für die Statistiken geführt werden (Schlüssel wie in get_statistics)
+QUANTITIES = ('max_force', 'work', 'modulus')
+
+
+@dataclass
+class SeriesStatistics:
+    """Laufende Statistiken von Maximalkraft, Arbeit und Modul einer Messreihe oder Kampagne"""
+    max_force: RunningStats = field(default_factory=RunningStats)
+    work: RunningStats = field(default_factory=RunningStats)
+    modulus: RunningStats = field(default_factory=RunningStats)
+
+    @classmethod
+    def from_values(cls, max_forces: Sequence[float], work: Sequence[float],
+                    moduli: Sequence[float]) -> 'SeriesStatistics':
+        """Erstellt die Statistiken aus den Kennwerten aller Messungen"""
+        statistics = cls()
+        statistics.max_force.update(max_forces)
+        statistics.work.update(work)
+        statistics.modulus.update(moduli)
+        return statistics
+
+    def merge(self, other: 'SeriesStatistics') -> 'SeriesStatistics':
+        """Führt die Statistiken einer anderen Messreihe bzw. eines Teilergebnisses hinzu"""
+        for name in QUANTITIES:
+            getattr(self, name).merge(getattr(other, name))
+        return self
+
+    def summary(self, decimals: Optional[int] = 2) -> Dict:
+        """
+        Mittelwerte und Standardabweichungen im Format von get_statistics.
+
+        Args:
+            decimals: Nachkommastellen (None = volle Genauigkeit)
+
+        Returns:
+            Dictionary {Kennwert: {'mean': ..., 'std': ...}}, None für Kennwerte ohne Messungen
+        """
+        def output(value: Optional[float]) -> Optional[float]:
+            if value is None or decimals is None:
+                return value
+            # np.round wie bisher in calculate_statistics (kann bei x.5 von round abweichen)
+            return float(np.round(value, decimals))
+
+        result = {}
+        for name in QUANTITIES:
+            stats = getattr(self, name)
+            mean = stats.mean if stats.count else None
+            result[name] = {'mean': output(mean), 'std': output(stats.std)}
+        return result
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name).to_dict() for name in QUANTITIES}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SeriesStatistics':
+        return cls(**{name: RunningStats.from_dict(data[name]) for name in QUANTITIES})
@@ -0,0 +1,323 @@
+# src/core/series_processor.py
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import shutil
+from typing import Dict, Iterator, List, Optional, Sequence, TYPE_CHECKING
+from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
+from src.core.debug_printer import DebugPrinter
+from src.core.instrumentation import get_instrumentation, enable_instrumentation
+from src.core.measurement_cache import MeasurementCache
+from src.core.plot_renderer import PlotJob
+from src.core.running_stats import SeriesStatistics
+
+if TYPE_CHECKING:
+    from src.core.data_plotter import YarnPulloutPlotter
+
+# Ordner im Zusammenfassungsordner, die keine Messreihen sind
+IGNORED_FOLDERS = ("plots", "plots_gesamt", "yarn_pullout_archive")
+
+
+@dataclass
+class SeriesResult:
+    """Ergebnis der Analyse einer Messreihe"""
+    name: str
+    stats: Optional[Dict] = None
+    plot_paths: List[Path] = field(default_factory=list)
+    measurement_count: int = 0
+    error: Optional[str] = None
+    plot_job: Optional[PlotJob] = None  # zurückgestellter Plot für das Batch-Rendering
+    metrics: Optional[Dict] = None  # Messwerte der Instrumentierung aus einem Worker-Prozess
+    details: Optional[Dict] = None  # Kennwerte je Einzelmessung (Spalten)
+    statistics: Optional[SeriesStatistics] = None  # ungerundete, zusammenführbare Statistiken
+    samples: Optional[Dict] = None  # Kennwerte je Messung für Konfidenzintervalle
+
+
+def process_measurement_series(folder_path: Path, analyzer: YarnPulloutAnalyzer, debug_printer: DebugPrinter,
+                               cache: Optional[MeasurementCache] = None, load_workers: int = 1) -> None:
+    """
+    Verarbeitet eine einzelne Messreihe (optional über den Messdaten-Cache).
+
+    Die Messdateien werden mit einem einzigen Verzeichnisdurchlauf ermittelt
+    (find_measurement_files). Mit load_workers > 1 werden sie in einem
+    Thread-Pool gleichzeitig gelesen, was vor allem bei Netzlaufwerken die
+    Wartezeiten überlappt.
+    Ist in der Konfiguration ein Binärarchiv angegeben und die Messreihe darin
+    aktuell, werden die Daten ohne Kopie aus dem Archiv übernommen.
+    """
+    if analyzer.config.archive_path and _load_from_archive(folder_path, analyzer, debug_printer):
+        return
+
+    with get_instrumentation().stage("folder_discovery"):
+        csv_paths = find_measurement_files(folder_path, analyzer.config.data_ending)
+    debug_printer.print_progress(f"Gefundene Messordner: {[p.parent.name for p in csv_paths]}")
+    load_measurement_files(csv_paths, analyzer, debug_printer, cache, load_workers)
+
+
+def _load_from_archive(folder_path: Path, analyzer: YarnPulloutAnalyzer, debug_printer: DebugPrinter) -> bool:
+    """
+    Übernimmt eine Messreihe aus dem Binärarchiv.
+
+    Returns:
+        False, wenn die Messreihe fehlt oder sich die CSV-Dateien seit dem Import geändert haben
+    """
+    from src.core.measurement_archive import open_archive
+
+    try:
+        archive = open_archive(Path(analyzer.config.archive_path))
+    except (OSError, ValueError, KeyError) as e:
+        debug_printer.print_progress(f"Archiv nicht lesbar, lese CSV-Dateien: {str(e)}")
+        return False
+    if not archive.is_current(folder_path.name, folder_path):
+        debug_printer.print_progress(f"{folder_path.name} nicht (aktuell) im Archiv, lese CSV-Dateien")
+        return False
+
+    with get_instrumentation().stage("csv_load") as stage:
+        store, names = archive.load_series(folder_path.name)
+        analyzer.use_store(store, names)
+        stage.add(rows=int(store.offsets[-1]))
+    debug_printer.print_progress(f"Aus Archiv geladen: {folder_path.name} ({len(names)} Messungen)")
+    return True
+
+
+def find_measurement_files(folder_path: Path, data_ending: str = ".steps.tracking.csv") -> List[Path]:
+    """
+    Ermittelt die erwarteten CSV-Pfade einer Messreihe mit nur einem Verzeichnisdurchlauf.
+
+    Der Dateiname ergibt sich aus dem Namen des Messordners, daher wird nicht
+    pro Ordner gesucht. Ob die Datei existiert, zeigt sich erst beim Lesen.
+
+    Args:
+        folder_path: Ordner der Messreihe
+        data_ending: Dateiendung der Messdateien
+
+    Returns:
+        Liste der erwarteten CSV-Pfade in Verzeichnisreihenfolge
+    """
+    with os.scandir(folder_path) as entries:
+        return [Path(entry.path) / f"{entry.name}{data_ending}"
+                for entry in entries if entry.is_dir()]
+
+
+def load_measurement_files(csv_paths: Sequence[Path], analyzer: YarnPulloutAnalyzer,
+                           debug_printer: DebugPrinter, cache: Optional[MeasurementCache] = None,
+                           load_workers: int = 1) -> None:
+    """
+    Liest bereits ermittelte Messdateien (optional in einem Thread-Pool) und übernimmt
+    sie in fester Reihenfolge. Fehlende Dateien werden übersprungen.
+    """
+    series = get_instrumentation().current_series
+
+    def read(csv_path: Path):
+        try:
+            with get_instrumentation().attach(series):  # Lese-Threads zählen zur aufrufenden Messreihe
+                if analyzer.config.streaming:
+                    return analyzer.stream_measurement(csv_path), None
+                return analyzer.read_measurement(csv_path, cache), None
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            return None, e
+
+    def add(csv_path: Path, data, error) -> None:
+        if error is not None:
+            debug_printer.print_progress(f"Fehler beim Laden von {csv_path}: {str(error)}")
+        elif data is not None:
+            try:
+                if analyzer.config.streaming:
+                    analyzer.add_streaming_result(data, analyzer.measurement_name(csv_path))
+                else:
+                    analyzer.add_measurement(*data, normalized=True, name=analyzer.measurement_name(csv_path))
+                debug_printer.print_progress(f"Verarbeite: {csv_path.name}")
+            except Exception as e:
+                debug_printer.print_progress(f"Fehler beim Laden von {csv_path}: {str(e)}")
+
+    if load_workers <= 1:
+        for csv_path in csv_paths:
+            add(csv_path, *read(csv_path))
+        return
+    with ThreadPoolExecutor(max_workers=load_workers) as executor:
+        for csv_path, (data, error) in zip(csv_paths, executor.map(read, csv_paths)):
+            add(csv_path, data, error)
+
+
+def load_series_files(folder_path: Path, csv_paths: Sequence[Path], analyzer: YarnPulloutAnalyzer,
+                      debug_printer: DebugPrinter, cache: Optional[MeasurementCache] = None,
+                      load_workers: int = 1) -> None:
+    """
+    Lädt eine Messreihe, deren Messdateien bereits ermittelt wurden (z.B. in einer
+    eigenen Discovery-Stufe); wie process_measurement_series wird zuerst das
+    Binärarchiv versucht.
+    """
+    if analyzer.config.archive_path and _load_from_archive(folder_path, analyzer, debug_printer):
+        return
+    load_measurement_files(csv_paths, analyzer, debug_printer, cache, load_workers)
+
+
+def compute_series(result: SeriesResult, analyzer: YarnPulloutAnalyzer) -> None:
+    """Berechnet Modul, Arbeit und Statistiken einer geladenen Messreihe und überträgt sie in result"""
+    analyzer.calculate_force_modulus()
+    analyzer.calculate_work()
+    analyzer.calculate_statistics()
+    result.stats = analyzer.get_statistics()
+    result.details = analyzer.get_measurement_details()
+    result.statistics = analyzer.series_statistics
+    result.samples = analyzer.measurement_samples()
+
+
+def deferred_plot_job(result: SeriesResult, folder: Path, analyzer: YarnPulloutAnalyzer,
+                      plotter: 'YarnPulloutPlotter', plot_dir_gesamt: Path) -> PlotJob:
+    """Legt den Plot einer Messreihe als PlotJob in result ab, statt ihn sofort zu rendern"""
+    plot_name = f"{folder.name}_analysis.png"
+    result.plot_job = PlotJob(folder.name, plotter.get_curves(analyzer),
+                              folder / "plots" / plot_name, [plot_dir_gesamt / plot_name])
+    result.plot_paths = [result.plot_job.path, *result.plot_job.link_paths]
+    return result.plot_job
+
+
+def analyse_series(folder: Path, config: YarnPulloutConfig, plotter: Optional['YarnPulloutPlotter'],
+                   debug_printer: DebugPrinter, plot_dir_gesamt: Path,
+                   cache: Optional[MeasurementCache] = None, load_workers: int = 1,
+                   defer_plot: bool = False) -> SeriesResult:
+    """
+    Lädt, berechnet und plottet eine Messreihe im Rahmen der Mehrfachanalyse.
+
+    Args:
+        folder: Ordner der Messreihe
+        config: Analysekonfiguration
+        plotter: Plotter für die Messreihe (None = keine Plots)
+        debug_printer: Ausgabe der Fortschrittsmeldungen
+        plot_dir_gesamt: Sammelordner für alle Plots
+        cache: Optionaler Messdaten-Cache
+        load_workers: Anzahl der Threads zum Lesen der CSV-Dateien
+        defer_plot: Plot nicht sofort rendern, sondern als PlotJob zurückgeben
+
+    Returns:
+        SeriesResult mit Statistiken und Plotpfaden
+    """
+    with get_instrumentation().series(folder.name):
+        return _analyse_series(folder, config, plotter, debug_printer, plot_dir_gesamt, cache,
+                               load_workers, defer_plot)
+
+
+def _analyse_series(folder: Path, config: YarnPulloutConfig, plotter: Optional['YarnPulloutPlotter'],
+                    debug_printer: DebugPrinter, plot_dir_gesamt: Path, cache: Optional[MeasurementCache],
+                    load_workers: int, defer_plot: bool) -> SeriesResult:
+    """Implementierung von analyse_series (innerhalb der Messreihen-Instrumentierung)"""
+    debug_printer.print_progress(f"\nVerarbeite Messreihe: {folder.name}")
+    result = SeriesResult(folder.name)
+    analyzer = YarnPulloutAnalyzer(config)
+    process_measurement_series(folder, analyzer, debug_printer, cache, load_workers)
+    result.measurement_count = len(analyzer.max_forces)
+
+    if not analyzer.max_forces:
+        return result
+
+    try:
+        compute_series(result, analyzer)
+        if plotter is None:
+            return result
+        if config.streaming:
+            debug_printer.print_progress(f"Kein Plot für {folder.name} (Streaming-Modus ohne Rohdaten)")
+            return result
+
+        if defer_plot:
+            deferred_plot_job(result, folder, analyzer, plotter, plot_dir_gesamt)
+            return result
+
+        # Plot-Erstellung *innerhalb* der Schleife (wie gehabt)
+        try:
+            import matplotlib.pyplot as plt
+
+            with get_instrumentation().stage("plot_render"):
+                figure = plotter.create_plot(analyzer, folder.name)
+            plot_folder_serie = folder / "plots" # Plot-Ordner *pro Messreihe* (wie gehabt)
+            plot_folder_serie.mkdir(exist_ok=True)
+            plot_path = plot_folder_serie / f"{folder.name}_analysis.png"
+            with get_instrumentation().stage("png_write"):
+                figure.savefig(plot_path, dpi=300, bbox_inches='tight')
+            plt.close(figure)
+            result.plot_paths.append(plot_path)
+            debug_printer.print_progress(f"Plot gespeichert für {folder.name}: {plot_path}")
+
+            # Plot in den 'plots_gesamt' Ordner KOPIEREN
+            plot_path_gesamt = plot_dir_gesamt / f"{folder.name}_analysis.png" # Pfad für den 'gesamt' Plot
+            shutil.copy2(plot_path, plot_path_gesamt) # Kopiere den Plot in den 'gesamt' Ordner (copy2 kopiert auch Metadaten)
+            result.plot_paths.append(plot_path_gesamt)
+            debug_printer.print_progress(f"Plot kopiert nach: {plot_path_gesamt}") # Debug-Ausgabe für das Kopieren
+
+        except Exception as e:
+            debug_printer.print_progress(f"Fehler beim Plotting von {folder.name}: {str(e)}")
+
+    except Exception as e:
+        result.error = str(e)
+        debug_printer.print_progress(f"Fehler bei der Verarbeitung von {folder.name}: {str(e)}")
+
+    return result
+
+
+# Prozesslokale Objekte der Worker (werden einmal pro Prozess erzeugt)
+_worker_state: Dict = {}
+
+
+def _init_worker(config: YarnPulloutConfig, cache_dir: Optional[Path], cache_max_bytes: int,
+                 load_workers: int, make_plots: bool, defer_plots: bool, instrument: bool = False) -> None:
+    """Initialisiert Plotter, Ausgabe, Cache und Instrumentierung eines Worker-Prozesses"""
+    _worker_state['config'] = config
+    _worker_state['load_workers'] = load_workers
+    _worker_state['defer_plots'] = defer_plots
+    _worker_state['plotter'] = None
+    if make_plots:
+        import matplotlib
+        matplotlib.use("Agg")  # Worker rendern nur in Dateien
+        from src.core.data_plotter import YarnPulloutPlotter
+        _worker_state['plotter'] = YarnPulloutPlotter()
+    _worker_state['debug_printer'] = DebugPrinter()
+    _worker_state['cache'] = MeasurementCache(cache_dir, cache_max_bytes) if cache_dir else None
+    if instrument:
+        enable_instrumentation()
+
+
+def _analyse_series_in_worker(folder: Path, plot_dir_gesamt: Path) -> SeriesResult:
+    """Einstiegspunkt eines Worker-Prozesses für eine Messreihe"""
+    try:
+        result = analyse_series(folder, _worker_state['config'], _worker_state['plotter'],
+                                _worker_state['debug_printer'], plot_dir_gesamt, _worker_state['cache'],
+                                _worker_state['load_workers'], _worker_state['defer_plots'])
+    except Exception as e:
+        result = SeriesResult(folder.name, error=str(e))
+    result.metrics = get_instrumentation().series_metrics(folder.name)
+    return result
+
+
+def analyse_series_parallel(series_folders: Sequence[Path], config: YarnPulloutConfig,
+                            plot_dir_gesamt: Path, workers: int,
+                            cache: Optional[MeasurementCache] = None,
+                            load_workers: int = 1, make_plots: bool = True,
+                            defer_plots: bool = False) -> Iterator[SeriesResult]:
+    """
+    Analysiert mehrere Messreihen parallel in einem Prozesspool.
+
+    Die Ergebnisse werden in der Reihenfolge von series_folders geliefert,
+    unabhängig davon, welcher Worker zuerst fertig wird. Ist die Instrumentierung
+    aktiv, messen auch die Worker und liefern ihre Werte in SeriesResult.metrics.
+
+    Args:
+        series_folders: Ordner der Messreihen
+        config: Analysekonfiguration
+        plot_dir_gesamt: Sammelordner für alle Plots
+        workers: Anzahl der Worker-Prozesse
+        cache: Optionaler Messdaten-Cache (wird in jedem Worker neu geöffnet)
+        load_workers: Anzahl der Threads zum Lesen der CSV-Dateien je Messreihe
+        make_plots: Plots erzeugen
+        defer_plots: Plots als PlotJob zurückgeben statt im Worker zu rendern
+
+    Yields:
+        SeriesResult je Messreihe in fester Reihenfolge
+    """
+    initargs = (config, cache.cache_dir if cache else None, cache.max_bytes if cache else 0, load_workers,
+                make_plots, defer_plots, get_instrumentation().enabled)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        yield from executor.map(_analyse_series_in_worker, series_folders,
+                                [plot_dir_gesamt] * len(series_folders))
@@ -0,0 +1,328 @@
+# src/core/streaming_analyzer.py
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+import numpy as np
+from src.core.data_analyzer import YarnPulloutConfig
+from src.core.tracking_reader import (iter_tracking_blocks, parse_tracking_block, TrackingFormatError,
+                                      BLOCK_SIZE, DISPLACEMENT_COLUMN, FORCE_COLUMN)
+
+logger = logging.getLogger('YarnPullout')
+
+
+@dataclass
+class StreamingResult:
+    """Kennwerte einer einzelnen Messung aus der Streaming-Analyse"""
+    sample_count: int
+    max_force: float
+    max_index: int
+    modulus: float  # NaN, falls nicht berechenbar
+    index_low: int  # -1, falls nicht gefunden
+    index_high: int  # -1, falls nicht gefunden
+    work: float  # NaN, falls keine Punkte bis zum Distance Limit
+    displacement_low: float = np.nan  # Lage des unteren Schwellpunkts (NaN, falls nicht gefunden)
+    force_low: float = np.nan
+    displacement_high: float = np.nan  # Lage des oberen Schwellpunkts
+    force_high: float = np.nan
+
+
+class StreamingState:
+    """
+    Einpass-Analyse einer Messung mit begrenztem Zustand.
+
+    Die Rohdaten werden blockweise übergeben und nach der Verarbeitung verworfen.
+    Gehalten werden nur der Nullpunkt, das laufende Kraftmaximum, die Arbeit bis
+    zum Distance Limit samt letztem Punkt und die "Rekordpunkte" (Punkte, an denen
+    die Kraft ein neues Maximum erreicht). Für den Modul kommen nur Rekordpunkte in
+    Frage, denn der erste Punkt über einem Schwellwert vor dem Maximum ist immer
+    ein Rekord. Rekorde unterhalb des unteren Schwellwerts des aktuellen Maximums
+    werden verworfen; da die Kraft auf 4 Stellen gerundet ist, bleibt ihre Anzahl
+    durch die Zahl der Kraftstufen begrenzt und wächst nicht mit der Dateilänge.
+
+    Die Ergebnisse entsprechen denen von YarnPulloutAnalyzer (gleiche Normalisierung,
+    Schwellwertsuche und Arbeitsdefinition).
+    """
+
+    def __init__(self, config: YarnPulloutConfig = YarnPulloutConfig()):
+        self.config = config
+        self._prune_fraction = min(config.force_threshold_low, config.force_threshold_high)
+        self._origin = None  # Rohwerte des ersten Messpunkts
+        self._count = 0
+        self._max_force = -np.inf
+        self._record_index = np.empty(0, dtype=np.int64)
+        self._record_x = np.empty(0)
+        self._record_y = np.empty(0)
+        self._work = 0.0
+        self._work_points = 0
+        self._last_kept = None  # letzter integrierter Punkt (Weg, Kraft)
+        self._cutoff_reached = False
+
+    @property
+    def sample_count(self) -> int:
+        """Anzahl der bisher verarbeiteten Messpunkte"""
+        return self._count
+
+    def update(self, block: np.ndarray) -> None:
+        """
+        Verarbeitet einen Block roher Messpunkte.
+
+        Args:
+            block: Array der Form (Zeilen, 2) mit Weg und Kraft
+        """
+        if block.shape[0] == 0:
+            return
+        if self._origin is None:
+            self._origin = block[0].astype(np.float64)
+        x = np.round(block[:, 0] - self._origin[0], 4)
+        y = np.round(block[:, 1] - self._origin[1], 4)
+
+        self._update_records(x, y)
+        self._update_work(x, y)
+        self._count += x.shape[0]
+
+    def _update_records(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Übernimmt neue Kraftmaxima und verwirft nicht mehr benötigte Rekorde"""
+        running_max = np.maximum.accumulate(y)
+        previous_max = np.empty_like(y)
+        previous_max[0] = self._max_force
+        np.maximum(running_max[:-1], self._max_force, out=previous_max[1:])
+        records = np.flatnonzero(y > previous_max)
+        if records.size == 0:
+            return
+
+        self._max_force = float(running_max[-1]) if running_max[-1] > self._max_force else self._max_force
+        self._record_index = np.concatenate((self._record_index, records + self._count))
+        self._record_x = np.concatenate((self._record_x, x[records]))
+        self._record_y = np.concatenate((self._record_y, y[records]))
+
+        if self._max_force > 0:
+            keep = self._record_y >= self._max_force * self._prune_fraction
+            keep[-1] = True  # Maximum selbst immer behalten
+            self._record_index = self._record_index[keep]
+            self._record_x = self._record_x[keep]
+            self._record_y = self._record_y[keep]
+
+    def _update_work(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Führt das Trapezintegral bis zum Distance Limit fort"""
+        if self._cutoff_reached:
+            return
+        limit = self.config.distance_limit
+
+        if self.config.interpolate_work_cutoff:
+            beyond = np.flatnonzero(x > limit)
+            end = beyond[0] if beyond.size else x.shape[0]
+            kept_x, kept_y = x[:end], y[:end]
+        else:
+            kept = x <= limit
+            kept_x, kept_y = x[kept], y[kept]
+
+        if self._last_kept is not None:
+            kept_x = np.concatenate(([self._last_kept[0]], kept_x))
+            kept_y = np.concatenate(([self._last_kept[1]], kept_y))
+        if kept_x.shape[0] >= 2:
+            self._work += float(np.sum((kept_x[1:] - kept_x[:-1]) * (kept_y[1:] + kept_y[:-1]) / 2.0))
+        self._work_points += kept_x.shape[0] - (self._last_kept is not None)
+        if kept_x.shape[0]:
+            self._last_kept = (kept_x[-1], kept_y[-1])
+
+        if self.config.interpolate_work_cutoff and end < x.shape[0]:
+            # Angeschnittenes Trapez zwischen letztem Punkt und distance_limit
+            if self._last_kept is not None:
+                x0, y0 = self._last_kept
+                x1, y1 = x[end], y[end]
+                y_limit = y0 + (y1 - y0) * (limit - x0) / (x1 - x0)
+                self._work += float((limit - x0) * (y0 + y_limit) / 2.0)
+            self._cutoff_reached = True
+
+    def result(self) -> StreamingResult:
+        """
+        Liefert die Kennwerte der bisher verarbeiteten Daten.
+
+        Returns:
+            StreamingResult der Messung
+        """
+        if self._count == 0:
+            raise ValueError("Messung enthält keine Datenpunkte")
+
+        # Kandidaten liegen vor dem (ersten) Maximum, also alle Rekorde außer dem letzten
+        candidates_y = self._record_y[:-1]
+        first_low = np.flatnonzero(candidates_y >= self._max_force * self.config.force_threshold_low)
+        first_high = np.flatnonzero(candidates_y >= self._max_force * self.config.force_threshold_high)
+
+        modulus, index_low, index_high = np.nan, -1, -1
+        points = (np.nan, np.nan, np.nan, np.nan)
+        if first_low.size and first_high.size:
+            lower = min(first_low[0], first_high[0])
+            upper = max(first_low[0], first_high[0])
+            index_low = int(self._record_index[lower])
+            index_high = int(self._record_index[upper])
+            points = (float(self._record_x[lower]), float(self._record_y[lower]),
+                      float(self._record_x[upper]), float(self._record_y[upper]))
+            delta_x = self._record_x[upper] - self._record_x[lower]
+            if delta_x != 0:
+                modulus = float((self._record_y[upper] - self._record_y[lower]) / delta_x)
+
+        return StreamingResult(
+            sample_count=self._count,
+            max_force=self._max_force,
+            max_index=int(self._record_index[-1]),
+            modulus=modulus,
+            index_low=index_low,
+            index_high=index_high,
+            work=self._work if self._work_points > 0 else np.nan,
+            displacement_low=points[0],
+            force_low=points[1],
+            displacement_high=points[2],
+            force_high=points[3]
+        )
+
+
+def _iter_blocks_with_pandas(filepath: Path, chunk_rows: int):
+    """Blockweiser Lesepfad über pandas für abweichende Dateiformate"""
+    import pandas as pd
+
+    reader = pd.read_csv(filepath, sep=";", usecols=[DISPLACEMENT_COLUMN, FORCE_COLUMN],
+                         decimal=',', encoding='utf-8', chunksize=chunk_rows)
+    for chunk in reader:
+        yield chunk.to_numpy(dtype=np.float64)
+
+
+def analyze_tracking_file(filepath: Path, config: YarnPulloutConfig = YarnPulloutConfig(),
+                          block_size: int = BLOCK_SIZE) -> StreamingResult:
+    """
+    Analysiert eine Tracking-CSV in einem Durchlauf, ohne die Rohdaten zu behalten.
+
+    Args:
+        filepath: Pfad zur CSV-Datei
+        config: Analysekonfiguration
+        block_size: Ungefähre Blockgröße in Bytes
+
+    Returns:
+        StreamingResult der Messung
+    """
+    state = StreamingState(config)
+    try:
+        for block in iter_tracking_blocks(filepath, block_size=block_size):
+            state.update(block)
+    except TrackingFormatError as e:
+        logger.debug(f"Schneller Parser nicht anwendbar für {filepath}: {str(e)}")
+        state = StreamingState(config)
+        for block in _iter_blocks_with_pandas(filepath, max(1, block_size // 64)):
+            state.update(block)
+    return state.result()
+
+
+class TrackingFileTail:
+    """
+    Verfolgt eine Tracking-CSV, während die Prüfmaschine noch Zeilen anhängt.
+
+    Jeder Aufruf von poll() liest nur die seit dem letzten Aufruf angehängten
+    Bytes, parst die vollständigen Zeilen und führt damit einen StreamingState
+    fort. Eine halb geschriebene letzte Zeile wird bis zum nächsten Aufruf
+    zurückgehalten, fehlerhafte vollständige Zeilen werden übersprungen. Wird
+    die Datei gekürzt oder ersetzt (neue Messung unter gleichem Namen), beginnt
+    die Auswertung von vorn.
+    """
+
+    def __init__(self, filepath: Path, config: YarnPulloutConfig = YarnPulloutConfig(),
+                 block_size: int = BLOCK_SIZE):
+        self.filepath = Path(filepath)
+        self.config = config
+        self.block_size = block_size
+        self._reset(None)
+
+    def _reset(self, identity) -> None:
+        self.state = StreamingState(self.config)
+        self._identity = identity  # (Gerät, Inode) der verfolgten Datei
+        self._offset = 0
+        self._header_done = False
+        self._pending = b''  # unvollständige Zeile am Dateiende
+
+    def poll(self) -> int:
+        """
+        Liest die neu angehängten Daten.
+
+        Returns:
+            Anzahl neu verarbeiteter Datenzeilen (0, falls die Datei nicht gewachsen ist)
+        """
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            return 0
+        identity = (stat.st_dev, stat.st_ino)
+        if identity != self._identity or stat.st_size < self._offset:
+            if self._identity is not None:
+                logger.info(f"{self.filepath.name} wurde ersetzt oder gekürzt, Auswertung beginnt neu")
+            self._reset(identity)
+        if stat.st_size == self._offset:
+            return 0
+
+        rows = 0
+        with open(self.filepath, 'rb') as file:
+            file.seek(self._offset)
+            while True:
+                chunk = file.read(self.block_size)
+                if not chunk:
+                    break
+                self._offset += len(chunk)
+                rows += self._consume(self._pending + chunk)
+        return rows
+
+    def _consume(self, data: bytes) -> int:
+        """Verarbeitet alle vollständigen Zeilen und merkt sich den Rest"""
+        if not self._header_done:
+            newline = data.find(b'\n')
+            if newline < 0:
+                self._pending = data
+                return 0
+            data = data[newline + 1:]
+            self._header_done = True
+
+        end = data.rfind(b'\n') + 1
+        self._pending = data[end:]
+        if end == 0:
+            return 0
+        block = self._parse_lines(data[:end])
+        if block.shape[0]:
+            self.state.update(block)
+        return block.shape[0]
+
+    def _parse_lines(self, data: bytes) -> np.ndarray:
+        """
+        Parst vollständige Zeilen; schlägt der Block fehl, wird zeilenweise geparst
+        und jede fehlerhafte Zeile (z.B. verstümmelt oder zu kurz) übersprungen.
+        """
+        try:
+            return parse_tracking_block(data)
+        except TrackingFormatError:
+            pass
+        rows = []
+        for line in data.splitlines(keepends=True):
+            if not line.strip():
+                continue
+            try:
+                rows.append(parse_tracking_block(line))
+            except TrackingFormatError as e:
+                logger.warning(f"Fehlerhafte Zeile in {self.filepath.name} übersprungen: {str(e)}")
+        return np.concatenate(rows) if rows else np.empty((0, 2))
+
+    def finish(self) -> int:
+        """
+        Übernimmt eine letzte Zeile ohne abschließenden Zeilenumbruch (Messung beendet).
+
+        Returns:
+            Anzahl zusätzlich verarbeiteter Zeilen (0 oder 1)
+        """
+        rows = self.poll()
+        if self._header_done and self._pending.strip():
+            rows += self._consume(self._pending + b'\n')
+        return rows
+
+    def result(self) -> Optional[StreamingResult]:
+        """Aktuelle Kennwerte oder None, solange noch keine Datenzeile vorliegt"""
+        if self.state.sample_count == 0:
+            return None
+        return self.state.result()
+
@@ -0,0 +1,321 @@
+# src/core/tracking_reader.py
+import io
+import logging
+from pathlib import Path
+import numpy as np
+from typing import Dict, Iterator, Optional, Tuple, Sequence
+
+DISPLACEMENT_COLUMN = 7  # Weg in mm
+FORCE_COLUMN = 8  # Kraft in kN
+BLOCK_SIZE = 8 * 1024 * 1024  # Blockgröße beim blockweisen Parsen
+RANGE_BLOCK_SIZE = 256 * 1024  # Kleinere Blöcke beim Lesen bis zu einem Weg-Horizont
+
+_MAX_FIELD_WIDTH = 24
+_MAX_DIGITS = 15  # Mantisse bleibt exakt als float64 darstellbar
+_POWERS_OF_TEN = 10.0 ** np.arange(_MAX_DIGITS + 1)
+_DECIMAL_COMMA = bytes.maketrans(b',', b'.')
+
+# Zeichenklassen für den Byte-Parser
+_INVALID, _DIGIT, _SEPARATOR, _PADDING, _SIGN = range(5)
+_CHAR_CLASS = np.full(256, _INVALID, dtype=np.uint8)
+_CHAR_CLASS[ord('0'):ord('9') + 1] = _DIGIT
+_CHAR_CLASS[[ord(','), ord('.')]] = _SEPARATOR
+_CHAR_CLASS[0] = _PADDING
+_CHAR_CLASS[[ord('-'), ord('+')]] = _SIGN
+
+logger = logging.getLogger('YarnPullout')
+
+
+class TrackingFormatError(ValueError):
+    """Die Daten entsprechen nicht dem erwarteten Exportformat der Prüfmaschine"""
+
+
+def _parse_decimal_fields(buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Wandelt Dezimalzahlen mit Komma (z.B. "-0,1234") vektorisiert in float64 um.
+
+    Die Felder werden spaltenweise (Zeichenposition für Zeichenposition) nach dem
+    Horner-Schema zu einer ganzzahligen Mantisse aufgebaut und durch eine exakte
+    Zehnerpotenz geteilt; das Ergebnis ist damit korrekt gerundet wie beim Parsen
+    eines Strings.
+    """
+    widths = ends - starts
+    if widths.size == 0:
+        return np.empty(0)
+    width = int(widths.max())
+    if widths.min() < 1 or width > _MAX_FIELD_WIDTH:
+        raise TrackingFormatError("Leeres oder zu langes Zahlenfeld")
+
+    # Zeichenmatrix (Position x Feld), damit jede Position zusammenhängend liegt
+    positions = np.arange(width)[:, None]
+    chars = buffer[np.minimum(starts + positions, buffer.shape[0] - 1)]
+    chars[positions >= widths] = 0
+
+    classes = _CHAR_CLASS[chars]
+    is_digit = classes == _DIGIT
+    is_separator = classes == _SEPARATOR
+    if np.any(classes[1:] == _SIGN) or np.any(classes == _INVALID):
+        raise TrackingFormatError("Unerwartete Zeichen in Zahlenfeld")
+    digits = is_digit.sum(axis=0, dtype=np.int8)
+    if np.any(is_separator.sum(axis=0, dtype=np.int8) > 1) or np.any(digits == 0) or np.any(digits > _MAX_DIGITS):
+        raise TrackingFormatError("Ungültiges Zahlenformat")
+    digit_values = chars - np.uint8(ord('0'))
+
+    count = starts.shape[0]
+    mantissa = np.zeros(count, dtype=np.int64)
+    decimals = np.zeros(count, dtype=np.int8)
+    after_separator = np.zeros(count, dtype=bool)
+    for position in range(width):
+        digit = is_digit[position]
+        mantissa = np.where(digit, mantissa * 10 + digit_values[position], mantissa)
+        decimals += digit & after_separator
+        after_separator |= is_separator[position]
+
+    values = mantissa / _POWERS_OF_TEN[decimals]
+    values[chars[0] == ord('-')] *= -1
+    return values
+
+
+def _parse_block_fast(data: bytes, columns: Sequence[int]) -> np.ndarray:
+    """Vektorisierter Parser für Blöcke mit konstanter Spaltenanzahl"""
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == ord('\n'))
+    if newlines.size == 0:
+        return np.empty((0, len(columns)))
+    separators = np.flatnonzero(buffer == ord(';'))
+
+    line_count = newlines.shape[0]
+    if separators.size % line_count:
+        raise TrackingFormatError("Uneinheitliche Spaltenanzahl")
+    per_line = separators.size // line_count
+    if per_line < max(columns):
+        raise TrackingFormatError("Zu wenige Spalten")
+    separators = separators.reshape(line_count, per_line)
+
+    # Alle Trennzeichen einer Zeile müssen vor deren Zeilenende liegen
+    line_starts = np.concatenate(([0], newlines[:-1] + 1))
+    if np.any(separators[:, 0] < line_starts) or np.any(separators[:, -1] > newlines):
+        raise TrackingFormatError("Uneinheitliche Spaltenanzahl")
+
+    line_ends = newlines - (buffer[np.maximum(newlines - 1, 0)] == ord('\r'))
+
+    # Alle gewünschten Spalten in einem gemeinsamen Durchlauf umwandeln
+    starts = np.concatenate([
+        line_starts if column == 0 else separators[:, column - 1] + 1 for column in columns])
+    ends = np.concatenate([
+        line_ends if column == per_line else separators[:, column] for column in columns])
+    values = _parse_decimal_fields(buffer, starts, ends)
+    return values.reshape(len(columns), line_count).T
+
+
+def _parse_block_generic(data: bytes, columns: Sequence[int]) -> np.ndarray:
+    """Langsamerer, toleranterer Parser (z.B. für Exponentendarstellung oder Leerzeilen)"""
+    text = bytes(data).translate(_DECIMAL_COMMA).decode('latin-1')
+    try:
+        return np.loadtxt(io.StringIO(text), delimiter=';', usecols=tuple(columns),
+                          dtype=np.float64, ndmin=2)
+    except ValueError as e:
+        raise TrackingFormatError(str(e)) from e
+
+
+def parse_tracking_block(data: bytes, columns: Sequence[int] = (DISPLACEMENT_COLUMN, FORCE_COLUMN)) -> np.ndarray:
+    """
+    Parst einen Block vollständiger Datenzeilen (ohne Kopfzeile).
+
+    Args:
+        data: Bytes mit vollständigen, durch Zeilenumbruch abgeschlossenen Zeilen
+        columns: Zu lesende Spaltenindizes
+
+    Returns:
+        Array der Form (Zeilen, len(columns))
+    """
+    try:
+        return _parse_block_fast(data, columns)
+    except TrackingFormatError:
+        return _parse_block_generic(data, columns)
+
+
+def _iter_raw_blocks(filepath: Path, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Zerlegt eine Tracking-CSV (ohne Kopfzeile) in Blöcke vollständiger Zeilen.
+
+    Die Datei wird unabhängig von ihrer Größe in Stücken von block_size Bytes
+    gelesen; eine angeschnittene letzte Zeile wird dem nächsten Stück
+    vorangestellt. Der Speicherbedarf hängt so nur von der Blockgröße ab, nicht
+    von der Dateilänge. Die Blöcke sind nur bis zum nächsten Schritt gültig.
+    """
+    with open(filepath, 'rb') as file:
+        header = file.readline()
+        if not header:
+            raise TrackingFormatError("Leere Datei")
+        if not header.endswith(b'\n'):
+            raise TrackingFormatError("Keine Datenzeilen vorhanden")
+
+        remainder = b''
+        while True:
+            chunk = file.read(block_size)
+            if not chunk:
+                break
+            data = remainder + chunk if remainder else chunk
+            end = data.rfind(b'\n') + 1
+            if end == 0:
+                remainder = data  # Zeile länger als ein Block
+                continue
+            remainder = data[end:]
+            yield memoryview(data)[:end]
+        if remainder:
+            yield remainder + b'\n'
+
+
+def iter_tracking_blocks(filepath: Path, columns: Sequence[int] = (DISPLACEMENT_COLUMN, FORCE_COLUMN),
+                         block_size: int = BLOCK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Liest eine Tracking-CSV blockweise als Bytes und liefert die geparsten Spalten.
+
+    Es liegt immer nur ein Block der Datei im Speicher (siehe _iter_raw_blocks).
+
+    Args:
+        filepath: Pfad zur CSV-Datei
+        columns: Zu lesende Spaltenindizes
+        block_size: Ungefähre Blockgröße in Bytes
+
+    Yields:
+        Arrays der Form (Zeilen, len(columns)) je Block
+    """
+    for block in _iter_raw_blocks(filepath, block_size):
+        yield parse_tracking_block(block, columns)
+
+
+def _read_with_pandas(filepath: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Generischer Lesepfad über pandas für abweichende Dateiformate"""
+    import pandas as pd
+
+    dataset = pd.read_csv(
+        filepath,
+        sep=";",
+        usecols=[DISPLACEMENT_COLUMN, FORCE_COLUMN],  # [x in mm, y in kN]
+        decimal=',',
+        encoding='utf-8'
+    )
+    return (dataset.iloc[:, 0].to_numpy(dtype=np.float64),
+            dataset.iloc[:, 1].to_numpy(dtype=np.float64))
+
+
+def read_tracking_columns(filepath: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Liest Weg (Spalte 7) und Kraft (Spalte 8) aus einer .steps.tracking.csv.
+
+    Verwendet den schnellen Byte-Parser; Dateien, die nicht dem Exportformat
+    der Prüfmaschine entsprechen, werden über pandas gelesen.
+
+    Args:
+        filepath: Pfad zur CSV-Datei
+
+    Returns:
+        Tupel (Weg, Kraft) als float64-Arrays
+    """
+    try:
+        blocks = list(iter_tracking_blocks(filepath))
+    except TrackingFormatError as e:
+        logger.debug(f"Schneller Parser nicht anwendbar für {filepath}: {str(e)}")
+        return _read_with_pandas(filepath)
+
+    if not blocks:
+        return np.empty(0), np.empty(0)
+    data = np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+    return data[:, 0].copy(), data[:, 1].copy()
+
+
+def read_tracking_range(filepath: Path, horizon: float, hysteresis: float = 0.1,
+                        confirm_samples: int = 10, scan_force_tail: bool = True,
+                        block_size: int = RANGE_BLOCK_SIZE,
+                        counter: Optional[Dict[str, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Liest Weg und Kraft nur bis zu einem Weg-Horizont (relativ zum ersten Messpunkt).
+
+    Das Parsen endet, sobald der Weg für confirm_samples aufeinanderfolgende Punkte
+    über horizon + hysteresis liegt; einzelne Ausreißer durch Rauschen beenden das
+    Lesen also nicht. Mit scan_force_tail wird der Rest der Datei nur noch in der
+    Kraftspalte nach einem höheren Maximum durchsucht. Liegt dort ein höheres
+    Maximum (Modul und Maximalkraft hängen davon ab), wird die ganze Datei gelesen.
+
+    Args:
+        filepath: Pfad zur CSV-Datei
+        horizon: Größter benötigter Weg in mm (relativ zum ersten Messpunkt)
+        hysteresis: Zusätzlicher Abstand zum Horizont in mm
+        confirm_samples: Anzahl aufeinanderfolgender Punkte jenseits des Horizonts
+        scan_force_tail: Restliche Kraftwerte auf ein höheres Maximum prüfen
+        block_size: Ungefähre Blockgröße in Bytes
+        counter: Erhält unter 'bytes_read' die Anzahl der tatsächlich geparsten Bytes
+            (inklusive eines vollständigen Lesens als Rückfall)
+
+    Returns:
+        Tupel (Weg, Kraft) als float64-Arrays bis einschließlich des Abbruchpunkts
+    """
+    counter = {} if counter is None else counter
+    counter['bytes_read'] = 0
+
+    def read_fully() -> Tuple[np.ndarray, np.ndarray]:
+        counter['bytes_read'] += filepath.stat().st_size
+        return read_tracking_columns(filepath)
+
+    def counted(blocks: Iterator[bytes]) -> Iterator[bytes]:
+        for block in blocks:
+            counter['bytes_read'] += len(block)
+            yield block
+
+    confirm_samples = max(1, confirm_samples)
+    blocks = []
+    origin = None
+    run = 0  # aufeinanderfolgende Punkte jenseits des Horizonts
+    stopped = False
+    source_blocks = _iter_raw_blocks(filepath, block_size)
+    raw_blocks = counted(source_blocks)
+    try:
+        for block in raw_blocks:
+            data = parse_tracking_block(block)
+            if data.shape[0] == 0:
+                continue
+            if origin is None:
+                origin = data[0, 0]
+            beyond = (data[:, 0] - origin) > horizon + hysteresis
+
+            # Folge von Punkten jenseits des Horizonts über Blockgrenzen hinweg fortführen
+            breaks = np.flatnonzero(~beyond)
+            run_starts = np.concatenate(([0], breaks + 1))
+            run_ends = np.concatenate((breaks, [beyond.shape[0]]))
+            run_lengths = run_ends - run_starts
+            run_lengths[0] += run
+            confirmed = np.flatnonzero(run_lengths >= confirm_samples)
+            if confirmed.size:
+                stop = run_starts[confirmed[0]] + confirm_samples - (run if confirmed[0] == 0 else 0)
+                blocks.append(data[:stop])
+                stopped = True
+                break
+            blocks.append(data)
+            run = run_lengths[-1]
+
+        if stopped and scan_force_tail:
+            head_max = max(block[:, 1].max() for block in blocks if block.shape[0])
+            tail = data[stop:, 1]
+            tail_max = tail.max() if tail.size else -np.inf
+            for block in raw_blocks:
+                if tail_max > head_max:
+                    break
+                forces = parse_tracking_block(block, (FORCE_COLUMN,))
+                if forces.size:
+                    tail_max = max(tail_max, forces.max())
+            if tail_max > head_max:
+                logger.debug(f"Höheres Kraftmaximum nach dem Horizont in {filepath}, lese vollständig")
+                return read_fully()
+    except TrackingFormatError as e:
+        logger.debug(f"Bereichslesen nicht anwendbar für {filepath}: {str(e)}")
+        return read_fully()
+    finally:
+        raw_blocks.close()
+        source_blocks.close()
+
+    if not blocks:
+        return np.empty(0), np.empty(0)
+    data = np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+    return data[:, 0].copy(), data[:, 1].copy()
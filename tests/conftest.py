@@ -0,0 +1,46 @@
+# tests/conftest.py
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+# Module werden wie in main.py als src.core.* importiert
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+TRACKING_HEADER = "Zeit;Schritt;A;B;C;D;E;Weg [mm];Kraft [kN];Extra"
+
+
+def write_tracking_csv(path: Path, displacement, force) -> Path:
+    """Schreibt eine Messung im Exportformat der Prüfmaschine (Weg Spalte 7, Kraft Spalte 8)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [TRACKING_HEADER]
+    for i, (x, y) in enumerate(zip(displacement, force)):
+        lines.append(f"{i * 0.01:.2f};{i};a;1,5;x;2;3;{x:.4f};{y:.4f};z".replace('.', ','))
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def tracking_csv():
+    """Schreibfunktion für einzelne Tracking-CSVs"""
+    return write_tracking_csv
+
+
+@pytest.fixture
+def make_summary(tmp_path):
+    """
+    Erzeugt einen Zusammenfassungsordner <Reihe>/<Reihe>_M<i>/<Reihe>_M<i>.steps.tracking.csv
+    mit verrauschten Kraft-Weg-Kurven.
+    """
+    def make(series=("Reihe_01", "Reihe_02"), measurements: int = 3, points: int = 200, seed: int = 0) -> Path:
+        rng = np.random.default_rng(seed)
+        root = tmp_path / "summary"
+        for name in series:
+            for i in range(1, measurements + 1):
+                displacement = 0.37 + np.cumsum(rng.uniform(0.0, 0.02, points))
+                force = 0.05 + np.sin(np.linspace(0.0, rng.uniform(2.0, 3.0), points)) + rng.normal(0.0, 0.02, points)
+                measurement = f"{name}_M{i}"
+                write_tracking_csv(root / name / measurement / f"{measurement}.steps.tracking.csv",
+                                   displacement, force)
+        return root
+    return make
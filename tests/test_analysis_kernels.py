@@ -0,0 +1,109 @@
+# tests/test_analysis_kernels.py
+import numpy as np
+import pytest
+from src.core.analysis_kernels import force_modulus_kernel, work_kernel
+
+
+def _measurements(seed: int = 0):
+    """Zufällige Kraft-Weg-Kurven mit Rauschen, Rückläufen des Wegs und Sonderfällen"""
+    rng = np.random.default_rng(seed)
+    curves = []
+    for length in rng.integers(20, 400, 25):
+        displacement = np.cumsum(rng.uniform(-0.002, 0.01, length))
+        force = np.sin(np.linspace(0.0, rng.uniform(1.0, 4.0), length)) + rng.normal(0.0, 0.05, length)
+        curves.append((displacement, force))
+    curves.append((np.array([0.0, 0.1, 0.2]), np.array([3.0, 1.0, 2.0])))  # Maximum am Anfang
+    curves.append((np.array([0.5]), np.array([1.0])))  # einzelner Punkt
+    curves.append((np.empty(0), np.empty(0)))  # leere Messung
+    curves.append((np.array([20.0, 21.0]), np.array([1.0, 2.0])))  # vollständig hinter dem Limit
+    return curves
+
+
+def _columnar(curves):
+    offsets = np.concatenate(([0], np.cumsum([len(x) for x, _ in curves])))
+    return (np.concatenate([x for x, _ in curves]), np.concatenate([y for _, y in curves]), offsets)
+
+
+def _modulus_loop(measurement, threshold_low, threshold_high):
+    """Bisherige Einzelberechnung aus calculate_force_modulus; None falls nicht berechenbar"""
+    if not measurement:
+        return None
+    max_point = max(measurement, key=lambda point: point[1])
+    max_force_index = measurement.index(max_point)
+    index_low = index_high = None
+    for i, point in enumerate(measurement[:max_force_index]):
+        if point[1] >= max_point[1] * threshold_low and index_low is None:
+            index_low = i
+        if point[1] >= max_point[1] * threshold_high and index_high is None:
+            index_high = i
+    if index_low is None or index_high is None:
+        return None
+    if index_low > index_high:
+        index_low, index_high = index_high, index_low
+    point_low, point_high = measurement[index_low], measurement[index_high]
+    return (point_high[1] - point_low[1]) / (point_high[0] - point_low[0])
+
+
+def _work_loop(measurement, distance_limit):
+    """Bisherige Einzelberechnung aus calculate_work; None falls keine Punkte bis zum Limit"""
+    filtered = [(x, y) for x, y in measurement if x <= distance_limit]
+    if not filtered:
+        return None
+    return np.trapezoid([y for _, y in filtered], [x for x, _ in filtered])
+
+
+def _work_interpolated_loop(measurement, distance_limit):
+    """Integration bis zum ersten Überschreiten des Limits, letztes Trapez bei distance_limit abgeschnitten"""
+    if not measurement or measurement[0][0] > distance_limit:
+        return None
+    kept = []
+    for i, (x, y) in enumerate(measurement):
+        if x > distance_limit:
+            x0, y0 = measurement[i - 1]
+            kept.append((distance_limit, y0 + (y - y0) * (distance_limit - x0) / (x - x0)))
+            break
+        kept.append((x, y))
+    return np.trapezoid([y for _, y in kept], [x for x, _ in kept])
+
+
+def _points(curve):
+    return list(zip(curve[0].tolist(), curve[1].tolist()))
+
+
+@pytest.mark.parametrize("threshold_low, threshold_high", [(0.2, 0.7), (0.7, 0.2), (0.05, 0.95)])
+def test_force_modulus_kernel_matches_loop(threshold_low, threshold_high):
+    curves = _measurements()
+    displacement, force, offsets = _columnar(curves)
+    result = force_modulus_kernel(displacement, force, offsets, threshold_low, threshold_high)
+
+    expected = [_modulus_loop(_points(curve), threshold_low, threshold_high) for curve in curves]
+    assert any(value is not None for value in expected)
+    for modulus, reference in zip(result.modulus, expected):
+        if reference is None:
+            assert np.isnan(modulus)
+        else:
+            assert modulus == reference
+
+
+@pytest.mark.parametrize("distance_limit", [0.3, 1.0, 100.0])
+def test_work_kernel_matches_loop(distance_limit):
+    curves = _measurements()
+    displacement, force, offsets = _columnar(curves)
+    work = work_kernel(displacement, force, offsets, distance_limit)
+
+    expected = np.array([np.nan if value is None else value
+                         for value in (_work_loop(_points(curve), distance_limit) for curve in curves)])
+    # reduceat summiert der Reihe nach, np.trapezoid paarweise
+    np.testing.assert_allclose(work, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("distance_limit", [0.3, 1.0, 100.0])
+def test_work_kernel_interpolated_matches_loop(distance_limit):
+    curves = _measurements()
+    displacement, force, offsets = _columnar(curves)
+    work = work_kernel(displacement, force, offsets, distance_limit, interpolate=True)
+
+    expected = np.array([np.nan if value is None else value
+                         for value in (_work_interpolated_loop(_points(curve), distance_limit)
+                                       for curve in curves)])
+    np.testing.assert_allclose(work, expected, rtol=1e-12, atol=1e-12)
@@ -0,0 +1,65 @@
+# tests/test_async_pipeline.py
+import pytest
+import main
+from src.core import async_pipeline, series_processor
+from src.core.async_pipeline import PipelineSettings, run_pipeline
+from src.core.data_analyzer import YarnPulloutConfig
+from src.core.debug_printer import DebugPrinter
+from src.core.excel_exporter import ExcelExporter
+from src.core.series_processor import analyse_series
+
+SERIES = ("Reihe_03", "Reihe_01", "Reihe_05", "Reihe_02", "Reihe_04")
+SETTINGS = PipelineSettings(read_workers=3, analysis_workers=2, queue_size=1)
+
+
+def _summary_rows(summary, output_path, pipeline):
+    exporter = ExcelExporter()
+    main.process_multiple_analysis(summary, YarnPulloutConfig(), None, exporter, DebugPrinter(),
+                                   output_path=output_path, pipeline=pipeline)
+    return exporter.results
+
+
+def test_pipeline_matches_sequential_analysis(make_summary, tmp_path):
+    summary = make_summary(SERIES)
+    sequential = _summary_rows(summary, tmp_path / "seriell.xlsx", None)
+    staged = _summary_rows(summary, tmp_path / "gestuft.xlsx", SETTINGS)
+
+    assert sorted(sequential['Messreihe']) == sorted(SERIES)
+    assert staged == sequential
+
+
+def test_pipeline_keeps_folder_order_and_reports_errors(make_summary, tmp_path, monkeypatch):
+    summary = make_summary(SERIES)
+    compute = series_processor.compute_series
+
+    def failing(result, analyzer):
+        if result.name == "Reihe_05":
+            raise ValueError("Testfehler")
+        compute(result, analyzer)
+
+    monkeypatch.setattr(series_processor, "compute_series", failing)
+    monkeypatch.setattr(async_pipeline, "compute_series", failing)
+
+    folders = [summary / name for name in SERIES]
+    received = []
+    count = run_pipeline(folders, YarnPulloutConfig(), None, DebugPrinter(), tmp_path / "plots_gesamt",
+                         received.append, SETTINGS)
+    expected = [analyse_series(folder, YarnPulloutConfig(), None, DebugPrinter(), tmp_path / "plots_gesamt")
+                for folder in folders]
+
+    assert count == len(SERIES)
+    assert [result.name for result in received] == list(SERIES)
+    assert [result.error for result in received] == [result.error for result in expected]
+    assert received[2].error == "Testfehler" and received[2].stats is None
+    assert [result.stats for result in received] == [result.stats for result in expected]
+
+
+def test_pipeline_propagates_sink_errors(make_summary, tmp_path):
+    summary = make_summary(SERIES)
+
+    def sink(result):
+        raise RuntimeError("Senke fehlgeschlagen")
+
+    with pytest.raises(RuntimeError, match="Senke fehlgeschlagen"):
+        run_pipeline([summary / name for name in SERIES], YarnPulloutConfig(), None, DebugPrinter(),
+                     tmp_path / "plots_gesamt", sink, SETTINGS)
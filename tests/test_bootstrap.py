@@ -0,0 +1,50 @@
+# tests/test_bootstrap.py
+import numpy as np
+from src.core import bootstrap
+from src.core.bootstrap import BootstrapSettings, bootstrap_mean_intervals
+from src.core.excel_exporter import ExcelExporter
+from src.core.running_stats import SeriesStatistics
+
+GROUPS = [np.array([1.0, 2.0, 4.0]), np.array([0.5, 0.7, 0.9, 1.4, 2.2, 0.1]), np.empty(0), np.array([3.0])]
+
+
+def test_intervals_do_not_depend_on_chunk_size(monkeypatch):
+    expected = bootstrap_mean_intervals(GROUPS, resamples=1000, seed=3)
+    monkeypatch.setattr(bootstrap, "_CHUNK_ELEMENTS", 50)
+    np.testing.assert_array_equal(bootstrap_mean_intervals(GROUPS, resamples=1000, seed=3), expected)
+    assert np.isnan(expected[2]).all()
+    assert (expected[[0, 1], 0] < expected[[0, 1], 1]).all()
+
+
+def test_group_gets_same_interval_alone_or_in_batch():
+    batch = bootstrap_mean_intervals(GROUPS, resamples=500, seed=1)
+    alone = bootstrap_mean_intervals(GROUPS[:1], resamples=500, seed=1)
+    np.testing.assert_array_equal(batch[0], alone[0])
+
+
+def test_streaming_export_matches_batch_intervals(tmp_path):
+    settings = BootstrapSettings(resamples=200)
+    series = [(f"S{i}", {'max_force': group, 'work': group * 2, 'modulus': group + 1})
+              for i, group in enumerate(GROUPS) if group.size]
+
+    def export(exporter):
+        for name, samples in series:
+            statistics = SeriesStatistics.from_values(samples['max_force'], samples['work'], samples['modulus'])
+            exporter.add_measurement_series(name, statistics.summary(), statistics, samples)
+
+    batch = ExcelExporter(settings)
+    export(batch)
+    batch._fill_confidence_intervals()
+
+    streaming = ExcelExporter(settings)
+    streaming.start_streaming(tmp_path / "ergebnisse.csv")
+    export(streaming)
+    assert streaming.has_results()
+    streaming.save_to_excel()
+
+    lines = (tmp_path / "ergebnisse.csv").read_text(encoding='utf-8').splitlines()
+    header = lines[0].split(';')
+    for row, line in enumerate(lines[1:]):
+        cells = dict(zip(header, line.split(';')))
+        assert float(cells['F_max_CI_low [kN]']) == batch.results['F_max_CI_low [kN]'][row]
+        assert float(cells['Work_CI_high [Nm]']) == batch.results['Work_CI_high [Nm]'][row]
@@ -0,0 +1,59 @@
+# tests/test_curve_index.py
+import numpy as np
+import pytest
+from src.core.analysis_kernels import force_modulus_kernel, work_kernel
+from src.core.curve_index import CurveIndex
+from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
+
+
+def _curves(seed: int = 1):
+    """Verrauschte Kurven, deren Weg immer wieder zurückläuft"""
+    rng = np.random.default_rng(seed)
+    curves = []
+    for length in rng.integers(30, 300, 20):
+        displacement = np.cumsum(rng.uniform(-0.004, 0.01, length))
+        force = np.sin(np.linspace(0.0, rng.uniform(1.0, 4.0), length)) + rng.normal(0.0, 0.05, length)
+        curves.append((displacement, force))
+    curves.append((np.array([0.0, 0.5, 0.1, 0.2]), np.array([0.0, 1.0, 0.5, 0.7])))  # Rücklauf unter die Grenze
+    curves.append((np.array([2.0, 0.1]), np.array([1.0, 2.0])))  # erster Punkt hinter der Grenze
+    curves.append((np.empty(0), np.empty(0)))
+    return curves
+
+
+def _columnar(curves):
+    offsets = np.concatenate(([0], np.cumsum([len(x) for x, _ in curves])))
+    return np.concatenate([x for x, _ in curves]), np.concatenate([y for _, y in curves]), offsets
+
+
+@pytest.mark.parametrize("fraction_low, fraction_high", [(0.2, 0.7), (0.7, 0.2), (0.05, 0.95)])
+def test_modulus_matches_kernel(fraction_low, fraction_high):
+    displacement, force, offsets = _columnar(_curves())
+    expected = force_modulus_kernel(displacement, force, offsets, fraction_low, fraction_high)
+    result = CurveIndex(displacement, force, offsets).modulus(fraction_low, fraction_high)
+
+    np.testing.assert_array_equal(result.index_low, expected.index_low)
+    np.testing.assert_array_equal(result.index_high, expected.index_high)
+    np.testing.assert_array_equal(result.max_index, expected.max_index)
+    np.testing.assert_array_equal(result.modulus, expected.modulus)
+
+
+@pytest.mark.parametrize("interpolate", [False, True])
+@pytest.mark.parametrize("distance", [0.15, 0.3, 1.0, 100.0])
+def test_work_at_matches_kernel(distance, interpolate):
+    displacement, force, offsets = _columnar(_curves())
+    expected = work_kernel(displacement, force, offsets, distance, interpolate)
+    work = CurveIndex(displacement, force, offsets).work_at(distance, interpolate)
+    np.testing.assert_allclose(work, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("interpolate", [False, True])
+def test_work_up_to_matches_calculate_work(interpolate):
+    config = YarnPulloutConfig(distance_limit=0.3, interpolate_work_cutoff=interpolate)
+    analyzer = YarnPulloutAnalyzer(config)
+    for displacement, force in _curves()[:-1]:
+        analyzer.add_measurement(displacement, force, normalized=True)
+    analyzer.calculate_work()
+
+    assert np.any(np.diff(analyzer.store.displacement) < 0)
+    np.testing.assert_allclose(analyzer.work_up_to(config.distance_limit), analyzer.work_values,
+                               rtol=1e-12, atol=1e-12)
@@ -0,0 +1,44 @@
+# tests/test_measurement_archive.py
+import numpy as np
+from src.core.data_analyzer import YarnPulloutConfig, YarnPulloutAnalyzer
+from src.core.measurement_archive import build_archive
+
+
+def _loaded(folder):
+    """Messungen einer Reihe wie in der normalen Analyse über load_data"""
+    analyzer = YarnPulloutAnalyzer(YarnPulloutConfig())
+    for csv_path in sorted(folder.glob("*/*.steps.tracking.csv")):
+        analyzer.load_data(csv_path)
+    return analyzer
+
+
+def test_archive_round_trip_matches_load_data(make_summary, tmp_path):
+    summary = make_summary()
+    archive = build_archive(summary, tmp_path / "out" / "archiv", YarnPulloutConfig(storage_dtype='float64'),
+                            progress=lambda message: None)
+
+    assert archive.series_names() == ["Reihe_01", "Reihe_02"]
+    for series in archive.series_names():
+        store, names = archive.load_series(series)
+        expected = _loaded(summary / series)
+        assert names == expected.measurement_names
+        assert archive.is_current(series, summary / series)
+        for i in range(len(expected.store)):
+            np.testing.assert_array_equal(store[i][0], expected.store[i][0])
+            np.testing.assert_array_equal(store[i][1], expected.store[i][1])
+
+
+def test_archive_outside_summary_keeps_series_with_same_prefix(make_summary, tmp_path):
+    summary = make_summary()
+    archive = build_archive(summary, tmp_path / "out" / "Rei", progress=lambda message: None)
+    assert archive.series_names() == ["Reihe_01", "Reihe_02"]
+    assert sum(len(archive.measurement_names(series)) for series in archive.series_names()) == 6
+
+
+def test_archive_inside_summary_is_not_imported(make_summary):
+    summary = make_summary()
+    build_archive(summary, summary / "Rei", progress=lambda message: None)
+    # Beim erneuten Aufbau liegt das Archiv selbst als Ordner im Zusammenfassungsordner
+    archive = build_archive(summary, summary / "Rei", progress=lambda message: None)
+    assert archive.series_names() == ["Reihe_01", "Reihe_02"]
+    assert not (summary / "Rei.partial").exists() and not (summary / "Rei.old").exists()
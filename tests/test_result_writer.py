@@ -0,0 +1,76 @@
+# tests/test_result_writer.py
+from src.core.excel_exporter import ExcelExporter
+from src.core.result_writer import StreamingResultWriter
+from src.core.running_stats import SeriesStatistics
+
+COLUMNS = ['Messreihe', 'F_max', 'Arbeit']
+
+
+def _interrupted(path, rows):
+    """Schreibt Zeilen wie ein abgebrochener Lauf (Journal bleibt liegen)"""
+    writer = StreamingResultWriter(path, COLUMNS)
+    for row in rows:
+        writer.write_row(row)
+    writer._journal.close()
+    return writer.journal_path
+
+
+def test_resume_drops_torn_line_before_appending(tmp_path):
+    path = tmp_path / "ergebnisse.csv"
+    journal_path = _interrupted(path, [{'Messreihe': 'S1', 'F_max': 1.0, 'Arbeit': 2.0}])
+    with open(journal_path, 'a', encoding='utf-8', newline='') as file:
+        file.write("S2;1,5")  # Abbruch mitten in der Zeile
+
+    writer = StreamingResultWriter(path, COLUMNS, resume=True)
+    assert writer.completed == ['S1']
+    writer.write_row({'Messreihe': 'S3', 'F_max': 3.0, 'Arbeit': 4.0})
+    writer._journal.close()
+    assert StreamingResultWriter(path, COLUMNS, resume=True).completed == ['S1', 'S3']
+
+    writer = StreamingResultWriter(path, COLUMNS, resume=True)
+    writer.close()
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert lines == ['Messreihe;F_max;Arbeit', 'S1;1.0;2.0', 'S3;3.0;4.0']
+    assert not journal_path.exists()
+
+
+def test_resume_drops_last_row_cut_within_its_fields(tmp_path):
+    path = tmp_path / "ergebnisse.csv"
+    journal_path = _interrupted(path, [{'Messreihe': 'S1', 'F_max': 1.0, 'Arbeit': 2.0},
+                                       {'Messreihe': 'S2', 'F_max': 1.5, 'Arbeit': 2.25}])
+    content = journal_path.read_bytes()
+    # Spaltenanzahl bleibt gleich, aber die Zahl ist abgeschnitten
+    journal_path.write_bytes(content.replace(b'2.25;', b'2.2;'))
+    assert StreamingResultWriter(path, COLUMNS, resume=True).completed == ['S1']
+
+
+def test_resume_keeps_last_row_without_newline(tmp_path):
+    path = tmp_path / "ergebnisse.csv"
+    journal_path = _interrupted(path, [{'Messreihe': 'S1', 'F_max': 1.0, 'Arbeit': 2.0}])
+    journal_path.write_bytes(journal_path.read_bytes().rstrip(b'\r\n'))
+
+    writer = StreamingResultWriter(path, COLUMNS, resume=True)
+    writer.write_row({'Messreihe': 'S2', 'F_max': 3.0, 'Arbeit': None})
+    writer.close()
+
+    assert path.read_text(encoding='utf-8').splitlines() == ['Messreihe;F_max;Arbeit', 'S1;1.0;2.0', 'S2;3.0;']
+
+
+def test_resumed_series_stay_in_campaign_statistics(tmp_path):
+    path = tmp_path / "ergebnisse.csv"
+    first = SeriesStatistics.from_values([1.0, 2.0], [0.5, 0.7], [3.0, 4.0])
+    second = SeriesStatistics.from_values([1.5, 2.5, 3.5], [0.6], [2.0, 5.0])
+    stats = first.summary()
+
+    exporter = ExcelExporter()
+    exporter.start_streaming(path)
+    exporter.add_measurement_series('S1', stats, first)
+    exporter.writer._journal.close()  # Abbruch nach der ersten Messreihe
+
+    exporter = ExcelExporter()
+    assert exporter.start_streaming(path, resume=True) == ['S1']
+    exporter.add_measurement_series('S2', second.summary(), second)
+    exporter.save_to_excel()
+
+    expected = SeriesStatistics().merge(first).merge(second)
+    assert exporter.campaign.to_dict() == expected.to_dict()
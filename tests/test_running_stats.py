@@ -0,0 +1,23 @@
+# tests/test_running_stats.py
+import numpy as np
+from src.core.running_stats import RunningStats, SeriesStatistics
+
+
+def test_update_matches_numpy_and_merge_matches_single_batch():
+    values = np.random.default_rng(0).normal(3.0, 0.4, 101)
+    whole = RunningStats()
+    whole.update(values)
+    assert whole.mean == np.mean(values) and whole.std == np.std(values)
+
+    parts = RunningStats()
+    for chunk in np.array_split(values, 7):
+        parts.update(chunk)  # jeder Batch wird als Teilergebnis zusammengeführt
+    assert np.isclose(parts.mean, whole.mean, rtol=1e-14) and np.isclose(parts.std, whole.std, rtol=1e-14)
+
+
+def test_summary_rounds_like_previous_statistics():
+    # 2.675 und 1.115 runden mit round und np.round unterschiedlich
+    for values in ([2.675], [1.115], [1.0, 1.23]):
+        summary = SeriesStatistics.from_values(values, values, values).summary()
+        assert summary['max_force']['mean'] == round(np.mean(values), 2)
+        assert summary['work']['std'] == round(np.std(values), 2)
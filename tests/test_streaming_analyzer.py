@@ -0,0 +1,49 @@
+# tests/test_streaming_analyzer.py
+import numpy as np
+from src.core.streaming_analyzer import TrackingFileTail
+
+
+def _row(i: int, displacement: float, force: float) -> str:
+    return f"{i * 0.01:.2f};{i};a;1,5;x;2;3;{displacement:.4f};{force:.4f};z\n".replace('.', ',')
+
+
+def test_tail_follows_growing_file(tmp_path, tracking_csv):
+    displacement = np.linspace(0.0, 2.0, 50)
+    force = np.sin(np.linspace(0.0, 3.0, 50))
+    path = tracking_csv(tmp_path / "M1.steps.tracking.csv", displacement[:20], force[:20])
+    tail = TrackingFileTail(path, block_size=64)
+    assert tail.poll() == 20
+    assert tail.poll() == 0
+
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write("".join(_row(i, displacement[i], force[i]) for i in range(20, 50)))
+    assert tail.poll() == 30
+    assert tail.result().sample_count == 50
+    assert tail.result().max_force == np.round(force - force[0], 4).max()
+
+
+def test_tail_skips_bad_rows_and_waits_for_half_written_line(tmp_path, tracking_csv):
+    path = tracking_csv(tmp_path / "M1.steps.tracking.csv", [0.1, 0.2, 0.3], [0.0, 0.5, 1.0])
+    tail = TrackingFileTail(path)
+    assert tail.poll() == 3
+
+    row = _row(3, 0.4, 2.0)
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(row[:12])  # Zeile halb geschrieben
+    assert tail.poll() == 0
+
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(row[12:])
+        file.write("0,04;4;a;1,5\n")  # zu kurze Zeile
+        file.write("0,05;5;a;1,5;x;2;3;0,4x;9,0000;z\n")  # verstümmelte Zahl
+        file.write(_row(6, 0.5, 1.5))
+    assert tail.poll() == 2
+    assert tail.poll() == 0  # fehlerhafte Zeilen werden nicht erneut gelesen
+
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(_row(7, 0.6, 1.2).rstrip('\n'))  # letzte Zeile ohne Zeilenumbruch
+    assert tail.finish() == 1
+
+    result = tail.result()
+    assert result.sample_count == 6
+    assert result.max_force == 2.0
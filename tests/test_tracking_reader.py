@@ -0,0 +1,93 @@
+# tests/test_tracking_reader.py
+import numpy as np
+import pandas as pd
+import pytest
+from src.core.tracking_reader import (DISPLACEMENT_COLUMN, FORCE_COLUMN, iter_tracking_blocks,
+                                      read_tracking_columns, read_tracking_range)
+
+HEADER = "Zeit;Schritt;A;B;C;D;E;Weg [mm];Kraft [kN];Extra"
+
+
+def _decimal(value: float, digits: int) -> str:
+    return f"{value:.{digits}f}".replace('.', ',')
+
+
+def _write_sample(path, rows: int = 2000, newline: str = "\n", seed: int = 0):
+    """Tracking-CSV im Exportformat der Prüfmaschine mit wechselnden Nachkommastellen und Vorzeichen"""
+    rng = np.random.default_rng(seed)
+    displacement = np.cumsum(rng.uniform(0.0, 0.01, rows)) - 0.05
+    force = np.sin(np.linspace(0.0, 3.0, rows)) * 1.5 + rng.normal(0.0, 0.05, rows)
+    lines = [HEADER]
+    for i in range(rows):
+        lines.append(";".join([_decimal(i * 0.01, 2), str(i), "a", "1,5", "x", "2", "3",
+                               _decimal(displacement[i], 1 + i % 6), _decimal(force[i], 4), "z"]))
+    path.write_bytes((newline.join(lines) + newline).encode('utf-8'))
+    return path
+
+
+def _read_reference(path):
+    dataset = pd.read_csv(path, sep=';', decimal=',')
+    return (dataset.iloc[:, DISPLACEMENT_COLUMN].to_numpy(dtype=np.float64),
+            dataset.iloc[:, FORCE_COLUMN].to_numpy(dtype=np.float64))
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_read_tracking_columns_matches_pandas(tmp_path, newline):
+    path = _write_sample(tmp_path / "M1.steps.tracking.csv", newline=newline)
+    displacement, force = read_tracking_columns(path)
+    expected_displacement, expected_force = _read_reference(path)
+    np.testing.assert_array_equal(displacement, expected_displacement)
+    np.testing.assert_array_equal(force, expected_force)
+
+
+def test_block_boundaries_match_pandas(tmp_path):
+    path = _write_sample(tmp_path / "M1.steps.tracking.csv")
+    data = np.concatenate(list(iter_tracking_blocks(path, block_size=1000)))
+    expected_displacement, expected_force = _read_reference(path)
+    np.testing.assert_array_equal(data[:, 0], expected_displacement)
+    np.testing.assert_array_equal(data[:, 1], expected_force)
+
+
+def test_exponent_notation_falls_back_to_generic_parser(tmp_path):
+    path = tmp_path / "M1.steps.tracking.csv"
+    path.write_text(HEADER + "\n"
+                    "0,00;0;a;1,5;x;2;3;1,5E-3;-2,5e-2;z\n"
+                    "0,01;1;a;1,5;x;2;3;0,0020;0,0310;z\n", encoding='utf-8')
+    displacement, force = read_tracking_columns(path)
+    expected_displacement, expected_force = _read_reference(path)
+    np.testing.assert_array_equal(displacement, expected_displacement)
+    np.testing.assert_array_equal(force, expected_force)
+
+
+def test_read_tracking_range_beyond_data_reads_whole_file(tmp_path):
+    path = _write_sample(tmp_path / "M1.steps.tracking.csv")
+    counter = {}
+    displacement, force = read_tracking_range(path, horizon=1e6, block_size=1000, counter=counter)
+    expected_displacement, expected_force = _read_reference(path)
+    np.testing.assert_array_equal(displacement, expected_displacement)
+    np.testing.assert_array_equal(force, expected_force)
+    assert counter['bytes_read'] == path.stat().st_size - len(HEADER) - 1
+
+
+def test_read_tracking_range_stops_at_horizon(tmp_path):
+    path = _write_sample(tmp_path / "M1.steps.tracking.csv")
+    counter = {}
+    displacement, force = read_tracking_range(path, horizon=1.0, hysteresis=0.0, confirm_samples=1,
+                                              scan_force_tail=False, block_size=1000, counter=counter)
+    expected_displacement, expected_force = _read_reference(path)
+    count = displacement.shape[0]
+    assert 0 < count < expected_displacement.shape[0]
+    np.testing.assert_array_equal(displacement, expected_displacement[:count])
+    np.testing.assert_array_equal(force, expected_force[:count])
+    assert displacement[-1] - displacement[0] > 1.0
+    assert np.all(displacement[:-1] - displacement[0] <= 1.0)
+    assert counter['bytes_read'] < path.stat().st_size
+
+
+def test_blocks_shorter_than_a_line_and_missing_final_newline(tmp_path):
+    path = _write_sample(tmp_path / "M1.steps.tracking.csv", rows=50)
+    path.write_bytes(path.read_bytes().rstrip(b'\n'))
+    data = np.concatenate(list(iter_tracking_blocks(path, block_size=16)))
+    expected_displacement, expected_force = _read_reference(path)
+    np.testing.assert_array_equal(data[:, 0], expected_displacement)
+    np.testing.assert_array_equal(data[:, 1], expected_force)